@@ -0,0 +1,285 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Analysis Cache
+ * ============================================================================
+ * Content-addressed memoization of pipeline results. The key is a hash of
+ * the canonical (key-sorted) JSON of the normalized site inputs plus a
+ * fingerprint of the live API data, so re-running an unchanged analysis —
+ * or re-opening the same site in a later session — returns the stored
+ * result instantly instead of recomputing.
+ *
+ * Results are reproducible because the Monte Carlo / importance sampling /
+ * Sobol stages are seeded: normalization pins mcSeed to the engine default
+ * whenever the caller leaves it unset, so a cache hit is exactly the result
+ * a fresh run would give.
+ *
+ * Two tiers:
+ *   memory    — bounded LRU (MEMORY_CAPACITY entries), synchronous hits
+ *   IndexedDB — IdbStore 'analysis-cache', bounded to PERSIST_CAPACITY
+ *               entries by a small recency index kept in the same store
+ *
+ * Values are cloned on the way in and out (structuredClone, or a JSON
+ * round-trip where that is missing), so callers may mutate what they
+ * receive without corrupting the cache. Index updates are chained, so
+ * overlapping set() calls never drop entries from the recency index.
+ *
+ * Stage tier (AnalysisCache.stages): a synchronous in-memory LRU of
+ * individual engine stages, keyed by stage id and the content hash of the
+ * stage's dependency values — passed to createAnalysisRun() as its
+ * stageCache. A new site that shares slope parameters with an earlier one
+ * reuses its Monte Carlo, rare-event, Sobol and slip-circle results even
+ * when the full-pipeline key misses. Stage values are shared, not cloned,
+ * like the values of an analysis session.
+ * ============================================================================
+ */
+
+const AnalysisCache = (function () {
+    'use strict';
+
+    const CACHE_VERSION = 7;          // Bump when engine/classifier output changes
+    const STORE = 'analysis-cache';
+    const INDEX_KEY = '__index__';
+    const MEMORY_CAPACITY = 16;
+    const PERSIST_CAPACITY = 64;
+    const STAGE_CAPACITY = 32;
+
+    // Live-data fields that change on every fetch without changing the inputs
+    const VOLATILE_KEYS = { timestamp: true, fetchTime: true, lastFetch: true };
+
+    const memory = new Map();         // key → value, insertion order = recency
+    const stageMemory = new Map();    // stage key → value, insertion order = recency
+    const stats = { hits: 0, persistentHits: 0, misses: 0, stageHits: 0, stageMisses: 0 };
+    let indexChain = Promise.resolve(true);   // Serialises recency-index updates
+
+    // ========================================================================
+    // KEYING
+    // ========================================================================
+
+    /**
+     * Canonical JSON — object keys sorted, undefined/function members and
+     * volatile live-data timestamps dropped, -0 folded to 0
+     */
+    function canonicalize(value) {
+        if (value === null || value === undefined) return 'null';
+        if (typeof value === 'number') {
+            if (!isFinite(value)) return 'null';
+            return JSON.stringify(value === 0 ? 0 : value);
+        }
+        if (typeof value === 'boolean' || typeof value === 'string') return JSON.stringify(value);
+        if (Array.isArray(value) || ArrayBuffer.isView(value)) {
+            return '[' + Array.prototype.map.call(value, canonicalize).join(',') + ']';
+        }
+        if (typeof value === 'object') {
+            const parts = [];
+            Object.keys(value).sort().forEach(function (k) {
+                const v = value[k];
+                if (v === undefined || typeof v === 'function' || VOLATILE_KEYS[k]) return;
+                parts.push(JSON.stringify(k) + ':' + canonicalize(v));
+            });
+            return '{' + parts.join(',') + '}';
+        }
+        return 'null';
+    }
+
+    /**
+     * 64-bit string hash (two independent 32-bit lanes) as 16 hex chars
+     */
+    function hash(str) {
+        let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+        for (let i = 0; i < str.length; i++) {
+            const ch = str.charCodeAt(i);
+            h1 = Math.imul(h1 ^ ch, 2654435761);
+            h2 = Math.imul(h2 ^ ch, 1597334677);
+        }
+        h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+        h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+        return ('00000000' + (h2 >>> 0).toString(16)).slice(-8) +
+            ('00000000' + (h1 >>> 0).toString(16)).slice(-8);
+    }
+
+    /**
+     * Site inputs as the engine sees them: the seed is made explicit so an
+     * unset mcSeed and the default seed address the same entry
+     */
+    function normalizeSiteData(siteData) {
+        const input = Object.assign({}, siteData);
+        if (input.mcSeed === undefined || input.mcSeed === null) {
+            input.mcSeed = typeof GeotechnicalEngine !== 'undefined' ? GeotechnicalEngine.MC_DEFAULT_SEED : null;
+        }
+        return input;
+    }
+
+    /**
+     * Fingerprint of the live API payload (timestamps excluded)
+     */
+    function liveFingerprint(liveData) {
+        return liveData ? hash(canonicalize(liveData)) : 'none';
+    }
+
+    /**
+     * Cache key for a pipeline run
+     *
+     * @param {Object} siteData
+     * @param {Object|null} liveData
+     * @returns {string}
+     */
+    function keyFor(siteData, liveData) {
+        return 'v' + CACHE_VERSION + ':' + hash(canonicalize(normalizeSiteData(siteData))) +
+            ':' + liveFingerprint(liveData);
+    }
+
+    // ========================================================================
+    // TIERS
+    // ========================================================================
+
+    function clone(value) {
+        if (typeof structuredClone === 'function') return structuredClone(value);
+        return value === undefined ? undefined : JSON.parse(JSON.stringify(value));
+    }
+
+    function touch(map, key, value, capacity) {
+        map.delete(key);
+        map.set(key, value);
+        while (map.size > capacity) {
+            map.delete(map.keys().next().value);
+        }
+    }
+
+    function remember(key, value) {
+        touch(memory, key, value, MEMORY_CAPACITY);
+    }
+
+    function persist(key, value) {
+        if (typeof IdbStore === 'undefined') return Promise.resolve(false);
+        return IdbStore.put(STORE, key, value).then(function (ok) {
+            if (!ok) return false;
+            // Read-modify-write of the index, one at a time
+            const update = indexChain.then(function () {
+                return IdbStore.get(STORE, INDEX_KEY);
+            }).then(function (index) {
+                const keys = (index || []).filter(function (k) { return k !== key; });
+                keys.push(key);
+                const evicted = keys.splice(0, Math.max(0, keys.length - PERSIST_CAPACITY));
+                evicted.forEach(function (k) { IdbStore.remove(STORE, k); });
+                return IdbStore.put(STORE, INDEX_KEY, keys);
+            });
+            indexChain = update.catch(function () { return false; });
+            return update;
+        });
+    }
+
+    /**
+     * Look up a stored result
+     *
+     * @param {string} key - From keyFor()
+     * @returns {Promise<Object|undefined>}
+     */
+    function get(key) {
+        if (memory.has(key)) {
+            const value = memory.get(key);
+            remember(key, value);
+            stats.hits++;
+            return Promise.resolve(clone(value));
+        }
+        if (typeof IdbStore === 'undefined') {
+            stats.misses++;
+            return Promise.resolve(undefined);
+        }
+        return IdbStore.get(STORE, key).then(function (value) {
+            if (value === undefined) {
+                stats.misses++;
+                return undefined;
+            }
+            remember(key, value);
+            stats.persistentHits++;
+            return clone(value);
+        });
+    }
+
+    /**
+     * Store a result in both tiers
+     *
+     * @returns {Promise<boolean>} true once persisted to IndexedDB
+     */
+    function set(key, value) {
+        const copy = clone(value);
+        remember(key, copy);
+        return persist(key, copy);
+    }
+
+    /**
+     * Memoize an async or sync computation under a key
+     *
+     * @param {string} key
+     * @param {Function} compute - () => value | Promise<value>
+     * @returns {Promise<Object>}
+     */
+    function memoize(key, compute) {
+        return get(key).then(function (hit) {
+            if (hit !== undefined) return hit;
+            return Promise.resolve(compute()).then(function (value) {
+                set(key, value);
+                return value;
+            });
+        });
+    }
+
+    // ========================================================================
+    // STAGE TIER
+    // ========================================================================
+
+    function stageKey(id, depValues) {
+        return 'v' + CACHE_VERSION + ':' + id + ':' + hash(canonicalize(depValues));
+    }
+
+    /**
+     * Stage-level memo for GeotechnicalEngine.createAnalysisRun()
+     * (options.stageCache) — synchronous, memory only
+     */
+    const stages = {
+        get(id, depValues) {
+            const key = stageKey(id, depValues);
+            if (!stageMemory.has(key)) {
+                stats.stageMisses++;
+                return undefined;
+            }
+            const value = stageMemory.get(key);
+            touch(stageMemory, key, value, STAGE_CAPACITY);
+            stats.stageHits++;
+            return value;
+        },
+        set(id, depValues, value) {
+            touch(stageMemory, stageKey(id, depValues), value, STAGE_CAPACITY);
+        }
+    };
+
+    function clear() {
+        memory.clear();
+        stageMemory.clear();
+        if (typeof IdbStore !== 'undefined') return IdbStore.clear(STORE);
+        return Promise.resolve(true);
+    }
+
+    function getStats() {
+        return Object.assign({ memoryEntries: memory.size, stageEntries: stageMemory.size }, stats);
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        keyFor,
+        canonicalize,
+        hash,
+        get,
+        set,
+        memoize,
+        stages,
+        clear,
+        getStats
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = AnalysisCache;
+}
@@ -0,0 +1,382 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Analysis Pipeline
+ * ============================================================================
+ * Runs the full assessment chain off the UI thread:
+ *   GeotechnicalEngine.runComprehensiveAnalysis()
+ *     → RiskClassifier.classifyRisk()
+ *     → MitigationEngine.recommendMitigation()
+ *     → MitigationEngine.getOutcomeAnalysis()
+ *
+ * The same run() function executes inside js/analysis-worker.js or, when
+ * Web Workers are unavailable (e.g. index.html opened from file://), inline
+ * on the main thread.
+ *
+ * Supersede semantics: request() always serves the newest call. A request
+ * issued while another is in flight rejects the old promise with
+ * { superseded: true }; the worker yields between engine stages and
+ * abandons the old run at the next stage boundary, keeping its session
+ * (and loaded engine) for the new one. The worker is terminated only if a
+ * run exceeds ANALYSIS_TIMEOUT_MS, and is recreated after a crash.
+ *
+ * Inside the worker the Monte Carlo stage is sharded across a nested
+ * WorkerPool of engine workers, so it scales with core count; the engine's
+ * sharded layout makes the result identical to an inline run.
+ *
+ * Within one worker (or page, when inline) run() keeps an engine analysis
+ * session, so successive runs re-execute only the stages whose inputs
+ * changed — editing the house setback re-runs the foundation check and
+ * the classifier, not the Monte Carlo.
+ *
+ * Memoization: request() first consults AnalysisCache (when loaded) under a
+ * content hash of the site inputs and live data; a hit resolves without
+ * touching the worker, a miss stores the fresh result for next time.
+ * Inside the run, the expensive engine stages are memoized individually
+ * through AnalysisCache.stages, keyed by their dependency values.
+ *
+ * Worker message protocol:
+ *   main → worker  { type: 'analyze', id, siteData, liveData } | { type: 'cancel', id }
+ *   worker → main  { type: 'ready' } | { type: 'result', id, result } | { type: 'error', id, error }
+ * ============================================================================
+ */
+
+const AnalysisPipeline = (function () {
+    'use strict';
+
+    const WORKER_SCRIPT = 'js/analysis-worker.js';
+    const ANALYSIS_TIMEOUT_MS = 60000;   // Runaway run → terminate the worker
+    const OFFLOAD_STAGES = ['monteCarlo']; // Engine stages handed to a WorkerPool
+
+    let worker = null;
+    let workerReady = false;  // Script loaded — later errors are crashes, not load failures
+    let workerFailed = false;
+    let current = null;       // { id, resolve, reject }
+    let nextId = 1;
+    let session = null;       // Engine stage values from the previous run()
+
+    // ========================================================================
+    // PIPELINE (pure — runs in worker or inline)
+    // ========================================================================
+
+    /**
+     * Run the complete analysis pipeline
+     *
+     * @param {Object} siteData - Output of DharaApp.collectSiteData()
+     * @param {Object|null} liveData - Output of ApiService.fetchAllLiveData()
+     * @returns {Object} { siteData, analysisResults, riskAssessment, recommendations, outcome }
+     */
+    function run(siteData, liveData) {
+        if (!session) session = GeotechnicalEngine.createAnalysisSession();
+        const analysis = GeotechnicalEngine.createAnalysisRun(engineInput(siteData, liveData), session,
+            { stageCache: stageCache() });
+        return completeRun(siteData, liveData, analysis.finish());
+    }
+
+    /**
+     * run(), yielding to the event loop after each engine stage
+     *
+     * isCurrent() is checked at every stage boundary; once it returns
+     * false the run is abandoned (resolves null) and the session keeps the
+     * last completed analysis.
+     *
+     * With a WorkerPool, the Monte Carlo stage is sharded across its
+     * workers (same result as inline); if the pool fails the stage runs
+     * inline instead.
+     *
+     * @param {Object} siteData
+     * @param {Object|null} liveData
+     * @param {Function} isCurrent - () → boolean
+     * @param {Object} [pool] - WorkerPool.create() instance
+     * @returns {Promise<Object|null>}
+     */
+    function runAsync(siteData, liveData, isCurrent, pool) {
+        if (!session) session = GeotechnicalEngine.createAnalysisSession();
+        const analysis = GeotechnicalEngine.createAnalysisRun(engineInput(siteData, liveData), session,
+            { offload: pool ? OFFLOAD_STAGES : [], stageCache: stageCache() });
+
+        return new Promise(function (resolve, reject) {
+            function next(value) {
+                if (!isCurrent()) {
+                    resolve(null);
+                    return;
+                }
+                try {
+                    if (analysis.step(value)) {
+                        resolve(completeRun(siteData, liveData, analysis.finish()));
+                        return;
+                    }
+                } catch (err) {
+                    reject(err);
+                    return;
+                }
+                const pending = analysis.pending;
+                if (pending) {
+                    pool[pending.job.fn].apply(null, pending.job.args).then(next, function () {
+                        next(); // Pool unavailable — the stage runs inline
+                    });
+                    return;
+                }
+                yieldTask(next);
+            }
+            next();
+        });
+    }
+
+    // Stage-level memo (AnalysisCache.stages) when the cache is loaded
+    function stageCache() {
+        return typeof AnalysisCache !== 'undefined' ? AnalysisCache.stages : null;
+    }
+
+    // Queue a macrotask without setTimeout's nested-call clamping, so
+    // pending messages are handled between stages at negligible cost
+    let yieldChannel = null;
+    const yieldQueue = [];
+    function yieldTask(fn) {
+        if (typeof MessageChannel === 'undefined') {
+            setTimeout(fn, 0);
+            return;
+        }
+        if (!yieldChannel) {
+            yieldChannel = new MessageChannel();
+            yieldChannel.port1.onmessage = function () { yieldQueue.shift()(); };
+        }
+        yieldQueue.push(fn);
+        yieldChannel.port2.postMessage(null);
+    }
+
+    // Site data with the live API data injected
+    function engineInput(siteData, liveData) {
+        const input = Object.assign({}, siteData);
+
+        // Inject live data into site data
+        if (liveData) {
+            input.liveWeather = liveData.weather || null;
+            input.liveHistorical = liveData.historical || null;
+            input.liveElevation = liveData.elevation || null;
+            input.liveEarthquakes = liveData.earthquakes || null;
+            input.liveSoil = liveData.soil || null;
+            input.liveGeocode = liveData.geocode || null;
+            input.locationName = liveData.geocode?.shortName || '';
+            input.elevation = liveData.elevation?.elevation || null;
+            input.demSlope = liveData.elevation?.estimatedSlope || null;
+            input.aspect = liveData.elevation?.aspectDirection || null;
+        }
+        return input;
+    }
+
+    // Classifier, mitigation and outcome over the engine results
+    function completeRun(siteData, liveData, analysisResults) {
+        // 1. Comprehensive geotechnical analysis ran incrementally: only
+        //    stages whose inputs changed since the previous run re-executed
+
+        // Inject live data into analysis results for downstream use
+        if (liveData) {
+            analysisResults.liveWeather = liveData.weather;
+            analysisResults.liveHistorical = liveData.historical;
+            analysisResults.liveEarthquakes = liveData.earthquakes;
+            analysisResults.liveSoil = liveData.soil;
+            analysisResults.liveElevation = liveData.elevation;
+            analysisResults.elevation = liveData.elevation?.elevation || null;
+            analysisResults.locationName = liveData.geocode?.shortName || '';
+
+            // Pass weather severity for risk classification (scored as weather component at 5% weight)
+            if (liveData.weather?.derived) {
+                analysisResults.weatherSeverity = liveData.weather.derived.weatherSeverityScore;
+                // Note: weather severity is scored as a dedicated 5% weighted component
+                // in RiskClassifier — do NOT add to riskModifier to avoid double-counting
+            }
+            // Pass earthquake data for risk classification (scored as seismic component)
+            if (liveData.earthquakes) {
+                analysisResults.seismicRisk = liveData.earthquakes.seismicRisk;
+                // Note: seismic risk is scored as a dedicated 10% weighted component
+                // in RiskClassifier — do NOT add to riskModifier to avoid double-counting
+            }
+        }
+
+        // 2. Classify risk (with augmented risk modifier)
+        const riskAssessment = RiskClassifier.classifyRisk(analysisResults);
+
+        // 3. Generate mitigation recommendations
+        const recommendations = MitigationEngine.recommendMitigation(riskAssessment, analysisResults);
+
+        // 4. Outcome analysis
+        const outcome = MitigationEngine.getOutcomeAnalysis(analysisResults.compositeFoS, recommendations);
+
+        return {
+            siteData: siteData,
+            analysisResults: analysisResults,
+            riskAssessment: riskAssessment,
+            recommendations: recommendations,
+            outcome: outcome
+        };
+    }
+
+    // ========================================================================
+    // MAIN-THREAD CLIENT
+    // ========================================================================
+
+    function supersededError() {
+        const err = new Error('Analysis superseded by a newer request');
+        err.superseded = true;
+        return err;
+    }
+
+    function getWorker() {
+        if (worker || workerFailed || typeof Worker === 'undefined') return worker;
+        try {
+            worker = new Worker(WORKER_SCRIPT);
+        } catch (e) {
+            workerFailed = true;
+            return null;
+        }
+        workerReady = false;
+        worker.onmessage = function (e) {
+            const msg = e.data;
+            if (msg.type === 'ready') {
+                workerReady = true;
+                return;
+            }
+            if (!current || msg.id !== current.id) return; // stale reply
+            const req = current;
+            current = null;
+            clearTimeout(req.timer);
+            if (msg.type === 'result') complete(req, msg.result);
+            else req.reject(new Error(msg.error));
+        };
+        worker.onerror = function (e) {
+            e.preventDefault();
+            const loaded = workerReady;
+            discardWorker();
+            if (!current) return;
+            const req = current;
+            clearTimeout(req.timer);
+            if (loaded) {
+                // Runtime crash — fail this run; the next request gets a fresh worker
+                current = null;
+                req.reject(new Error(e.message || 'Analysis worker crashed'));
+            } else {
+                // Script failed to load — fall back to inline execution
+                workerFailed = true;
+                runInline(req);
+            }
+        };
+        return worker;
+    }
+
+    function discardWorker() {
+        if (!worker) return;
+        worker.terminate();
+        worker = null;
+        workerReady = false;
+    }
+
+    function runInline(req) {
+        // Yield once so the loading overlay can paint before the blocking run
+        setTimeout(function () {
+            if (current !== req) return; // cancelled or superseded meanwhile
+            current = null;
+            let result;
+            try {
+                result = run(req.siteData, req.liveData);
+            } catch (err) {
+                req.reject(err);
+                return;
+            }
+            complete(req, result);
+        }, 30);
+    }
+
+    function complete(req, result) {
+        if (req.cacheKey) AnalysisCache.set(req.cacheKey, result);
+        req.resolve(result);
+    }
+
+    function dispatch(req) {
+        const w = getWorker();
+        if (w) {
+            w.postMessage({ type: 'analyze', id: req.id, siteData: req.siteData, liveData: req.liveData });
+            req.timer = setTimeout(function () {
+                if (current !== req) return;
+                // Stuck in one stage — only now is the worker (and its session) dropped
+                current = null;
+                discardWorker();
+                req.reject(new Error('Analysis timed out'));
+            }, ANALYSIS_TIMEOUT_MS);
+        } else {
+            runInline(req);
+        }
+    }
+
+    /**
+     * Abort the in-flight request, if any
+     * The worker abandons the run at its next stage boundary and stays
+     * alive, so the following request reuses its incremental session.
+     */
+    function cancel() {
+        if (!current) return;
+        const req = current;
+        current = null;
+        clearTimeout(req.timer);
+        if (worker) worker.postMessage({ type: 'cancel', id: req.id });
+        req.reject(supersededError());
+    }
+
+    /**
+     * Request an analysis; newer requests supersede older ones
+     *
+     * @param {Object} siteData
+     * @param {Object|null} liveData
+     * @param {Object} [options]
+     * @param {boolean} [options.useCache=true] - Serve/store via AnalysisCache
+     * @returns {Promise<Object>} Resolves with the run() result
+     */
+    function request(siteData, liveData, options = {}) {
+        const { useCache = true } = options;
+        cancel();
+        return new Promise(function (resolve, reject) {
+            const req = {
+                id: nextId++,
+                siteData: siteData,
+                liveData: liveData || null,
+                cacheKey: null,
+                timer: null,
+                resolve: resolve,
+                reject: reject
+            };
+            current = req;
+            if (!useCache || typeof AnalysisCache === 'undefined') {
+                dispatch(req);
+                return;
+            }
+            req.cacheKey = AnalysisCache.keyFor(siteData, req.liveData);
+            AnalysisCache.get(req.cacheKey).then(function (hit) {
+                if (current !== req) return; // superseded while looking up
+                if (hit === undefined) {
+                    dispatch(req);
+                    return;
+                }
+                current = null;
+                req.resolve(hit);
+            });
+        });
+    }
+
+    function isBusy() {
+        return current !== null;
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        run,
+        runAsync,
+        request,
+        cancel,
+        isBusy
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = AnalysisPipeline;
+}
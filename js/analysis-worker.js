@@ -0,0 +1,51 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Analysis Worker
+ * ============================================================================
+ * Dedicated worker that runs AnalysisPipeline.run() so the UI thread stays
+ * responsive. See js/analysis-pipeline.js for the message protocol. Runs
+ * yield between engine stages; a newer 'analyze' or a 'cancel' makes the
+ * in-flight run stop at its next stage boundary, and the worker (with its
+ * incremental session) stays alive for the next request. Where nested
+ * workers are available the Monte Carlo stage runs on a WorkerPool of
+ * engine workers (URLs resolve relative to this script).
+ * ============================================================================
+ */
+
+importScripts(
+    'geotechnical-engine.js',
+    'worker-pool.js',
+    'risk-classifier.js',
+    'mitigation-engine.js',
+    'analysis-cache.js',
+    'analysis-pipeline.js'
+);
+
+// Full-precision results; the UI formats them for display
+GeotechnicalEngine.setOutputMode('raw');
+
+// Id of the request the main thread is waiting on; older runs abandon
+let currentId = null;
+
+// Nested engine workers for the Monte Carlo stage (none → inline)
+const pool = WorkerPool.isSupported() ? WorkerPool.create({ scriptUrl: 'engine-worker.js' }) : null;
+
+self.onmessage = function (e) {
+    const msg = e.data;
+    if (msg.type === 'cancel') {
+        if (currentId === msg.id) currentId = null;
+        return;
+    }
+    if (msg.type !== 'analyze') return;
+    const id = msg.id;
+    currentId = id;
+    AnalysisPipeline.runAsync(msg.siteData, msg.liveData, function () {
+        return currentId === id;
+    }, pool).then(function (result) {
+        if (result) self.postMessage({ type: 'result', id: id, result: result });
+    }, function (err) {
+        if (currentId === id) self.postMessage({ type: 'error', id: id, error: err.message });
+    });
+};
+
+self.postMessage({ type: 'ready' });
@@ -474,6 +474,8 @@ const DharaApp = (function () {
                 soilSelect.value = data.soil.classification.recommended;
             }
         }
+
+        updateWhatIfFoS();
     }
 
     // ========================================================================
@@ -523,6 +525,8 @@ const DharaApp = (function () {
     // ========================================================================
     // COLLECT SITE DATA
     // ========================================================================
+    // Reads the form only — state.siteData is set when an analysis of
+    // these inputs completes, so exports never pair edits with old results
     function collectSiteData() {
         var data = {
             location: {
@@ -543,10 +547,28 @@ const DharaApp = (function () {
             construction: document.getElementById('inp-construction')?.checked || false
         };
 
-        state.siteData = data;
         return data;
     }
 
+    // ========================================================================
+    // WHAT-IF PREVIEW (surrogate FoS while inputs change)
+    // ========================================================================
+    function updateWhatIfFoS() {
+        var el = document.getElementById('whatif-fos');
+        if (!el || typeof FosSurrogate === 'undefined') return;
+
+        var site = FosSurrogate.fromSiteData(collectSiteData(), state.liveData?.soil || null);
+        var est = FosSurrogate.predict(site.soil, site.inputs);
+        var level = est.fos < 1.0 ? 'fail' : est.fos < 1.5 ? 'marginal' : 'safe';
+
+        el.className = 'whatif-fos whatif-' + level;
+        el.textContent = 'What-if FoS ' + est.fos.toFixed(2) +
+            (est.exact ? ' (exact)' : ' \u00B1' + Math.max(0.01, est.error).toFixed(2));
+        el.title = est.exact
+            ? 'Composite FoS from the full engine (surrogate outside tolerance)'
+            : 'Composite FoS from the polynomial-chaos surrogate; run the full analysis for live-data effects';
+    }
+
     // ========================================================================
     // RUN ANALYSIS
     // ========================================================================
@@ -575,84 +597,34 @@ const DharaApp = (function () {
     function performAnalysis() {
         showLoading('Running multi-method geotechnical analysis...');
 
-        setTimeout(function () {
-            try {
-                var siteData = collectSiteData();
-
-                // Inject live data into site data
-                if (state.liveData) {
-                    siteData.liveWeather = state.liveData.weather || null;
-                    siteData.liveHistorical = state.liveData.historical || null;
-                    siteData.liveElevation = state.liveData.elevation || null;
-                    siteData.liveEarthquakes = state.liveData.earthquakes || null;
-                    siteData.liveSoil = state.liveData.soil || null;
-                    siteData.liveGeocode = state.liveData.geocode || null;
-                    siteData.locationName = state.liveData.geocode?.shortName || '';
-                    siteData.elevation = state.liveData.elevation?.elevation || null;
-                    siteData.demSlope = state.liveData.elevation?.estimatedSlope || null;
-                    siteData.aspect = state.liveData.elevation?.aspectDirection || null;
-                }
+        var siteData = collectSiteData();
 
-                // 1. Run comprehensive geotechnical analysis
-                state.analysisResults = GeotechnicalEngine.runComprehensiveAnalysis(siteData);
-
-                // Inject live data into analysis results for downstream use
-                if (state.liveData) {
-                    state.analysisResults.liveWeather = state.liveData.weather;
-                    state.analysisResults.liveHistorical = state.liveData.historical;
-                    state.analysisResults.liveEarthquakes = state.liveData.earthquakes;
-                    state.analysisResults.liveSoil = state.liveData.soil;
-                    state.analysisResults.liveElevation = state.liveData.elevation;
-                    state.analysisResults.elevation = state.liveData.elevation?.elevation || null;
-                    state.analysisResults.locationName = state.liveData.geocode?.shortName || '';
-
-                    // Pass weather severity for risk classification (scored as weather component at 5% weight)
-                    if (state.liveData.weather?.derived) {
-                        state.analysisResults.weatherSeverity = state.liveData.weather.derived.weatherSeverityScore;
-                        // Note: weather severity is scored as a dedicated 5% weighted component
-                        // in RiskClassifier — do NOT add to riskModifier to avoid double-counting
-                    }
-                    // Pass earthquake data for risk classification (scored as seismic component)
-                    if (state.liveData.earthquakes) {
-                        state.analysisResults.seismicRisk = state.liveData.earthquakes.seismicRisk;
-                        // Note: seismic risk is scored as a dedicated 10% weighted component
-                        // in RiskClassifier — do NOT add to riskModifier to avoid double-counting
-                    }
-                }
+        // Runs in a dedicated worker; a newer request supersedes this one
+        AnalysisPipeline.request(siteData, state.liveData).then(function (out) {
+            state.siteData = siteData;
+            state.analysisResults = out.analysisResults;
+            state.riskAssessment = out.riskAssessment;
+            state.recommendations = out.recommendations;
+            state.outcome = out.outcome;
 
-                // 2. Classify risk (with augmented risk modifier)
-                state.riskAssessment = RiskClassifier.classifyRisk(state.analysisResults);
-
-                // 3. Generate mitigation recommendations
-                state.recommendations = MitigationEngine.recommendMitigation(
-                    state.riskAssessment, state.analysisResults
-                );
-
-                // 4. Outcome analysis
-                state.outcome = MitigationEngine.getOutcomeAnalysis(
-                    state.analysisResults.compositeFoS,
-                    state.recommendations
-                );
-
-                state.analysisComplete = true;
-                saveStateToStorage();
-                saveToHistory();
-
-                // Navigate to results
-                navigateTo('page-results');
-                renderResults();
-                renderLiveDataPanels();
-
-                showToast('Analysis complete — ' + (state.riskAssessment?.classification?.level || '') + ' risk detected.', 
-                    state.riskAssessment?.classification?.level === 'CRITICAL' || state.riskAssessment?.classification?.level === 'HIGH' ? 'error' : 'success', 6000);
-
-            } catch (err) {
-                console.error('Analysis error:', err);
-                showToast('Analysis error: ' + err.message, 'error', 8000);
-            } finally {
-                hideLoading();
-            }
-        }, 300);
+            state.analysisComplete = true;
+            saveStateToStorage();
+            saveToHistory();
+
+            // Navigate to results
+            navigateTo('page-results');
+            renderResults();
+            renderLiveDataPanels();
+
+            showToast('Analysis complete — ' + (state.riskAssessment?.classification?.level || '') + ' risk detected.', 
+                state.riskAssessment?.classification?.level === 'CRITICAL' || state.riskAssessment?.classification?.level === 'HIGH' ? 'error' : 'success', 6000);
+            hideLoading();
+        }).catch(function (err) {
+            if (err.superseded) return; // newer analysis owns the loading overlay
+            console.error('Analysis error:', err);
+            showToast('Analysis error: ' + err.message, 'error', 8000);
+            hideLoading();
+        });
     }
 
     // ========================================================================
@@ -761,7 +733,7 @@ const DharaApp = (function () {
         DharaCharts.renderRiskGauge('chart-risk-gauge', ra.compositeScore, cls);
         DharaCharts.renderFoSComparison('chart-fos', ar);
         DharaCharts.renderMonteCarloHistogram('chart-mc', ar.monteCarlo);
-        DharaCharts.renderSensitivityTornado('chart-sensitivity', ar.sensitivity);
+        DharaCharts.renderSensitivityTornado('chart-sensitivity', ar.sensitivity, ar.globalSensitivity);
         DharaCharts.renderRiskRadar('chart-radar', ra);
         DharaCharts.renderIDCurve('chart-id', ar.rainfallThreshold?.current_intensity, ar.rainfallThreshold?.current_duration);
         DharaCharts.renderInfiltrationTimeline('chart-infiltration', ar.infiltration);
@@ -779,8 +751,9 @@ const DharaApp = (function () {
             fosTable.innerHTML =
                 '<tr><td>Infinite Slope</td><td>' + (ar.infiniteSlope?.fos?.toFixed(4)) + '</td><td>' + ar.infiniteSlope?.method + '</td></tr>' +
                 '<tr><td>Bishop Simplified</td><td>' + (ar.bishop?.fos?.toFixed(4)) + ' ' + (ar.bishop?.converged ? '(Converged)' : '(Not converged)') + '</td><td>' + ar.bishop?.method + '</td></tr>' +
+                (ar.rigorous ? '<tr><td>' + ar.rigorous.method + '</td><td>' + ar.rigorous.fos.toFixed(4) + ' (λ=' + ar.rigorous.lambda.toFixed(3) + ')</td><td>Force + moment equilibrium</td></tr>' : '') +
                 '<tr><td>Janbu Simplified</td><td>' + (ar.janbu?.fos?.toFixed(4)) + '</td><td>' + ar.janbu?.method + '</td></tr>' +
-                '<tr style="background:#E3F2FD;font-weight:600"><td>Composite</td><td>' + (ar.compositeFoS?.toFixed(4)) + '</td><td>40% IS + 35% Bishop + 25% Janbu</td></tr>';
+                '<tr style="background:#E3F2FD;font-weight:600"><td>Composite</td><td>' + (ar.compositeFoS?.toFixed(4)) + '</td><td>40% IS + 35% ' + (ar.rigorous ? ar.rigorous.method : 'Bishop') + ' + 25% Janbu</td></tr>';
         }
 
         // Foundation table
@@ -788,10 +761,10 @@ const DharaApp = (function () {
         if (foundTable) {
             var f = ar.foundation;
             foundTable.innerHTML =
-                '<tr><td>Required Setback</td><td>' + f.effectiveSetback + ' m</td></tr>' +
+                '<tr><td>Required Setback</td><td>' + fmt(f.effectiveSetback, 1) + ' m</td></tr>' +
                 '<tr><td>Actual Setback</td><td>' + f.actualSetback + ' m</td></tr>' +
                 '<tr><td>Status</td><td><strong>' + (f.isSetbackSafe ? 'SAFE' : 'UNSAFE') + '</strong></td></tr>' +
-                '<tr><td>Bearing Reduction</td><td>' + f.bearingCapacityReduction + '%</td></tr>';
+                '<tr><td>Bearing Reduction</td><td>' + fmt(f.bearingCapacityReduction, 1) + '%</td></tr>';
         }
 
         // Component breakdown
@@ -959,8 +932,8 @@ const DharaApp = (function () {
                 var o = state.outcome;
                 outcomeEl.innerHTML =
                     '<div class="grid-2">' +
-                    '<div class="metric-card risk-high"><div class="metric-label">BEFORE</div><div class="metric-value">' + o.before.fos + '</div><div class="metric-delta">Prob: ' + o.before.failureProbability + ' | ' + o.before.riskLabel + '</div></div>' +
-                    '<div class="metric-card risk-low"><div class="metric-label">AFTER</div><div class="metric-value">' + o.after.fos + '</div><div class="metric-delta">Prob: ' + o.after.failureProbability + ' | ' + o.after.riskLabel + '</div></div>' +
+                    '<div class="metric-card risk-high"><div class="metric-label">BEFORE</div><div class="metric-value">' + o.before.fos + '</div><div class="metric-delta">Prob: ' + fmt(o.before.failureProbability, 3) + ' | ' + o.before.riskLabel + '</div></div>' +
+                    '<div class="metric-card risk-low"><div class="metric-label">AFTER</div><div class="metric-value">' + o.after.fos + '</div><div class="metric-delta">Prob: ' + fmt(o.after.failureProbability, 3) + ' | ' + o.after.riskLabel + '</div></div>' +
                     '</div>' +
                     '<div class="alert alert-success" style="margin-top:14px">' +
                     '<div>Risk Reduction: <strong>' + o.improvement.riskReductionPct + '%</strong> | FoS Improvement: +' + o.improvement.fosIncrease + ' (Range: ' + o.improvement.fosIncreaseRange + ')<br><em style="font-size:0.78rem">' + o.note + '</em></div>' +
@@ -1115,7 +1088,7 @@ const DharaApp = (function () {
             '<tr><td>Soil Type</td><td>' + (ar.soilProperties?.name || '--') + '</td><td>' + (ar.soilProperties?.classification || '--') + '</td></tr>' +
             '<tr><td>Vegetation</td><td>' + (ar.vegetation?.vegetationPct || '--') + '% — ' + (ar.vegetation?.category || '') + '</td><td>' + (ar.vegetation?.deforestationRisk || '') + ' risk</td></tr>' +
             '<tr><td>Rainfall Status</td><td>' + (ar.rainfallThreshold?.status || '--') + '</td><td>Level ' + (ar.rainfallThreshold?.level || '--') + '</td></tr>' +
-            '<tr><td>Foundation</td><td>Setback ' + (ar.foundation?.actualSetback || '--') + 'm / ' + (ar.foundation?.effectiveSetback || '--') + 'm</td><td>' + (ar.foundation?.isSetbackSafe ? '✓ Safe' : '⚠ Unsafe') + '</td></tr>' +
+            '<tr><td>Foundation</td><td>Setback ' + (ar.foundation?.actualSetback || '--') + 'm / ' + (fmt(ar.foundation?.effectiveSetback, 1) || '--') + 'm</td><td>' + (ar.foundation?.isSetbackSafe ? '✓ Safe' : '⚠ Unsafe') + '</td></tr>' +
             (ar.elevation ? '<tr><td>Elevation</td><td>' + ar.elevation + ' m (DEM)</td><td>--</td></tr>' : '') +
             '</tbody></table></div>' +
 
@@ -1162,6 +1135,11 @@ const DharaApp = (function () {
         }
     }
 
+    // Display rounding for engine numbers (the pipeline returns full precision)
+    function fmt(value, digits) {
+        return typeof value === 'number' && isFinite(value) ? parseFloat(value.toFixed(digits)) : value;
+    }
+
     function fosClass(fos) {
         if (fos >= 1.5) return 'risk-low';
         if (fos >= 1.2) return 'risk-medium';
@@ -1314,6 +1292,9 @@ const DharaApp = (function () {
     }
 
     function init() {
+        // Engine returns full-precision numbers; this layer does the rounding
+        GeotechnicalEngine.setOutputMode('raw');
+
         // Restore saved state and history
         restoreStateFromStorage();
         loadHistory();
@@ -1342,6 +1323,21 @@ const DharaApp = (function () {
             }
         });
 
+        // What-if FoS preview follows the inputs that drive the composite FoS
+        ['inp-slope', 'inp-veg', 'inp-saturation', 'inp-soil', 'inp-drainage', 'inp-cracks'].forEach(function (id) {
+            var inp = document.getElementById(id);
+            if (inp) inp.addEventListener(inp.tagName === 'SELECT' || inp.type === 'checkbox' ? 'change' : 'input', updateWhatIfFoS);
+        });
+        updateWhatIfFoS();
+
+        // Restore per-soil FoS lookup tables from IndexedDB (built on a miss)
+        if (typeof FosTables !== 'undefined') {
+            setTimeout(function () {
+                var soils = GeotechnicalEngine.SOIL_DATABASE;
+                FosTables.preload(Object.keys(soils).map(function (k) { return soils[k]; }));
+            }, 1500);
+        }
+
         // Fetch Live Data button
         var fetchBtn = document.getElementById('btn-fetch-live');
         if (fetchBtn) {
@@ -19,6 +19,11 @@ const DharaCharts = (function () {
         }
     }
 
+    // Display rounding for engine numbers (results may be full precision)
+    function fmt(value, digits) {
+        return typeof value === 'number' && isFinite(value) ? parseFloat(value.toFixed(digits)) : value;
+    }
+
     // ========================================================================
     // 1. FoS COMPARISON BAR CHART
     // ========================================================================
@@ -32,10 +37,10 @@ const DharaCharts = (function () {
             datasets: [{
                 label: 'Factor of Safety',
                 data: [
-                    analysisResults.infiniteSlope?.fos || 0,
-                    analysisResults.bishop?.fos || 0,
-                    analysisResults.janbu?.fos || 0,
-                    analysisResults.compositeFoS || 0
+                    fmt(analysisResults.infiniteSlope?.fos || 0, 4),
+                    fmt(analysisResults.bishop?.fos || 0, 4),
+                    fmt(analysisResults.janbu?.fos || 0, 4),
+                    fmt(analysisResults.compositeFoS || 0, 4)
                 ],
                 backgroundColor: [
                     'rgba(21, 101, 192, 0.8)',
@@ -150,7 +155,7 @@ const DharaCharts = (function () {
                     legend: { display: false },
                     title: {
                         display: true,
-                        text: `Monte Carlo Distribution (${mcResults.iterations} iterations) — Pf = ${mcResults.probability_of_failure}%`,
+                        text: `Monte Carlo Distribution (${mcResults.iterations} iterations) — Pf = ${fmt(mcResults.probability_of_failure, 2)}%`,
                         font: { size: 13, weight: '600' }
                     }
                 },
@@ -175,14 +180,19 @@ const DharaCharts = (function () {
     // ========================================================================
     // 3. SENSITIVITY TORNADO CHART
     // ========================================================================
-    function renderSensitivityTornado(canvasId, sensResults) {
+    function renderSensitivityTornado(canvasId, sensResults, globalSens) {
         destroyChart(canvasId);
         const ctx = document.getElementById(canvasId);
-        if (!ctx || !sensResults?.results) return;
+        if (!ctx) return;
+        if (globalSens?.results) {
+            renderSobolIndices(ctx, canvasId, globalSens);
+            return;
+        }
+        if (!sensResults?.results) return;
 
         const sorted = sensResults.sortedKeys;
         const labels = sorted.map(k => sensResults.results[k].label);
-        const swings = sorted.map(k => sensResults.results[k].swing);
+        const swings = sorted.map(k => fmt(sensResults.results[k].swing, 4));
         const maxSwing = Math.max(...swings);
 
         chartInstances[canvasId] = new Chart(ctx, {
@@ -225,6 +235,58 @@ const DharaCharts = (function () {
         });
     }
 
+    // Sobol first-order / total-effect indices (replaces the ±10% swings)
+    function renderSobolIndices(ctx, canvasId, globalSens) {
+        const sorted = globalSens.sortedKeys;
+        const labels = sorted.map(k => globalSens.results[k].label +
+            (globalSens.results[k].screened ? ' (screened)' : ''));
+
+        chartInstances[canvasId] = new Chart(ctx, {
+            type: 'bar',
+            data: {
+                labels: labels,
+                datasets: [
+                    {
+                        label: 'Total effect (Sₜ)',
+                        data: sorted.map(k => fmt(globalSens.results[k].total, 4)),
+                        backgroundColor: 'rgba(211, 47, 47, 0.8)',
+                        borderRadius: 4
+                    },
+                    {
+                        label: 'First order (Sᵢ)',
+                        data: sorted.map(k => fmt(globalSens.results[k].first, 4)),
+                        backgroundColor: 'rgba(21, 101, 192, 0.8)',
+                        borderRadius: 4
+                    }
+                ]
+            },
+            options: {
+                indexAxis: 'y',
+                responsive: true,
+                maintainAspectRatio: false,
+                plugins: {
+                    legend: { position: 'bottom' },
+                    title: {
+                        display: true,
+                        text: `Global Sensitivity (Sobol) — Most Sensitive: ${globalSens.mostSensitiveLabel}`,
+                        font: { size: 13, weight: '600' }
+                    }
+                },
+                scales: {
+                    x: {
+                        min: 0,
+                        max: 1,
+                        title: { display: true, text: 'Share of FoS variance' },
+                        grid: { color: 'rgba(0,0,0,0.06)' }
+                    },
+                    y: {
+                        grid: { display: false }
+                    }
+                }
+            }
+        });
+    }
+
     // ========================================================================
     // 4. RAINFALL I-D THRESHOLD CURVE
     // ========================================================================
@@ -828,23 +890,31 @@ const DharaCharts = (function () {
         const ctx = document.getElementById(canvasId);
         if (!ctx || !siteData || !soilProps) return;
 
-        const angles = [];
-        const fosValues = [];
         const currentAngle = siteData.slopeAngle || 35;
 
-        // Calculate FoS for slope angles 5° to 75°
-        for (let a = 5; a <= 75; a += 2) {
-            angles.push(a);
-            const result = GeotechnicalEngine.infiniteSlope({
+        // Calculate FoS for slope angles 5° to 75° in one batch call —
+        // read from the precomputed lookup table when it is already resident
+        const nAngles = 36;
+        const angleGrid = new Float64Array(nAngles);
+        for (let i = 0; i < nAngles; i++) angleGrid[i] = 5 + 2 * i;
+        const sweep = new Float64Array(nAngles);
+        if (typeof FosTables !== 'undefined' && soilProps.cohesion?.mean && FosTables.isReady(soilProps)) {
+            FosTables.lookupBatch(soilProps, 'infinite', {
+                slopeAngle: angleGrid,
+                saturation: siteData.saturation || 50
+            }, sweep);
+        } else {
+            GeotechnicalEngine.infiniteSlopeBatch({
                 cohesion: soilProps.cohesion?.mean || 5,
                 frictionAngle: soilProps.friction?.mean || 30,
-                slopeAngle: a,
+                slopeAngle: angleGrid,
                 unitWeight: soilProps.unitWeight?.mean || 19,
                 depth: GeotechnicalEngine.DEFAULT_DEPTH,
                 saturation: siteData.saturation || 50
-            });
-            fosValues.push(result.fos);
+            }, { fos: sweep });
         }
+        const angles = Array.from(angleGrid);
+        const fosValues = Array.from(sweep, f => Math.round(f * 1e4) / 1e4);
 
         // Find current FoS on curve
         const currentFoSResult = GeotechnicalEngine.infiniteSlope({
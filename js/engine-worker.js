@@ -0,0 +1,65 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Engine Worker
+ * ============================================================================
+ * Dedicated Web Worker that hosts a copy of GeotechnicalEngine so that
+ * WorkerPool can shard heavy numeric work (Monte Carlo blocks, DEM tiles,
+ * sensitivity runs) across CPU cores.
+ *
+ * Message protocol (main → worker):
+ *   { id, task: 'mcPartial', payload: { params, iterations, options } }
+ *   { id, task: 'rasterTile', payload: { tile, params } }
+ *   { id, task: 'call',      payload: { fn, args } }
+ *
+ * Reply (worker → main):
+ *   { id, ok: true,  result }
+ *   { id, ok: false, error }
+ * ============================================================================
+ */
+
+importScripts('geotechnical-engine.js');
+
+(function () {
+    'use strict';
+
+    const tasks = {
+        // One Monte Carlo shard — returns the raw accumulator for merging
+        mcPartial(payload) {
+            const run = GeotechnicalEngine.monteCarloPartial(
+                payload.params, payload.iterations, payload.options
+            );
+            return { result: run, transfer: [run.accumulator.fineHist.buffer] };
+        },
+
+        // One DEM row band — result rasters are transferred back
+        rasterTile(payload) {
+            const out = GeotechnicalEngine.rasterStabilityTile(payload.tile, payload.params);
+            return {
+                result: out,
+                transfer: [out.slope.buffer, out.twi.buffer, out.wetness.buffer,
+                    out.fos.buffer, out.si.buffer, out.siClass.buffer]
+            };
+        },
+
+        // Any exported engine function, e.g. sensitivityAnalysis
+        call(payload) {
+            const fn = GeotechnicalEngine[payload.fn];
+            if (typeof fn !== 'function') {
+                throw new Error('Unknown engine function: ' + payload.fn);
+            }
+            return { result: fn.apply(null, payload.args || []), transfer: [] };
+        }
+    };
+
+    self.onmessage = function (e) {
+        const { id, task, payload } = e.data;
+        try {
+            const handler = tasks[task];
+            if (!handler) throw new Error('Unknown task: ' + task);
+            const out = handler(payload);
+            self.postMessage({ id: id, ok: true, result: out.result }, out.transfer);
+        } catch (err) {
+            self.postMessage({ id: id, ok: false, error: err.message });
+        }
+    };
+})();
@@ -0,0 +1,352 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — FoS Surrogate Model
+ * ============================================================================
+ * Sparse polynomial-chaos surrogate of the composite FoS
+ * (GeotechnicalEngine.compositeFoS) for instant what-if evaluation.
+ *
+ * One model per soil profile (c', φ', γ) and crack flag, over:
+ *   slope angle     5–80°   (mapped through ln tan β — FoS ∝ 1/tan β)
+ *   saturation      0–100%
+ *   root cohesion   0–12 kPa
+ *
+ * Basis: tensor Legendre polynomials of total degree ≤ 8 under a
+ * hyperbolic (q = 0.75) truncation — 80 terms instead of 165, dropping
+ * high-order interactions. Fitted by least squares on ln FoS at a scrambled
+ * Sobol design of 3× the basis size (~240 engine calls, a few ms), then
+ * checked on an independent validation set. Twice the largest validation
+ * error in ln FoS becomes the model's relative error bound, so every
+ * prediction carries an absolute error estimate (fos × bound).
+ *
+ * predict() falls back to the exact engine whenever that estimate exceeds
+ * the tolerance or the inputs fall outside the fitted domain.
+ * ============================================================================
+ */
+
+const FosSurrogate = (function () {
+    'use strict';
+
+    const DEGREE = 8;
+    const Q_NORM = 0.75;             // Hyperbolic truncation of the basis
+    const OVERSAMPLING = 3;          // Design points per basis term
+    const VALIDATION_POINTS = 256;
+    const DEFAULT_TOLERANCE = 0.05;  // FoS units
+    const SURROGATE_SEED = 1717;
+    const ERROR_SAFETY = 2;          // Validation max error understates the true max
+
+    const SLOPE_RANGE = [5, 80];
+    const SAT_RANGE = [0, 100];
+    const ROOT_RANGE = [0, 12];
+    const CRACK_REDUCTION = GeotechnicalEngine.CRACK_REDUCTION;
+
+    const LN_TAN_MIN = Math.log(Math.tan(SLOPE_RANGE[0] * Math.PI / 180));
+    const LN_TAN_MAX = Math.log(Math.tan(SLOPE_RANGE[1] * Math.PI / 180));
+
+    const models = new Map();        // profile key → { profile, fits: [intact, cracked] }
+    let basis = null;                // Uint8Array of multi-indices, 3 per term
+
+    // Scratch space for evaluation (no allocation per call)
+    const L0 = new Float64Array(DEGREE + 1);
+    const L1 = new Float64Array(DEGREE + 1);
+    const L2 = new Float64Array(DEGREE + 1);
+
+    // ========================================================================
+    // BASIS
+    // ========================================================================
+
+    function getBasis() {
+        if (basis) return basis;
+        const terms = [];
+        for (let a = 0; a <= DEGREE; a++) {
+            for (let b = 0; b <= DEGREE; b++) {
+                for (let c = 0; c <= DEGREE; c++) {
+                    const qNorm = Math.pow(Math.pow(a, Q_NORM) + Math.pow(b, Q_NORM) + Math.pow(c, Q_NORM), 1 / Q_NORM);
+                    if (qNorm <= DEGREE + 1e-9) terms.push(a, b, c);
+                }
+            }
+        }
+        basis = Uint8Array.from(terms);
+        return basis;
+    }
+
+    // Legendre polynomials P_0..P_DEGREE at x ∈ [-1, 1]
+    function legendre(x, out) {
+        out[0] = 1;
+        out[1] = x;
+        for (let k = 1; k < DEGREE; k++) {
+            out[k + 1] = ((2 * k + 1) * x * out[k] - k * out[k - 1]) / (k + 1);
+        }
+    }
+
+    // Physical inputs → unit cube [-1, 1]³
+    function toUnit(slopeAngle, saturation, rootCohesion) {
+        const lt = Math.log(Math.tan(slopeAngle * Math.PI / 180));
+        legendre(2 * (lt - LN_TAN_MIN) / (LN_TAN_MAX - LN_TAN_MIN) - 1, L0);
+        legendre(2 * (saturation - SAT_RANGE[0]) / (SAT_RANGE[1] - SAT_RANGE[0]) - 1, L1);
+        legendre(2 * (rootCohesion - ROOT_RANGE[0]) / (ROOT_RANGE[1] - ROOT_RANGE[0]) - 1, L2);
+    }
+
+    function fromUnit(u) {
+        const lt = LN_TAN_MIN + (u[0] + 1) / 2 * (LN_TAN_MAX - LN_TAN_MIN);
+        return {
+            slopeAngle: Math.atan(Math.exp(lt)) * 180 / Math.PI,
+            saturation: SAT_RANGE[0] + (u[1] + 1) / 2 * (SAT_RANGE[1] - SAT_RANGE[0]),
+            rootCohesion: ROOT_RANGE[0] + (u[2] + 1) / 2 * (ROOT_RANGE[1] - ROOT_RANGE[0])
+        };
+    }
+
+    function inDomain(slopeAngle, saturation, rootCohesion) {
+        return slopeAngle >= SLOPE_RANGE[0] && slopeAngle <= SLOPE_RANGE[1] &&
+            saturation >= SAT_RANGE[0] && saturation <= SAT_RANGE[1] &&
+            rootCohesion >= ROOT_RANGE[0] && rootCohesion <= ROOT_RANGE[1];
+    }
+
+    // Σ cₖ Ψₖ at the point loaded by toUnit()
+    function evalSeries(coeffs) {
+        const B = getBasis();
+        let sum = 0;
+        for (let k = 0, j = 0; k < coeffs.length; k++, j += 3) {
+            sum += coeffs[k] * L0[B[j]] * L1[B[j + 1]] * L2[B[j + 2]];
+        }
+        return sum;
+    }
+
+    // ========================================================================
+    // FITTING
+    // ========================================================================
+
+    function truth(profile, point, crackReduction) {
+        return GeotechnicalEngine.compositeFoS({
+            cohesion: profile.cohesion,
+            frictionAngle: profile.frictionAngle,
+            unitWeight: profile.unitWeight,
+            slopeAngle: point.slopeAngle,
+            saturation: point.saturation,
+            rootCohesion: point.rootCohesion,
+            crackReduction: crackReduction
+        }).fos;
+    }
+
+    /**
+     * Least-squares fit of ln FoS on a Sobol design (normal equations,
+     * Cholesky), then validation on an independent Sobol stream
+     */
+    function fitModel(profile, crackReduction) {
+        const B = getBasis();
+        const P = B.length / 3;
+        const N = OVERSAMPLING * P;
+        const E = GeotechnicalEngine;
+        const u = new Float64Array(3);
+        const row = new Float64Array(P);
+        const AtA = new Float64Array(P * P);
+        const Aty = new Float64Array(P);
+
+        function loadRow() {
+            for (let k = 0, j = 0; k < P; k++, j += 3) row[k] = L0[B[j]] * L1[B[j + 1]] * L2[B[j + 2]];
+        }
+
+        const design = new E.SobolSequence(3, new E.SeededRandom(SURROGATE_SEED, 0));
+        for (let i = 0; i < N; i++) {
+            design.next(u);
+            for (let d = 0; d < 3; d++) u[d] = 2 * u[d] - 1;
+            const point = fromUnit(u);
+            const y = Math.log(Math.max(1e-6, truth(profile, point, crackReduction)));
+            toUnit(point.slopeAngle, point.saturation, point.rootCohesion);
+            loadRow();
+            for (let a = 0; a < P; a++) {
+                Aty[a] += row[a] * y;
+                const ra = row[a];
+                for (let b = 0; b <= a; b++) AtA[a * P + b] += ra * row[b];
+            }
+        }
+
+        const coeffs = choleskySolve(AtA, Aty, P);
+
+        // Validation on a separate stream
+        const check = new E.SobolSequence(3, new E.SeededRandom(SURROGATE_SEED, 1));
+        let sumSq = 0;
+        let maxLog = 0;
+        for (let i = 0; i < VALIDATION_POINTS; i++) {
+            check.next(u);
+            for (let d = 0; d < 3; d++) u[d] = 2 * u[d] - 1;
+            const point = fromUnit(u);
+            const y = Math.log(Math.max(1e-6, truth(profile, point, crackReduction)));
+            toUnit(point.slopeAngle, point.saturation, point.rootCohesion);
+            const r = Math.abs(evalSeries(coeffs) - y);
+            sumSq += r * r;
+            if (r > maxLog) maxLog = r;
+        }
+
+        return {
+            coeffs: coeffs,
+            terms: P,
+            designPoints: N,
+            rmsLogError: Math.sqrt(sumSq / VALIDATION_POINTS),
+            maxLogError: maxLog
+        };
+    }
+
+    // Solve the symmetric positive-definite system (lower triangle of A)
+    function choleskySolve(A, b, P) {
+        const L = new Float64Array(P * P);
+        for (let j = 0; j < P; j++) {
+            let d = A[j * P + j];
+            for (let k = 0; k < j; k++) d -= L[j * P + k] * L[j * P + k];
+            // Tiny ridge keeps near-singular designs solvable
+            L[j * P + j] = Math.sqrt(Math.max(d, 1e-12));
+            for (let i = j + 1; i < P; i++) {
+                let s = A[i * P + j];
+                for (let k = 0; k < j; k++) s -= L[i * P + k] * L[j * P + k];
+                L[i * P + j] = s / L[j * P + j];
+            }
+        }
+        const z = new Float64Array(P);
+        for (let i = 0; i < P; i++) {
+            let s = b[i];
+            for (let k = 0; k < i; k++) s -= L[i * P + k] * z[k];
+            z[i] = s / L[i * P + i];
+        }
+        const x = new Float64Array(P);
+        for (let i = P - 1; i >= 0; i--) {
+            let s = z[i];
+            for (let k = i + 1; k < P; k++) s -= L[k * P + i] * x[k];
+            x[i] = s / L[i * P + i];
+        }
+        return x;
+    }
+
+    // ========================================================================
+    // MODELS PER SOIL PROFILE
+    // ========================================================================
+
+    /**
+     * Normalise a soil (SOIL_DATABASE entry or { cohesion, frictionAngle,
+     * unitWeight } means) to a profile and its cache key
+     */
+    function toProfile(soil) {
+        const profile = soil.cohesion && typeof soil.cohesion === 'object'
+            ? { cohesion: soil.cohesion.mean, frictionAngle: soil.friction.mean, unitWeight: soil.unitWeight.mean }
+            : { cohesion: soil.cohesion, frictionAngle: soil.frictionAngle, unitWeight: soil.unitWeight };
+        profile.key = [profile.cohesion, profile.frictionAngle, profile.unitWeight].join('|');
+        return profile;
+    }
+
+    /**
+     * Surrogate for a soil profile — fitted lazily on first use
+     * @returns {Object} { profile, fits: [intact, cracked], buildMs }
+     */
+    function getModel(soil) {
+        const profile = toProfile(soil);
+        let model = models.get(profile.key);
+        if (!model) {
+            const t0 = Date.now();
+            model = {
+                profile: profile,
+                fits: [fitModel(profile, 0), fitModel(profile, CRACK_REDUCTION)],
+                buildMs: 0
+            };
+            model.buildMs = Date.now() - t0;
+            models.set(profile.key, model);
+        }
+        return model;
+    }
+
+    /**
+     * Surrogate composite FoS with error estimate
+     *
+     * @param {Object} soil - SOIL_DATABASE entry or profile means
+     * @param {Object} inputs - { slopeAngle, saturation, rootCohesion, cracks }
+     * @returns {Object} { fos, error, inDomain, exact: false }
+     */
+    function evaluate(soil, inputs) {
+        const { slopeAngle = 35, saturation = 50, rootCohesion = 0, cracks = false } = inputs;
+        const fit = getModel(soil).fits[cracks ? 1 : 0];
+        const within = inDomain(slopeAngle, saturation, rootCohesion);
+        const s = Math.min(SLOPE_RANGE[1], Math.max(SLOPE_RANGE[0], slopeAngle));
+        const w = Math.min(SAT_RANGE[1], Math.max(SAT_RANGE[0], saturation));
+        const r = Math.min(ROOT_RANGE[1], Math.max(ROOT_RANGE[0], rootCohesion));
+
+        toUnit(s, w, r);
+        const fos = Math.exp(evalSeries(fit.coeffs));
+
+        return {
+            fos: fos,
+            error: within ? fos * (Math.exp(ERROR_SAFETY * fit.maxLogError) - 1) : Infinity,
+            inDomain: within,
+            exact: false
+        };
+    }
+
+    /**
+     * What-if prediction with fallback to the full engine
+     *
+     * @param {Object} soil - SOIL_DATABASE entry or profile means
+     * @param {Object} inputs - { slopeAngle, saturation, rootCohesion, cracks }
+     * @param {Object} [options] - { tolerance } in FoS units
+     * @returns {Object} { fos, error, exact }
+     */
+    function predict(soil, inputs, options = {}) {
+        const tolerance = options.tolerance || DEFAULT_TOLERANCE;
+        const estimate = evaluate(soil, inputs);
+        if (estimate.error <= tolerance) return estimate;
+
+        const profile = toProfile(soil);
+        return {
+            fos: GeotechnicalEngine.compositeFoS({
+                cohesion: profile.cohesion,
+                frictionAngle: profile.frictionAngle,
+                unitWeight: profile.unitWeight,
+                slopeAngle: inputs.slopeAngle,
+                saturation: inputs.saturation,
+                rootCohesion: inputs.rootCohesion || 0,
+                crackReduction: inputs.cracks ? CRACK_REDUCTION : 0
+            }).fos,
+            error: 0,
+            inDomain: estimate.inDomain,
+            exact: true
+        };
+    }
+
+    /**
+     * Surrogate inputs from site form data, mirroring the effective values
+     * runComprehensiveAnalysis() derives (vegetation → root cohesion,
+     * drainage → saturation). Live-weather adjustments are not applied.
+     *
+     * @param {Object} siteData - DharaApp.collectSiteData() shape
+     * @param {Object|null} [liveSoil] - ApiService soil result
+     * @returns {Object} { soil, inputs }
+     */
+    function fromSiteData(siteData, liveSoil = null) {
+        const E = GeotechnicalEngine;
+        const drainage = E.DRAINAGE_SAT_MODIFIER[siteData.drainageCondition] || 1.0;
+        return {
+            soil: E.resolveSoilProfile(siteData.soilType, liveSoil),
+            inputs: {
+                slopeAngle: siteData.slopeAngle,
+                saturation: Math.min(100, (siteData.saturation ?? 50) * drainage),
+                rootCohesion: E.vegetationFactor(siteData.vegetationPct ?? 40).rootCohesion,
+                cracks: !!siteData.cracks
+            }
+        };
+    }
+
+    function clear() {
+        models.clear();
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        getModel,
+        evaluate,
+        predict,
+        fromSiteData,
+        clear,
+        DEFAULT_TOLERANCE
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = FosSurrogate;
+}
@@ -0,0 +1,285 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — FoS Lookup Tables
+ * ============================================================================
+ * Dense precomputed FoS grids per soil profile, read back by O(1)
+ * multilinear interpolation instead of re-running the engine.
+ *
+ * Axes (input bounds of the site form):
+ *   slope angle     5–80°      step 1°   (76 nodes)
+ *   saturation      0–100%     step 5%   (21 nodes)
+ *   root cohesion   0–12 kPa   step 2    (7 nodes)   — Infinite Slope only
+ *   crack flag      0 / 1                            — Infinite Slope only
+ *
+ * Bishop and Janbu tables are 2-D (slope × saturation): the synthetic slice
+ * model uses the soil's base cohesion, so root cohesion and cracks do not
+ * enter those methods.
+ *
+ * Tables are built lazily on first use (~10 ms per soil) and persisted in
+ * IndexedDB (IdbStore 'fos-tables'); preload() restores them at startup.
+ * Nodes store FoS·tan β, which is nearly linear in β (FoS ∝ 1/tan β for
+ * frictional soil), and lookups divide by tan β again. Infinite Slope nodes
+ * hold the uncapped ratio and the engine's 10.0 display cap is applied
+ * after interpolation — capped nodes at gentle slopes would otherwise bend
+ * the curve. Interpolation error stays under ~1% of the exact engine result
+ * (a few thousandths absolute where FoS approaches zero). Values are
+ * Float32 — ample for FoS read-outs, half the storage.
+ * ============================================================================
+ */
+
+const FosTables = (function () {
+    'use strict';
+
+    const TABLE_VERSION = 2;         // Bump when engine formulas or node layout change
+    const STORE = 'fos-tables';
+
+    const SLOPE_MIN = 5, SLOPE_STEP = 1, NS = 76;
+    const SAT_MIN = 0, SAT_STEP = 5, NW = 21;
+    const ROOT_MIN = 0, ROOT_STEP = 2, NR = 7;
+    const CRACK_REDUCTION = GeotechnicalEngine.CRACK_REDUCTION;
+    const FOS_CAP = 10.0;            // As in infiniteSlope()
+
+    const tables = new Map();        // profile key → table
+
+    // ========================================================================
+    // BUILD
+    // ========================================================================
+
+    function toProfile(soil) {
+        const profile = soil.cohesion && typeof soil.cohesion === 'object'
+            ? { cohesion: soil.cohesion.mean, frictionAngle: soil.friction.mean, unitWeight: soil.unitWeight.mean }
+            : { cohesion: soil.cohesion, frictionAngle: soil.frictionAngle, unitWeight: soil.unitWeight };
+        profile.key = 'v' + TABLE_VERSION + '|' + [profile.cohesion, profile.frictionAngle, profile.unitWeight].join('|');
+        return profile;
+    }
+
+    /**
+     * Evaluate the engine over the full grid
+     */
+    function buildTable(profile) {
+        const E = GeotechnicalEngine;
+        const t0 = Date.now();
+
+        // Infinite slope: one batch call per crack flag
+        const n3 = NS * NW * NR;
+        const slopes = new Float64Array(n3);
+        const sats = new Float64Array(n3);
+        const roots = new Float64Array(n3);
+        for (let r = 0, i = 0; r < NR; r++) {
+            for (let w = 0; w < NW; w++) {
+                for (let s = 0; s < NS; s++, i++) {
+                    slopes[i] = SLOPE_MIN + s * SLOPE_STEP;
+                    sats[i] = SAT_MIN + w * SAT_STEP;
+                    roots[i] = ROOT_MIN + r * ROOT_STEP;
+                }
+            }
+        }
+        const infinite = new Float32Array(2 * n3);
+        const resisting = new Float64Array(n3);
+        const driving = new Float64Array(n3);
+        for (let crack = 0; crack < 2; crack++) {
+            E.infiniteSlopeBatch({
+                cohesion: profile.cohesion,
+                frictionAngle: profile.frictionAngle,
+                unitWeight: profile.unitWeight,
+                depth: E.DEFAULT_DEPTH,
+                slopeAngle: slopes,
+                saturation: sats,
+                rootCohesion: roots,
+                crackReduction: crack ? CRACK_REDUCTION : 0
+            }, { resisting: resisting, driving: driving }, n3);
+            // Uncapped FoS·tan β; the cap is applied after interpolation
+            for (let i = 0; i < n3; i++) {
+                infinite[crack * n3 + i] = resisting[i] / driving[i] * Math.tan(slopes[i] * Math.PI / 180);
+            }
+        }
+
+        // Bishop / Janbu on the synthetic slice set, reused across the grid
+        const bishop = new Float32Array(NS * NW);
+        const janbu = new Float32Array(NS * NW);
+        const set = E.createSliceSet(10);
+        for (let w = 0, i = 0; w < NW; w++) {
+            for (let s = 0; s < NS; s++, i++) {
+                E.generateSliceSet({
+                    cohesion: profile.cohesion,
+                    frictionAngle: profile.frictionAngle,
+                    unitWeight: profile.unitWeight,
+                    slopeAngle: SLOPE_MIN + s * SLOPE_STEP,
+                    depth: E.DEFAULT_DEPTH,
+                    saturation: SAT_MIN + w * SAT_STEP
+                }, 10, set);
+                const tanB = Math.tan((SLOPE_MIN + s * SLOPE_STEP) * Math.PI / 180);
+                bishop[i] = E.bishopSimplified(set).fos * tanB;
+                janbu[i] = E.janbuSimplified(set).fos * tanB;
+            }
+        }
+
+        return {
+            key: profile.key,
+            version: TABLE_VERSION,
+            infinite: infinite,
+            bishop: bishop,
+            janbu: janbu,
+            buildMs: Date.now() - t0
+        };
+    }
+
+    /**
+     * Table for a soil — from memory, else built now (and persisted)
+     *
+     * @param {Object} soil - SOIL_DATABASE entry or { cohesion, frictionAngle, unitWeight }
+     * @returns {Object} table
+     */
+    function getTable(soil) {
+        const profile = toProfile(soil);
+        let table = tables.get(profile.key);
+        if (!table) {
+            table = buildTable(profile);
+            tables.set(profile.key, table);
+            if (typeof IdbStore !== 'undefined') IdbStore.put(STORE, profile.key, table);
+        }
+        return table;
+    }
+
+    /**
+     * Whether a table for the soil is already resident (no build cost)
+     */
+    function isReady(soil) {
+        return tables.has(toProfile(soil).key);
+    }
+
+    /**
+     * Restore (or build and persist) tables for several soils ahead of use
+     *
+     * @param {Array<Object>} soils
+     * @returns {Promise<number>} Number of tables loaded from IndexedDB
+     */
+    function preload(soils) {
+        if (typeof IdbStore === 'undefined') {
+            soils.forEach(getTable);
+            return Promise.resolve(0);
+        }
+        return Promise.all(soils.map(function (soil) {
+            const profile = toProfile(soil);
+            if (tables.has(profile.key)) return 0;
+            return IdbStore.get(STORE, profile.key).then(function (stored) {
+                if (stored && stored.version === TABLE_VERSION && !tables.has(profile.key)) {
+                    tables.set(profile.key, stored);
+                    return 1;
+                }
+                getTable(soil);
+                return 0;
+            });
+        })).then(function (hits) {
+            return hits.reduce(function (a, b) { return a + b; }, 0);
+        });
+    }
+
+    // ========================================================================
+    // INTERPOLATION
+    // ========================================================================
+
+    // Clamp x to the axis and split into node index + fraction
+    function locate(x, min, step, n) {
+        let t = (x - min) / step;
+        if (!(t > 0)) t = 0;
+        if (t > n - 1) t = n - 1;
+        let i = Math.floor(t);
+        if (i === n - 1) i = n - 2;
+        return [i, t - i];
+    }
+
+    function bilinear(grid, offset, s, fs, w, fw) {
+        const i00 = offset + w * NS + s;
+        const i10 = i00 + NS;
+        const a = grid[i00] + (grid[i00 + 1] - grid[i00]) * fs;
+        const b = grid[i10] + (grid[i10 + 1] - grid[i10]) * fs;
+        return a + (b - a) * fw;
+    }
+
+    /**
+     * Interpolated FoS
+     *
+     * @param {Object} soil - SOIL_DATABASE entry or profile means
+     * @param {string} method - 'infinite' | 'bishop' | 'janbu' | 'composite'
+     * @param {number} slopeAngle - degrees
+     * @param {number} saturation - %
+     * @param {number} [rootCohesion] - kPa (Infinite Slope only)
+     * @param {boolean} [cracks] - Infinite Slope only
+     * @returns {number}
+     */
+    function lookup(soil, method, slopeAngle, saturation, rootCohesion = 0, cracks = false) {
+        return interpolate(getTable(soil), method, slopeAngle, saturation, rootCohesion, cracks);
+    }
+
+    function interpolate(table, method, slopeAngle, saturation, rootCohesion, cracks) {
+        const [s, fs] = locate(slopeAngle, SLOPE_MIN, SLOPE_STEP, NS);
+        const [w, fw] = locate(saturation, SAT_MIN, SAT_STEP, NW);
+        const invTan = 1 / Math.tan((SLOPE_MIN + (s + fs) * SLOPE_STEP) * Math.PI / 180);
+
+        if (method === 'bishop') return bilinear(table.bishop, 0, s, fs, w, fw) * invTan;
+        if (method === 'janbu') return bilinear(table.janbu, 0, s, fs, w, fw) * invTan;
+
+        const [r, fr] = locate(rootCohesion, ROOT_MIN, ROOT_STEP, NR);
+        const base = (cracks ? NS * NW * NR : 0) + r * NS * NW;
+        const lo = bilinear(table.infinite, base, s, fs, w, fw);
+        const hi = bilinear(table.infinite, base + NS * NW, s, fs, w, fw);
+        const infinite = Math.min(FOS_CAP, (lo + (hi - lo) * fr) * invTan);
+        if (method === 'infinite') return infinite;
+
+        // Composite weights as in runComprehensiveAnalysis()
+        return infinite * 0.4 + (
+            bilinear(table.bishop, 0, s, fs, w, fw) * 0.35 +
+            bilinear(table.janbu, 0, s, fs, w, fw) * 0.25) * invTan;
+    }
+
+    /**
+     * Interpolated FoS for many points (bulk screening, chart sweeps)
+     * Each of slopeAngle / saturation / rootCohesion may be a number or array.
+     *
+     * @param {number} [n] - Point count (default: longest input array or out;
+     *                       1 when every input is a scalar)
+     * @returns {Float64Array} out
+     */
+    function lookupBatch(soil, method, inputs, out, n) {
+        const table = getTable(soil);
+        const { slopeAngle = 35, saturation = 50, rootCohesion = 0, cracks = false } = inputs;
+        const sA = typeof slopeAngle === 'number' ? null : slopeAngle;
+        const wA = typeof saturation === 'number' ? null : saturation;
+        const rA = typeof rootCohesion === 'number' ? null : rootCohesion;
+        if (n === undefined) {
+            n = Math.max(sA ? sA.length : 0, wA ? wA.length : 0, rA ? rA.length : 0, out ? out.length : 0) || 1;
+        }
+        if (!out) out = new Float64Array(n);
+        for (let i = 0; i < n; i++) {
+            out[i] = interpolate(table, method,
+                sA ? sA[i] : slopeAngle,
+                wA ? wA[i] : saturation,
+                rA ? rA[i] : rootCohesion,
+                cracks);
+        }
+        return out;
+    }
+
+    function clear() {
+        tables.clear();
+        if (typeof IdbStore !== 'undefined') return IdbStore.clear(STORE);
+        return Promise.resolve(true);
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        getTable,
+        isReady,
+        preload,
+        lookup,
+        lookupBatch,
+        clear
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = FosTables;
+}
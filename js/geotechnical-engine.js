@@ -33,8 +33,15 @@ const GeotechnicalEngine = (function () {
     const WATER_DENSITY = 9.81;      // kN/m³ (γw)
     const DEFAULT_DEPTH = 5.0;       // m — assumed failure depth
     const MC_ITERATIONS = 2000;      // Monte Carlo default
+    const MC_DEFAULT_SEED = 20190;   // Fixed seed — identical inputs give identical results
+    const MC_BLOCK_SIZE = 256;       // Samples evaluated per kernel call
+    const MC_MIN_ITERATIONS = 200;   // Floor before convergence-based early stop
+    const MC_CHUNK_SIZE = 4096;      // Samples per Monte Carlo shard (one xoshiro stream each)
+    const MC_FINE_BINS = 5000;       // Fixed FoS grid over [0, 10] for mergeable histograms
+    const CRACK_REDUCTION = 0.25;    // Fractional cohesion loss with tension cracks
 
     // Soil property database (IS 1498:1970 & IS 2720 series)
+    // swcc: van Genuchten θr, α (1/m), n — Carsel & Parrish (1988) texture classes
     const SOIL_DATABASE = {
         'clayey_sand': {
             name: 'Clayey Sand (SC)',
@@ -43,6 +50,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 18.5, stddev: 1.0, unit: 'kN/m³' },
             permeability: { mean: 1e-5, unit: 'm/s' },
             porosity: 0.38,
+            swcc: { thetaR: 0.10, alpha: 5.9, n: 1.48 },
             classification: 'SC (IS 1498)'
         },
         'silty_clay': {
@@ -52,6 +60,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 17.5, stddev: 0.8, unit: 'kN/m³' },
             permeability: { mean: 1e-7, unit: 'm/s' },
             porosity: 0.45,
+            swcc: { thetaR: 0.07, alpha: 0.5, n: 1.09 },
             classification: 'CL (IS 1498)'
         },
         'sandy_gravel': {
@@ -70,6 +79,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 17.0, stddev: 1.5, unit: 'kN/m³' },
             permeability: { mean: 1e-4, unit: 'm/s' },
             porosity: 0.42,
+            swcc: { thetaR: 0.078, alpha: 3.6, n: 1.56 },
             classification: 'Residual (Site-specific)'
         },
         'weathered_rock': {
@@ -79,6 +89,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 22.0, stddev: 1.5, unit: 'kN/m³' },
             permeability: { mean: 1e-6, unit: 'm/s' },
             porosity: 0.25,
+            swcc: { thetaR: 0.065, alpha: 7.5, n: 1.89 },
             classification: 'Weathered Rock'
         },
         'colluvial_deposit': {
@@ -88,6 +99,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 18.0, stddev: 1.8, unit: 'kN/m³' },
             permeability: { mean: 1e-4, unit: 'm/s' },
             porosity: 0.40,
+            swcc: { thetaR: 0.057, alpha: 12.4, n: 2.28 },
             classification: 'Colluvial'
         },
         'black_cotton': {
@@ -97,6 +109,7 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 16.5, stddev: 0.8, unit: 'kN/m³' },
             permeability: { mean: 1e-8, unit: 'm/s' },
             porosity: 0.50,
+            swcc: { thetaR: 0.068, alpha: 0.8, n: 1.09 },
             classification: 'CH (IS 1498)'
         },
         'laterite': {
@@ -106,10 +119,53 @@ const GeotechnicalEngine = (function () {
             unitWeight: { mean: 19.0, stddev: 1.0, unit: 'kN/m³' },
             permeability: { mean: 1e-5, unit: 'm/s' },
             porosity: 0.38,
+            swcc: { thetaR: 0.095, alpha: 1.9, n: 1.31 },
             classification: 'Laterite'
         }
     };
 
+    // Saturation multiplier per drainage condition
+    const DRAINAGE_SAT_MODIFIER = {
+        'good': 0.7,
+        'moderate': 0.85,
+        'poor': 1.0,
+        'blocked': 1.15
+    };
+
+    // ========================================================================
+    // OUTPUT PRECISION
+    // ========================================================================
+    // 'rounded' (default) reports results at display precision, as before;
+    // 'raw' returns full-precision numbers and leaves formatting to the
+    // presentation layer. Neither mode does any string work.
+
+    const POW10 = Array.from({ length: 16 }, (_, i) => Math.pow(10, i));
+    let rawOutput = false;
+
+    /**
+     * @param {string} mode - 'rounded' | 'raw'
+     */
+    function setOutputMode(mode) {
+        rawOutput = mode === 'raw';
+    }
+
+    function getOutputMode() {
+        return rawOutput ? 'raw' : 'rounded';
+    }
+
+    // Round half away from zero to `digits` decimals (toFixed semantics)
+    function roundTo(x, digits) {
+        if (rawOutput) return x;
+        const p = POW10[digits];
+        return x < 0 ? -Math.round(-x * p) / p : Math.round(x * p) / p;
+    }
+
+    // Round to `digits` significant figures (rare-event probabilities)
+    function roundSig(x, digits) {
+        if (rawOutput || x === 0 || !isFinite(x)) return x;
+        return roundTo(x, Math.max(0, Math.min(15, digits - 1 - Math.floor(Math.log10(Math.abs(x))))));
+    }
+
     // ========================================================================
     // A. INFINITE SLOPE METHOD
     // ========================================================================
@@ -126,12 +182,48 @@ const GeotechnicalEngine = (function () {
      *   z     = depth of failure surface (m)
      *   u     = pore water pressure (kPa)
      * 
+     * Above the water table a matric suction s = ua − uw adds s·tan φᵇ to
+     * the cohesion (Fredlund, Morgenstern & Widger, 1978).
+     * 
+     * Pseudo-static: a horizontal inertia force kh·W acting out of the
+     * slope lowers the normal stress by kh·γz·sin β·cos β and adds
+     * kh·γz·cos²β to the driving stress. kh = 0 is the static case.
+     * 
      * Ref: IS 14496 Part 2, Sec 5.2 — Infinite slope analysis
+     *      IS 1893 Part 1 — seismic coefficient method
      * 
      * @param {Object} params
      * @returns {Object} { fos, resisting, driving, sigma_n, pore_pressure, details }
      */
     function infiniteSlope(params) {
+        const f = infiniteSlopeStresses(params);
+
+        // Factor of Safety
+        let fos = f.driving <= 0 ? 10.0 : f.resisting / f.driving;
+        fos = Math.min(fos, 10.0); // Cap at 10 for display
+
+        return {
+            fos: roundTo(fos, 4),
+            resisting: roundTo(f.resisting, 2),
+            driving: roundTo(f.driving, 2),
+            sigma_n: roundTo(f.sigma_n, 2),
+            sigma_prime: roundTo(f.sigma_prime, 2),
+            pore_pressure: roundTo(f.u, 2),
+            c_eff: roundTo(f.c_eff, 2),
+            method: f.kh > 0 ? 'Infinite Slope, pseudo-static (IS 14496 / IS 1893)' : 'Infinite Slope (IS 14496)',
+            details: {
+                beta_rad: f.beta,
+                phi_rad: f.phi,
+                hw: f.hw,
+                saturation: f.saturation,
+                depth: f.depth,
+                kh: f.kh
+            }
+        };
+    }
+
+    // Unrounded stresses on the infinite-slope failure plane (kPa)
+    function infiniteSlopeStresses(params) {
         const {
             cohesion = 5,          // kPa
             frictionAngle = 30,    // degrees
@@ -141,22 +233,29 @@ const GeotechnicalEngine = (function () {
             saturation = 50,       // percentage (0-100)
             crackReduction = 0,    // 0-1 fractional reduction in cohesion
             rootCohesion = 0,      // kPa — additional cohesion from vegetation
-            structuralAdd = 0      // kPa — additional resistance from structures
+            structuralAdd = 0,     // kPa — additional resistance from structures
+            matricSuction = 0,     // kPa — ua − uw at the failure plane
+            suctionFrictionAngle = frictionAngle / 2, // degrees — φᵇ
+            seismicCoefficient = 0 // kh — horizontal pseudo-static coefficient (g)
         } = params;
 
         const beta = slopeAngle * Math.PI / 180;
         const phi = frictionAngle * Math.PI / 180;
+        const kh = seismicCoefficient;
 
         // Effective cohesion with crack reduction & vegetation/structural add
-        const c_eff = (cohesion * (1.0 - crackReduction)) + rootCohesion + structuralAdd;
+        // (plus apparent cohesion from matric suction, if any)
+        const c_eff = (cohesion * (1.0 - crackReduction)) + rootCohesion + structuralAdd +
+            Math.max(0, matricSuction) * Math.tan(suctionFrictionAngle * Math.PI / 180);
 
         // Pore water pressure: u = γw × hw × cos²β
         // hw = saturation fraction × depth
         const hw = (saturation / 100) * depth;
         const u = WATER_DENSITY * hw * Math.pow(Math.cos(beta), 2);
 
-        // Normal stress on failure plane
-        const sigma_n = unitWeight * depth * Math.pow(Math.cos(beta), 2);
+        // Normal stress on failure plane (less the seismic unloading)
+        let sigma_n = unitWeight * depth * Math.pow(Math.cos(beta), 2);
+        if (kh !== 0) sigma_n -= kh * unitWeight * depth * Math.sin(beta) * Math.cos(beta);
 
         // Effective normal stress
         const sigma_prime = Math.max(0, sigma_n - u);
@@ -165,28 +264,393 @@ const GeotechnicalEngine = (function () {
         const resisting = c_eff + (sigma_prime * Math.tan(phi));
 
         // Driving force (per unit area)
-        const driving = unitWeight * depth * Math.sin(beta) * Math.cos(beta);
+        let driving = unitWeight * depth * Math.sin(beta) * Math.cos(beta);
+        if (kh !== 0) driving += kh * unitWeight * depth * Math.pow(Math.cos(beta), 2);
 
-        // Factor of Safety
-        let fos = driving <= 0 ? 10.0 : resisting / driving;
-        fos = Math.min(fos, 10.0); // Cap at 10 for display
+        return {
+            c_eff: c_eff, u: u, sigma_n: sigma_n, sigma_prime: sigma_prime,
+            resisting: resisting, driving: driving, beta: beta, phi: phi, hw: hw, kh: kh,
+            saturation: saturation, depth: depth, unitWeight: unitWeight
+        };
+    }
+
+    /**
+     * Batch Infinite Slope evaluation over parameter grids
+     * 
+     * Every input may be a number (broadcast to all points) or an array /
+     * typed array of per-point values. Results are written into the
+     * caller's output arrays, so sweeps allocate nothing per point and
+     * match infiniteSlope() exactly (unrounded).
+     * 
+     * @param {Object} inputs - { cohesion, frictionAngle, slopeAngle, unitWeight,
+     *                            depth, saturation, crackReduction, rootCohesion,
+     *                            structuralAdd } (same units/defaults as infiniteSlope)
+     * @param {Object} [outputs] - { fos, resisting, driving, porePressure };
+     *                             any subset. fos is allocated if none given.
+     * @param {number} [n] - Point count (default: longest input/output array)
+     * @returns {Object} outputs
+     */
+    function infiniteSlopeBatch(inputs, outputs = {}, n) {
+        const keys = ['cohesion', 'frictionAngle', 'slopeAngle', 'unitWeight', 'depth',
+            'saturation', 'crackReduction', 'rootCohesion', 'structuralAdd'];
+        const defaults = [5, 30, 35, 19, DEFAULT_DEPTH, 50, 0, 0, 0];
+
+        if (n === undefined) {
+            n = 0;
+            for (const key of keys) {
+                if (inputs[key] != null && typeof inputs[key] !== 'number') n = Math.max(n, inputs[key].length);
+            }
+            for (const key of ['fos', 'resisting', 'driving', 'porePressure']) {
+                if (outputs[key]) n = Math.max(n, outputs[key].length);
+            }
+        }
+        if (!outputs.fos && !outputs.resisting && !outputs.driving && !outputs.porePressure) {
+            outputs.fos = new Float64Array(n);
+        }
+
+        // Split each input into (array | null, scalar) so the loop never allocates
+        const arr = [];
+        const val = [];
+        for (let k = 0; k < keys.length; k++) {
+            const v = inputs[keys[k]];
+            if (v == null) { arr.push(null); val.push(defaults[k]); }
+            else if (typeof v === 'number') { arr.push(null); val.push(v); }
+            else { arr.push(v); val.push(0); }
+        }
+        const [cA, phiA, betaA, gammaA, zA, satA, crackA, rootA, structA] = arr;
+        const [cS, phiS, betaS, gammaS, zS, satS, crackS, rootS, structS] = val;
+        const { fos: fosOut = null, resisting: resOut = null, driving: drvOut = null,
+            porePressure: uOut = null } = outputs;
+        const DEG = Math.PI / 180;
+
+        for (let i = 0; i < n; i++) {
+            const c = cA ? cA[i] : cS;
+            const phi = (phiA ? phiA[i] : phiS) * DEG;
+            const beta = (betaA ? betaA[i] : betaS) * DEG;
+            const gamma = gammaA ? gammaA[i] : gammaS;
+            const z = zA ? zA[i] : zS;
+            const sat = satA ? satA[i] : satS;
+
+            const c_eff = c * (1.0 - (crackA ? crackA[i] : crackS)) +
+                (rootA ? rootA[i] : rootS) + (structA ? structA[i] : structS);
+            const cb = Math.cos(beta);
+            const cos2 = cb * cb;
+            const u = WATER_DENSITY * (sat / 100) * z * cos2;
+            let sigma_prime = gamma * z * cos2 - u;
+            if (sigma_prime < 0) sigma_prime = 0;
+
+            const resisting = c_eff + sigma_prime * Math.tan(phi);
+            const driving = gamma * z * Math.sin(beta) * cb;
+            let fos = driving <= 0 ? 10.0 : resisting / driving;
+            if (fos > 10.0) fos = 10.0;
+
+            if (fosOut) fosOut[i] = fos;
+            if (resOut) resOut[i] = resisting;
+            if (drvOut) drvOut[i] = driving;
+            if (uOut) uOut[i] = u;
+        }
+
+        return outputs;
+    }
+
+    // ========================================================================
+    // A1. SEISMIC RESPONSE (PSEUDO-STATIC / NEWMARK SLIDING BLOCK)
+    // ========================================================================
+    const KT_OMEGA = 15.6;          // rad/s — Kanai-Tajimi ground frequency (firm soil)
+    const KT_DAMPING = 0.6;         // Kanai-Tajimi ground damping ratio
+    const NEWMARK_DT = 0.01;        // s — synthetic record time step
+    const NEWMARK_CLASSES = [       // cm — Jibson & Michael (2009) hazard classes
+        { max: 1, label: 'Low' },
+        { max: 5, label: 'Moderate' },
+        { max: 15, label: 'High' },
+        { max: Infinity, label: 'Very High' }
+    ];
+
+    // Yield coefficient from unrounded static stresses (see criticalAcceleration)
+    function yieldCoefficient(f) {
+        const cb = Math.cos(f.beta);
+        const sb = Math.sin(f.beta);
+        const W = f.unitWeight * f.depth;
+        const tanPhi = f.sigma_prime > 0 ? Math.tan(f.phi) : 0;
+        const denom = W * cb * (cb + sb * tanPhi);
+        if (denom <= 0) return 0;
+        const ky = (f.resisting - f.driving) / denom;
+        // Unloading would drive σ' below zero first — friction is gone, cohesion only
+        if (ky > 0 && tanPhi > 0 && f.sigma_prime < ky * W * sb * cb) {
+            return (f.c_eff - f.driving) / (W * cb * cb);
+        }
+        return ky;
+    }
+
+    /**
+     * Critical (yield) acceleration of the infinite slope
+     * 
+     * The horizontal coefficient at which the pseudo-static FoS is 1:
+     *   ky = [c' + (γz·cos²β − u)·tan φ' − γz·sin β·cos β]
+     *        / [γz·cos β·(cos β + sin β·tan φ')]
+     * equivalently (FoS − 1)·sin β / (cos β + sin β·tan φ') for a
+     * cohesionless dry slope. ky ≤ 0 means the slope is statically unstable.
+     * 
+     * Ref: Newmark (1965) — Effects of earthquakes on dams and embankments
+     * 
+     * @param {Object} params - infiniteSlope() params (seismicCoefficient ignored)
+     * @returns {number} ky (g)
+     */
+    function criticalAcceleration(params) {
+        const f = infiniteSlopeStresses(Object.assign({}, params, { seismicCoefficient: 0 }));
+        return roundTo(yieldCoefficient(f), 4);
+    }
+
+    // One-directional rigid-block sliding, trapezoidal integration (m)
+    function newmarkSlide(accel, n, dt, ky, sign) {
+        let v = 0, d = 0, arPrev = 0;
+        for (let i = 0; i < n; i++) {
+            const ar = (sign * accel[i] - ky) * GRAVITY;
+            if (v > 0 || ar > 0) {
+                let vNext = v + 0.5 * (arPrev + ar) * dt;
+                if (vNext < 0) vNext = 0;
+                d += 0.5 * (v + vNext) * dt;
+                v = vNext;
+                arPrev = v > 0 ? ar : 0;
+            } else {
+                arPrev = 0;
+            }
+        }
+        return d;
+    }
+
+    function peakAbs(accel, n) {
+        let peak = 0;
+        for (let i = 0; i < n; i++) {
+            const a = accel[i] < 0 ? -accel[i] : accel[i];
+            if (a > peak) peak = a;
+        }
+        return peak;
+    }
 
+    /**
+     * Newmark rigid-block displacement for one acceleration record
+     * 
+     * The block slides downslope whenever the ground acceleration exceeds
+     * ky; relative velocity is integrated until it returns to zero. Both
+     * record polarities are run and the larger displacement governs.
+     * 
+     * Ref: Newmark (1965); Jibson (2007) — Regression models for estimating
+     *      coseismic landslide displacement
+     * 
+     * @param {ArrayLike<number>} accel - Horizontal ground acceleration (g)
+     * @param {number} dt - Sample interval (s)
+     * @param {number} ky - Critical acceleration (g), e.g. criticalAcceleration()
+     * @returns {Object} { displacement, positive, negative, pga, ky } (cm)
+     */
+    function newmarkDisplacement(accel, dt, ky) {
+        const n = accel.length;
+        const pga = peakAbs(accel, n);
+        if (ky <= 0) {
+            return { displacement: Infinity, positive: Infinity, negative: Infinity, pga: roundTo(pga, 4), ky: ky, staticallyUnstable: true };
+        }
+        const pos = newmarkSlide(accel, n, dt, ky, 1) * 100;
+        const neg = newmarkSlide(accel, n, dt, ky, -1) * 100;
         return {
-            fos: parseFloat(fos.toFixed(4)),
-            resisting: parseFloat(resisting.toFixed(2)),
-            driving: parseFloat(driving.toFixed(2)),
-            sigma_n: parseFloat(sigma_n.toFixed(2)),
-            sigma_prime: parseFloat(sigma_prime.toFixed(2)),
-            pore_pressure: parseFloat(u.toFixed(2)),
-            c_eff: parseFloat(c_eff.toFixed(2)),
-            method: 'Infinite Slope (IS 14496)',
-            details: {
-                beta_rad: beta,
-                phi_rad: phi,
-                hw: hw,
-                saturation: saturation,
-                depth: depth
+            displacement: roundTo(Math.max(pos, neg), 3),
+            positive: roundTo(pos, 3),
+            negative: roundTo(neg, 3),
+            pga: roundTo(pga, 4),
+            ky: ky,
+            staticallyUnstable: false
+        };
+    }
+
+    /**
+     * Jibson (2007) regression estimate of Newmark displacement
+     * 
+     * log Dn = 0.215 + log[(1 − ac/amax)^2.341 · (ac/amax)^−1.438]  (σ = 0.51)
+     * 
+     * @param {number} ky - Critical acceleration (g)
+     * @param {number} pga - Peak ground acceleration (g)
+     * @returns {number} Dn (cm)
+     */
+    function jibsonDisplacement(ky, pga) {
+        if (!(pga > ky) || ky <= 0) return 0;
+        const r = ky / pga;
+        return Math.pow(10, 0.215) * Math.pow(1 - r, 2.341) * Math.pow(r, -1.438);
+    }
+
+    // PGA (g) — Joyner & Boore (1981), r = √(d² + 7.3²), d in km
+    function joynerBoorePGA(magnitude, distance) {
+        const r = Math.sqrt(distance * distance + 7.3 * 7.3);
+        return Math.pow(10, -1.02 + 0.249 * magnitude - Math.log10(r) - 0.00255 * r);
+    }
+
+    // Significant duration (s) — Dobry, Idriss & Ng (1978)
+    function dobryDuration(magnitude) {
+        return Math.max(1, Math.pow(10, 0.432 * magnitude - 1.83));
+    }
+
+    // Kanai-Tajimi filtered noise under a Saragoni-Hart envelope, scaled to pga
+    function fillAccelerogram(out, n, dt, pga, rng) {
+        // Saragoni-Hart window: peak 1 at 0.2·Tw, 0.05 at Tw
+        const eps = 0.2, eta = 0.05;
+        const b = -eps * Math.log(eta) / (1 + eps * (Math.log(eps) - 1));
+        const c = b / eps;
+        const a = Math.pow(Math.E / eps, b);
+        const Tw = n * dt;
+        const w2 = KT_OMEGA * KT_OMEGA;
+        const zw2 = 2 * KT_DAMPING * KT_OMEGA;
+
+        let x = 0, v = 0, peak = 0;
+        for (let i = 0; i < n; i++) {
+            v += (-rng.nextNormal() - zw2 * v - w2 * x) * dt;
+            x += v * dt;
+            const t = (i + 1) / n;
+            const ag = (zw2 * v + w2 * x) * a * Math.pow(t, b) * Math.exp(-c * t);
+            out[i] = ag;
+            const abs = ag < 0 ? -ag : ag;
+            if (abs > peak) peak = abs;
+        }
+        const scale = peak > 0 ? pga / peak : 0;
+        for (let i = 0; i < n; i++) out[i] *= scale;
+        return out;
+    }
+
+    /**
+     * Seeded synthetic accelerogram — Kanai-Tajimi filtered white noise
+     * under a Saragoni-Hart envelope, scaled to the target PGA
+     * 
+     * @param {number} pga - Peak ground acceleration (g)
+     * @param {number} duration - Significant duration D5-95 (s); record length 2·duration
+     * @param {Object} [options] - { dt, seed, stream }
+     * @returns {Float64Array} Acceleration (g)
+     */
+    function syntheticAccelerogram(pga, duration, options = {}) {
+        const { dt = NEWMARK_DT, seed = MC_DEFAULT_SEED, stream = 0 } = options;
+        const n = Math.max(2, Math.ceil(2 * duration / dt));
+        return fillAccelerogram(new Float64Array(n), n, dt, pga, new SeededRandom(seed, stream));
+    }
+
+    /**
+     * Newmark displacement for every event of a USGS catalogue result
+     * 
+     * Per event: PGA from magnitude and epicentral distance (Joyner & Boore,
+     * 1981), duration from magnitude (Dobry et al., 1978), then a seeded
+     * synthetic record integrated as a rigid block at the site's ky, with
+     * the Jibson (2007) regression alongside as a cross-check. Events whose
+     * PGA cannot reach ky are skipped without generating a record, and one
+     * scratch buffer is reused for the rest, so a full catalogue costs
+     * milliseconds. Imported records (options.records[i] = { accel, dt })
+     * replace the synthetic ones for the matching events.
+     * 
+     * The pseudo-static FoS uses kh = 0.5·PGAmax (Hynes-Griffin & Franklin, 1984).
+     * 
+     * @param {Object} params - infiniteSlope() params
+     * @param {Array} events - [{ magnitude, distance (km), place, time }, ...]
+     * @param {Object} [options] - { dt, seed, records }
+     * @returns {Object} Per-event Float64Arrays (pga g, duration s, displacement /
+     *                   regression cm) plus site summary
+     */
+    function seismicDisplacementBatch(params, events, options = {}) {
+        const { dt = NEWMARK_DT, seed = MC_DEFAULT_SEED, records = null } = options;
+        const f = infiniteSlopeStresses(Object.assign({}, params, { seismicCoefficient: 0 }));
+        const ky = yieldCoefficient(f);
+        const unstable = ky <= 0;
+        const n = events ? events.length : 0;
+
+        const magnitude = new Float64Array(n);
+        const distance = new Float64Array(n);
+        const pga = new Float64Array(n);
+        const duration = new Float64Array(n);
+        const displacement = new Float64Array(n);
+        const regression = new Float64Array(n);
+        const base = new SeededRandom(seed);
+        const rng = new SeededRandom(seed);
+        let buffer = new Float64Array(0);
+        let integrated = 0;
+
+        for (let i = 0; i < n; i++) {
+            const ev = events[i] || {};
+            const record = records && records[i];
+            magnitude[i] = ev.magnitude;
+            distance[i] = ev.distance;
+            // One stream per event, drawn from a copy of the pristine base —
+            // a record does not depend on which earlier events were integrated
+            base.jump();
+            rng.s.set(base.s);
+            rng.hasSpare = false;
+
+            let accel = null, len = 0, step = dt;
+            if (record && record.accel) {
+                accel = record.accel;
+                len = accel.length;
+                step = record.dt || dt;
+                pga[i] = peakAbs(accel, len);
+                duration[i] = len * step;
+            } else if (ev.magnitude > 0 && ev.distance >= 0) {
+                pga[i] = joynerBoorePGA(ev.magnitude, ev.distance);
+                duration[i] = dobryDuration(ev.magnitude);
+            } else {
+                continue;
+            }
+            if (unstable || pga[i] <= ky) continue;
+
+            if (!accel) {
+                len = Math.ceil(2 * duration[i] / dt);
+                if (buffer.length < len) buffer = new Float64Array(len);
+                accel = fillAccelerogram(buffer, len, dt, pga[i], rng);
             }
+            displacement[i] = 100 * Math.max(
+                newmarkSlide(accel, len, step, ky, 1),
+                newmarkSlide(accel, len, step, ky, -1)
+            );
+            regression[i] = jibsonDisplacement(ky, pga[i]);
+            integrated++;
+        }
+
+        // Site summary
+        let maxPGA = 0, maxD = 0, sumD = 0, governing = -1;
+        const exceedance = { cm1: 0, cm5: 0, cm15: 0 };
+        for (let i = 0; i < n; i++) {
+            if (pga[i] > maxPGA) maxPGA = pga[i];
+            const d = displacement[i];
+            sumD += d;
+            if (d > maxD) { maxD = d; governing = i; }
+            if (d >= 1) exceedance.cm1++;
+            if (d >= 5) exceedance.cm5++;
+            if (d >= 15) exceedance.cm15++;
+        }
+        const designKh = 0.5 * maxPGA;
+        const ev = governing >= 0 ? events[governing] : null;
+
+        return {
+            ky: roundTo(ky, 4),
+            staticallyUnstable: unstable,
+            events: n,
+            integrated: integrated,
+            magnitude: magnitude,
+            distance: distance,
+            pga: pga,
+            duration: duration,
+            displacement: displacement,
+            regression: regression,
+            maxPGA: roundTo(maxPGA, 4),
+            maxDisplacement: roundTo(maxD, 3),
+            meanDisplacement: roundTo(n > 0 ? sumD / n : 0, 3),
+            cumulativeDisplacement: roundTo(sumD, 3),
+            governingEvent: ev ? {
+                index: governing,
+                magnitude: ev.magnitude,
+                distance: ev.distance,
+                place: ev.place || null,
+                time: ev.time || null,
+                pga: roundTo(pga[governing], 4),
+                displacement: roundTo(displacement[governing], 3),
+                regression: roundTo(regression[governing], 3)
+            } : null,
+            exceedance: exceedance,
+            hazardClass: unstable ? 'Statically Unstable'
+                : NEWMARK_CLASSES.find(cls => maxD < cls.max).label,
+            designKh: roundTo(designKh, 4),
+            pseudoStaticFoS: infiniteSlope(Object.assign({}, params, { seismicCoefficient: designKh })).fos,
+            method: 'Newmark rigid block (Joyner-Boore PGA, Kanai-Tajimi synthetic records)'
         };
     }
 
@@ -204,12 +668,35 @@ const GeotechnicalEngine = (function () {
      * Iterative solution - converges to stable FoS
      * Ref: Bishop (1955), applicable per IS 14496 Part 2
      * 
-     * @param {Array} slices - Array of slice objects
+     * @param {Object|Array} slices - SliceSet or array of slice objects
      * @param {number} maxIter - Maximum iterations for convergence
+     * @param {number} initialFoS - Starting guess (warm start)
      * @returns {Object} { fos, iterations, converged }
      */
-    function bishopSimplified(slices, maxIter = 50) {
-        let fos_prev = 1.5; // Initial guess
+    function bishopSimplified(slices, maxIter = 50, initialFoS = 1.5) {
+        const set = toSliceSet(slices);
+        const result = bishopCore(set, maxIter, initialFoS, 0);
+
+        return {
+            fos: roundTo(result.fos, 4),
+            iterations: result.iterations,
+            converged: result.converged,
+            method: 'Bishop Simplified'
+        };
+    }
+
+    /**
+     * Bishop fixed-point iteration on a SliceSet (numeric core)
+     * Trig terms come precomputed from the SliceSet, so each iteration is
+     * multiply-add only. With mAlphaFloor > 0, m_α is floored at that value
+     * (used by the circle search); otherwise slices with |m_α| < 0.001 are
+     * skipped.
+     * 
+     * @returns {Object} { fos, iterations, converged } — unrounded
+     */
+    function bishopCore(set, maxIter, initialFoS, mAlphaFloor) {
+        const { n, width, weight, cohesion, porePressure, sinAlpha, cosAlpha, tanPhi } = set;
+        let fos_prev = initialFoS;
         let converged = false;
         let iterations = 0;
 
@@ -217,20 +704,17 @@ const GeotechnicalEngine = (function () {
             let numerator = 0;
             let denominator = 0;
 
-            for (const slice of slices) {
-                const alpha_rad = slice.alpha * Math.PI / 180;
-                const phi_rad = slice.phi * Math.PI / 180;
-
-                const m_alpha = Math.cos(alpha_rad) +
-                    (Math.sin(alpha_rad) * Math.tan(phi_rad)) / fos_prev;
-
-                if (Math.abs(m_alpha) < 0.001) continue;
-
-                const num_slice = (slice.cohesion * slice.width +
-                    (slice.weight - slice.pore_pressure * slice.width) * Math.tan(phi_rad)) / m_alpha;
-
-                numerator += num_slice;
-                denominator += slice.weight * Math.sin(alpha_rad);
+            for (let k = 0; k < n; k++) {
+                let m_alpha = cosAlpha[k] + sinAlpha[k] * tanPhi[k] / fos_prev;
+                if (mAlphaFloor > 0) {
+                    if (m_alpha < mAlphaFloor) m_alpha = mAlphaFloor;
+                } else if (Math.abs(m_alpha) < 0.001) {
+                    continue;
+                }
+
+                numerator += (cohesion[k] * width[k] +
+                    (weight[k] - porePressure[k] * width[k]) * tanPhi[k]) / m_alpha;
+                denominator += weight[k] * sinAlpha[k];
             }
 
             const fos_new = denominator === 0 ? 10.0 : numerator / denominator;
@@ -245,14 +729,76 @@ const GeotechnicalEngine = (function () {
             fos_prev = fos_new;
         }
 
+        return { fos: fos_prev, iterations: iterations, converged: converged };
+    }
+
+    // ========================================================================
+    // B1. SLICE SET (shared by all limit-equilibrium solvers)
+    // ========================================================================
+    /**
+     * Compact struct-of-arrays slice representation
+     * 
+     * Parallel Float64Arrays: width (m), weight (kN/m), cohesion (kPa),
+     * porePressure (kPa), sinAlpha, cosAlpha, tanPhi. Trig is evaluated
+     * once when the surface is built instead of on every solver iteration,
+     * and a single set can be rewritten in place for each trial surface.
+     * 
+     * @param {number} n - Number of slices
+     * @returns {Object} SliceSet
+     */
+    function createSliceSet(n) {
         return {
-            fos: parseFloat(fos_prev.toFixed(4)),
-            iterations: iterations,
-            converged: converged,
-            method: 'Bishop Simplified'
+            n: n,
+            width: new Float64Array(n),
+            weight: new Float64Array(n),
+            cohesion: new Float64Array(n),
+            porePressure: new Float64Array(n),
+            sinAlpha: new Float64Array(n),
+            cosAlpha: new Float64Array(n),
+            tanPhi: new Float64Array(n)
         };
     }
 
+    /**
+     * Convert slice objects ({ width, alpha°, weight, cohesion, phi°,
+     * pore_pressure }) to a SliceSet. SliceSets are returned unchanged.
+     */
+    function toSliceSet(slices) {
+        if (!Array.isArray(slices)) return slices;
+        const set = createSliceSet(slices.length);
+        for (let k = 0; k < slices.length; k++) {
+            const s = slices[k];
+            const alpha_rad = s.alpha * Math.PI / 180;
+            set.width[k] = s.width;
+            set.weight[k] = s.weight;
+            set.cohesion[k] = s.cohesion;
+            set.porePressure[k] = s.pore_pressure;
+            set.sinAlpha[k] = Math.sin(alpha_rad);
+            set.cosAlpha[k] = Math.cos(alpha_rad);
+            set.tanPhi[k] = Math.tan(s.phi * Math.PI / 180);
+        }
+        return set;
+    }
+
+    /**
+     * Convert a SliceSet back to slice objects (for reports and display)
+     */
+    function sliceSetToArray(set) {
+        const slices = [];
+        for (let k = 0; k < set.n; k++) {
+            slices.push({
+                id: k + 1,
+                width: set.width[k],
+                alpha: Math.atan2(set.sinAlpha[k], set.cosAlpha[k]) * 180 / Math.PI,
+                weight: set.weight[k],
+                cohesion: set.cohesion[k],
+                phi: Math.atan(set.tanPhi[k]) * 180 / Math.PI,
+                pore_pressure: set.porePressure[k]
+            });
+        }
+        return slices;
+    }
+
     /**
      * Generate synthetic slices for Bishop analysis based on slope geometry
      * Used when detailed slice data is not available from field survey
@@ -262,6 +808,22 @@ const GeotechnicalEngine = (function () {
      * @returns {Array} Array of slice objects
      */
     function generateSlices(params, nSlices = 10) {
+        const slices = sliceSetToArray(generateSliceSet(params, nSlices));
+        // Report the input friction angle exactly rather than atan(tanφ)
+        const phi = params.frictionAngle !== undefined ? params.frictionAngle : 30;
+        slices.forEach(s => { s.phi = phi; });
+        return slices;
+    }
+
+    /**
+     * Synthetic slices (as generateSlices) written directly into a SliceSet
+     * 
+     * @param {Object} params - Slope parameters (same as infiniteSlope)
+     * @param {number} nSlices - Number of slices
+     * @param {Object} [set] - SliceSet to overwrite (allocated if omitted)
+     * @returns {Object} SliceSet
+     */
+    function generateSliceSet(params, nSlices = 10, set = createSliceSet(nSlices)) {
         const {
             cohesion = 5,
             frictionAngle = 30,
@@ -271,30 +833,270 @@ const GeotechnicalEngine = (function () {
             saturation = 50
         } = params;
 
-        const slices = [];
         const slopeLength = depth / Math.sin(slopeAngle * Math.PI / 180);
         const sliceWidth = slopeLength / nSlices;
+        const tanPhi = Math.tan(frictionAngle * Math.PI / 180);
 
         for (let i = 0; i < nSlices; i++) {
             const position = (i + 0.5) / nSlices; // Normalized position
             // Alpha varies from slopeAngle at top to 0 at toe (simplified circular arc)
-            const alpha = slopeAngle * (1 - position * 0.7);
+            const alpha_rad = slopeAngle * (1 - position * 0.7) * Math.PI / 180;
             const sliceDepth = depth * (0.5 + 0.5 * Math.sin(Math.PI * position));
-            const weight = unitWeight * sliceDepth * sliceWidth;
-            const u = WATER_DENSITY * sliceDepth * (saturation / 100);
 
-            slices.push({
-                id: i + 1,
-                width: sliceWidth,
-                alpha: alpha,
-                weight: weight,
-                cohesion: cohesion,
-                phi: frictionAngle,
-                pore_pressure: u
-            });
+            set.width[i] = sliceWidth;
+            set.weight[i] = unitWeight * sliceDepth * sliceWidth;
+            set.cohesion[i] = cohesion;
+            set.porePressure[i] = WATER_DENSITY * sliceDepth * (saturation / 100);
+            set.sinAlpha[i] = Math.sin(alpha_rad);
+            set.cosAlpha[i] = Math.cos(alpha_rad);
+            set.tanPhi[i] = tanPhi;
         }
 
-        return slices;
+        return set;
+    }
+
+    // ========================================================================
+    // B2. CRITICAL SLIP-CIRCLE SEARCH (BISHOP)
+    // ========================================================================
+    /**
+     * Grid search for the critical circular slip surface
+     * 
+     * Slope geometry: level ground at the toe (x < 0), a face rising at β
+     * to the crest at height H (x = H / tan β), level crest beyond.
+     * For each centre on a grid above the face, a fan of radii is evaluated
+     * from shallow circles down to a firm base `depthBelowToe` under the toe.
+     * 
+     *   - Trial slices are written into preallocated typed arrays (no
+     *     per-slice objects); Bishop is warm-started from the FoS of the
+     *     neighbouring radius.
+     *   - Pruning: the Ordinary (Fellenius) FoS is a cheap, usually lower
+     *     estimate of Bishop's; circles whose OMS value already exceeds the
+     *     current minimum by pruneMargin skip the Bishop iteration.
+     *   - Refinement: successively finer grids around the current minimum.
+     * 
+     * @param {Object} params - { slopeAngle, slopeHeight, cohesion, frictionAngle,
+     *                            unitWeight, saturation, depthBelowToe }
+     * @param {Object} [options] - { nx, ny, nRadii, nSlices, refineLevels, prune, pruneMargin }
+     * @returns {Object} Critical surface, FoS and contour grid of min FoS per centre
+     */
+    function bishopCircleSearch(params, options = {}) {
+        const {
+            slopeAngle = 35,
+            slopeHeight = 10,
+            cohesion = 5,
+            frictionAngle = 30,
+            unitWeight = 19,
+            saturation = 50,
+            depthBelowToe = slopeHeight * 0.5
+        } = params;
+        const {
+            nx = 20,
+            ny = 20,
+            nRadii = 16,
+            nSlices = 20,
+            refineLevels = 2,
+            prune = true,
+            pruneMargin = 1.02
+        } = options;
+
+        const H = slopeHeight;
+        const tanB = Math.tan(Math.max(1, Math.min(89, slopeAngle)) * Math.PI / 180);
+        const geom = {
+            H: H,
+            tanB: tanB,
+            L: H / tanB,
+            baseY: -depthBelowToe,
+            c: cohesion,
+            tanPhi: Math.tan(frictionAngle * Math.PI / 180),
+            gamma: unitWeight,
+            satFrac: saturation / 100
+        };
+        const set = createSliceSet(nSlices);
+        const best = { fos: Infinity, xc: 0, yc: 0, R: 0, xExit: 0, xEntry: 0 };
+        const stats = { evaluated: 0, pruned: 0, invalid: 0 };
+
+        // Coarse grid of centres above the slope face
+        const xMin = -0.25 * geom.L, xMax = geom.L * 1.25;
+        const yMin = H * 1.05, yMax = H * 2.5;
+        const dx = nx > 1 ? (xMax - xMin) / (nx - 1) : 0;
+        const dy = ny > 1 ? (yMax - yMin) / (ny - 1) : 0;
+        const gridFoS = new Float64Array(nx * ny).fill(NaN);
+        const gridX = [], gridY = [];
+        for (let i = 0; i < nx; i++) gridX.push(xMin + i * dx);
+        for (let j = 0; j < ny; j++) gridY.push(yMin + j * dy);
+
+        for (let j = 0; j < ny; j++) {
+            for (let i = 0; i < nx; i++) {
+                gridFoS[j * nx + i] = searchCentre(geom, gridX[i], gridY[j], nRadii, null, set, best, stats, prune, pruneMargin);
+            }
+        }
+
+        // Refinement around the current minimum
+        let hx = dx, hy = dy;
+        for (let level = 0; level < refineLevels && best.fos < Infinity; level++) {
+            const cx = best.xc, cy = best.yc;
+            const rSpan = [best.R * 0.85, best.R * 1.15];
+            hx /= 2; hy /= 2;
+            for (let j = -2; j <= 2; j++) {
+                for (let i = -2; i <= 2; i++) {
+                    const yc = cy + j * hy;
+                    if (yc <= H) continue;
+                    searchCentre(geom, cx + i * hx, yc, nRadii, rSpan, set, best, stats, prune, pruneMargin);
+                }
+            }
+        }
+
+        if (best.fos === Infinity) {
+            return {
+                fos: 10.0,
+                found: false,
+                evaluated: stats.evaluated,
+                method: 'Bishop Simplified — Critical Circle Search'
+            };
+        }
+
+        // Rebuild the critical surface as slice objects for reporting
+        buildTrialSlices(geom, best.xc, best.yc, best.R, best.xExit, best.xEntry, set);
+        const slices = sliceSetToArray(set);
+        const critical = bishopSimplified(slices, 50, best.fos);
+
+        return {
+            fos: critical.fos,
+            iterations: critical.iterations,
+            converged: critical.converged,
+            found: true,
+            centre: { x: roundTo(best.xc, 3), y: roundTo(best.yc, 3) },
+            radius: roundTo(best.R, 3),
+            entry: { x: roundTo(best.xEntry, 3), y: roundTo(groundLevel(geom, best.xEntry), 3) },
+            exit: { x: roundTo(best.xExit, 3), y: roundTo(groundLevel(geom, best.xExit), 3) },
+            slices: slices,
+            grid: { x: gridX, y: gridY, nx: nx, ny: ny, fos: gridFoS },
+            evaluated: stats.evaluated,
+            pruned: stats.pruned,
+            invalid: stats.invalid,
+            method: 'Bishop Simplified — Critical Circle Search'
+        };
+    }
+
+    function groundLevel(geom, x) {
+        if (x <= 0) return 0;
+        if (x >= geom.L) return geom.H;
+        return x * geom.tanB;
+    }
+
+    /**
+     * Evaluate a fan of radii about one centre; returns the minimum FoS
+     * (or the minimum OMS estimate when every circle was pruned).
+     */
+    function searchCentre(geom, xc, yc, nRadii, rSpan, set, best, stats, prune, pruneMargin) {
+        // Shallowest circle just cuts the ground below the centre; deepest touches the firm base
+        const rLo = rSpan ? rSpan[0] : (yc - groundLevel(geom, xc)) + 0.05 * geom.H;
+        const rHi = rSpan ? rSpan[1] : yc - geom.baseY;
+        let centreMin = Infinity;
+        let centrePrunedMin = Infinity;
+        let warm = 1.5;
+
+        for (let r = 0; r < nRadii; r++) {
+            const R = nRadii > 1 ? rLo + (rHi - rLo) * r / (nRadii - 1) : rHi;
+            if (yc - R < geom.baseY - 1e-9 || R <= 0) continue;
+
+            const span = circleGroundSpan(geom, xc, yc, R);
+            if (!span) { stats.invalid++; continue; }
+            if (buildTrialSlices(geom, xc, yc, R, span[0], span[1], set) === 0) {
+                stats.invalid++;
+                continue;
+            }
+
+            if (prune && best.fos < Infinity) {
+                const oms = ordinaryFoS(set);
+                if (oms > best.fos * pruneMargin) {
+                    stats.pruned++;
+                    if (oms < centrePrunedMin) centrePrunedMin = oms;
+                    continue;
+                }
+            }
+
+            const fos = bishopCore(set, 50, warm, 0.2).fos;
+            stats.evaluated++;
+            if (!(fos > 0) || !Number.isFinite(fos)) { stats.invalid++; continue; }
+            warm = fos;
+            if (fos < centreMin) centreMin = fos;
+            if (fos < best.fos) {
+                best.fos = fos; best.xc = xc; best.yc = yc; best.R = R;
+                best.xExit = span[0]; best.xEntry = span[1];
+            }
+        }
+
+        if (centreMin < Infinity) return centreMin;
+        return centrePrunedMin < Infinity ? centrePrunedMin : NaN;
+    }
+
+    /**
+     * Intersections of the lower arc of a circle with the ground profile
+     * @returns {Array|null} [xExit, xEntry] or null if the circle misses
+     */
+    function circleGroundSpan(geom, xc, yc, R) {
+        const segments = [
+            [0, 0, -Infinity, 0],                 // toe level: y = 0, x < 0
+            [geom.tanB, 0, 0, geom.L],            // face: y = x·tanβ
+            [0, geom.H, geom.L, Infinity]         // crest level: y = H
+        ];
+        let lo = Infinity, hi = -Infinity;
+        for (const [m, q, x0, x1] of segments) {
+            // (x − xc)² + (m·x + q − yc)² = R²
+            const a = 1 + m * m;
+            const b = 2 * (m * (q - yc) - xc);
+            const c = xc * xc + (q - yc) * (q - yc) - R * R;
+            const disc = b * b - 4 * a * c;
+            if (disc < 0) continue;
+            const sq = Math.sqrt(disc);
+            for (const x of [(-b - sq) / (2 * a), (-b + sq) / (2 * a)]) {
+                if (x < x0 - 1e-9 || x > x1 + 1e-9) continue;
+                if (m * x + q > yc) continue; // upper arc
+                if (x < lo) lo = x;
+                if (x > hi) hi = x;
+            }
+        }
+        if (!(hi - lo > 1e-3 * geom.H)) return null;
+        return [lo, hi];
+    }
+
+    /**
+     * Write equal-width slices between exit and entry into a SliceSet
+     * @returns {number} Slice count (0 if the surface carries no load)
+     */
+    function buildTrialSlices(geom, xc, yc, R, xExit, xEntry, set) {
+        const n = set.n;
+        const b = (xEntry - xExit) / n;
+        let total = 0;
+        for (let k = 0; k < n; k++) {
+            const xm = xExit + (k + 0.5) * b;
+            const dxm = xm - xc;
+            const root = Math.sqrt(Math.max(0, R * R - dxm * dxm));
+            const h = Math.max(0, groundLevel(geom, xm) - (yc - root));
+            set.width[k] = b;
+            set.weight[k] = geom.gamma * h * b;
+            set.cohesion[k] = geom.c;
+            set.porePressure[k] = WATER_DENSITY * h * geom.satFrac;
+            set.sinAlpha[k] = dxm / R;
+            set.cosAlpha[k] = root / R;
+            set.tanPhi[k] = geom.tanPhi;
+            total += h;
+        }
+        return total > 0 ? n : 0;
+    }
+
+    // Ordinary Method of Slices (Fellenius) on a SliceSet
+    function ordinaryFoS(set) {
+        const { n, width, weight, cohesion, porePressure, sinAlpha, cosAlpha, tanPhi } = set;
+        let num = 0, den = 0;
+        for (let k = 0; k < n; k++) {
+            const cosA = cosAlpha[k] > 0.05 ? cosAlpha[k] : 0.05;
+            const l = width[k] / cosA;
+            num += cohesion[k] * l + Math.max(0, weight[k] * cosA - porePressure[k] * l) * tanPhi[k];
+            den += weight[k] * sinAlpha[k];
+        }
+        return den > 0 ? num / den : Infinity;
     }
 
     // ========================================================================
@@ -309,36 +1111,189 @@ const GeotechnicalEngine = (function () {
      * Where f₀ is a correction factor (typically 1.0–1.1)
      * Ref: Janbu (1973)
      * 
-     * @param {Array} slices
+     * @param {Object|Array} slices - SliceSet or array of slice objects
      * @param {number} f0 - Janbu correction factor
      * @returns {Object}
      */
     function janbuSimplified(slices, f0 = 1.05) {
+        const { n, width, weight, cohesion, porePressure, sinAlpha, cosAlpha, tanPhi } = toSliceSet(slices);
         let numerator = 0;
         let denominator = 0;
 
-        for (const slice of slices) {
-            const alpha_rad = slice.alpha * Math.PI / 180;
-            const phi_rad = slice.phi * Math.PI / 180;
-            const cos_alpha = Math.cos(alpha_rad);
+        for (let k = 0; k < n; k++) {
+            const cos_alpha = cosAlpha[k];
 
             if (cos_alpha === 0) continue;
 
-            numerator += (slice.cohesion * slice.width +
-                (slice.weight - slice.pore_pressure * slice.width) * Math.tan(phi_rad)) / cos_alpha;
+            numerator += (cohesion[k] * width[k] +
+                (weight[k] - porePressure[k] * width[k]) * tanPhi[k]) / cos_alpha;
 
-            denominator += slice.weight * Math.tan(alpha_rad);
+            denominator += weight[k] * sinAlpha[k] / cos_alpha;
         }
 
         const fos = denominator === 0 ? 10.0 : (f0 * numerator) / denominator;
 
         return {
-            fos: parseFloat(fos.toFixed(4)),
+            fos: roundTo(fos, 4),
             f0: f0,
             method: 'Janbu Simplified'
         };
     }
 
+    // ========================================================================
+    // C1. RIGOROUS LIMIT EQUILIBRIUM (SPENCER / MORGENSTERN-PRICE)
+    // ========================================================================
+    /**
+     * Spencer's method — force and moment equilibrium with parallel
+     * interslice forces (X = λ·E)
+     * Ref: Spencer (1967)
+     * 
+     * @param {Object|Array} slices - SliceSet or array of slice objects
+     * @param {Object} [options] - { initialFoS, maxIter, tolerance }
+     * @returns {Object} { fos, lambda, iterations, converged, interslice }
+     */
+    function spencerMethod(slices, options = {}) {
+        return rigorousLE(slices, 'constant', options, 'Spencer');
+    }
+
+    /**
+     * Morgenstern-Price method — force and moment equilibrium with
+     * X = λ·f(x)·E
+     * Ref: Morgenstern & Price (1965)
+     * 
+     * @param {Object|Array} slices - SliceSet or array of slice objects
+     * @param {Object} [options] - { interslice: 'half-sine' | 'constant',
+     *                               initialFoS, maxIter, tolerance }
+     * @returns {Object} { fos, lambda, iterations, converged, interslice }
+     */
+    function morgensternPrice(slices, options = {}) {
+        const fn = options.interslice || 'half-sine';
+        return rigorousLE(slices, fn, options, 'Morgenstern-Price (' + fn + ')');
+    }
+
+    /**
+     * Shared (FoS, λ) solver
+     * 
+     * Slices run from the toe (exit) to the crest (entry); the sliding mass
+     * moves toward the toe. For each slice, base-normal and base-tangential
+     * equilibrium with Mohr-Coulomb give the interslice recursion
+     * 
+     *   Φᵢ·Eᵢ = Φ'ᵢ·Eᵢ₋₁ + Rᵢ − F·Tᵢ
+     *   Rᵢ = c'ᵢ·lᵢ + (Wᵢ cos αᵢ − uᵢ·lᵢ)·tan φ'ᵢ,   Tᵢ = Wᵢ sin αᵢ
+     *   Φᵢ = F(cos αᵢ + λfᵢ sin αᵢ) + tan φ'ᵢ(sin αᵢ − λfᵢ cos αᵢ)
+     * 
+     * (Φ'ᵢ uses fᵢ₋₁). Moment equilibrium about each base midpoint, summed
+     * with zero thrust at both ends, eliminates the line of thrust
+     * (Zhu et al., 2005):
+     * 
+     *   Σ bᵢ[(Eᵢ + Eᵢ₋₁) tan αᵢ − λ(fᵢEᵢ + fᵢ₋₁Eᵢ₋₁)] = 0
+     * 
+     * With E₀ = 0, Newton's method drives (Eₙ, moment residual) to zero.
+     * The Jacobian is propagated through the recursion in forward mode,
+     * so each iteration is a single O(n) pass.
+     */
+    function rigorousLE(slices, fnType, options, label) {
+        const set = toSliceSet(slices);
+        const { n, width, weight, cohesion, porePressure, sinAlpha, cosAlpha, tanPhi } = set;
+        const { maxIter = 30, tolerance = 1e-6 } = options;
+
+        // Slice constants and interslice function at the n + 1 boundaries
+        const R = new Float64Array(n);
+        const T = new Float64Array(n);
+        const f = new Float64Array(n + 1);
+        let totalWidth = 0;
+        let scale = 0;
+        for (let k = 0; k < n; k++) {
+            const cosA = cosAlpha[k] > 0.05 ? cosAlpha[k] : 0.05;
+            const l = width[k] / cosA;
+            R[k] = cohesion[k] * l + (weight[k] * cosAlpha[k] - porePressure[k] * l) * tanPhi[k];
+            T[k] = weight[k] * sinAlpha[k];
+            totalWidth += width[k];
+            scale += Math.abs(T[k]);
+        }
+        let x = 0;
+        for (let k = 0; k <= n; k++) {
+            f[k] = fnType === 'half-sine' ? Math.sin(Math.PI * x / totalWidth) : 1;
+            if (k < n) x += width[k];
+        }
+        if (fnType === 'half-sine') { f[0] = 0; f[n] = 0; }
+
+        const E = new Float64Array(n + 1);
+        let F = options.initialFoS || bishopCore(set, 50, 1.5, 0.2).fos;
+        let lambda = 0;
+        let converged = false;
+        let iterations = 0;
+
+        if (!(scale > 0) || !isFinite(F)) {
+            return { fos: 10.0, lambda: 0, iterations: 0, converged: false, method: label };
+        }
+
+        for (let iter = 0; iter < maxIter; iter++) {
+            iterations = iter + 1;
+            // Forward pass: E, ∂E/∂F, ∂E/∂λ and the moment residual
+            let e = 0, eF = 0, eL = 0;
+            let M = 0, MF = 0, ML = 0;
+            let singular = false;
+            E[0] = 0;
+            for (let k = 0; k < n; k++) {
+                const s = sinAlpha[k], c = cosAlpha[k], t = tanPhi[k];
+                const fl = f[k], fr = f[k + 1];
+                const phiL = F * (c + lambda * fl * s) + t * (s - lambda * fl * c);
+                const phiR = F * (c + lambda * fr * s) + t * (s - lambda * fr * c);
+                if (Math.abs(phiR) < 1e-9) { singular = true; break; }
+
+                const num = phiL * e + R[k] - F * T[k];
+                const numF = (c + lambda * fl * s) * e + phiL * eF - T[k];
+                const numL = fl * (F * s - t * c) * e + phiL * eL;
+                const eNew = num / phiR;
+                const eNewF = (numF - eNew * (c + lambda * fr * s)) / phiR;
+                const eNewL = (numL - eNew * fr * (F * s - t * c)) / phiR;
+
+                const tanA = s / (c > 0.05 ? c : 0.05);
+                const b = width[k];
+                M += b * ((eNew + e) * tanA - lambda * (fr * eNew + fl * e));
+                MF += b * ((eNewF + eF) * tanA - lambda * (fr * eNewF + fl * eF));
+                ML += b * ((eNewL + eL) * tanA - (fr * eNew + fl * e) - lambda * (fr * eNewL + fl * eL));
+
+                e = eNew; eF = eNewF; eL = eNewL;
+                E[k + 1] = e;
+            }
+            if (singular) break;
+
+            // Newton step on [Eₙ, M] = 0
+            const det = eF * ML - eL * MF;
+            if (!isFinite(det) || Math.abs(det) < 1e-300) break;
+            let dF = -(e * ML - eL * M) / det;
+            let dL = -(eF * M - e * MF) / det;
+
+            // Damp large steps and keep FoS positive
+            const damp = Math.min(1, 0.5 * F / Math.max(Math.abs(dF), 1e-12), 0.5 / Math.max(Math.abs(dL), 1e-12));
+            dF *= damp;
+            dL *= damp;
+            F += dF;
+            lambda += dL;
+
+            if (damp === 1 && Math.abs(dF) < tolerance * F && Math.abs(dL) < tolerance &&
+                Math.abs(e) < 1e-6 * scale) {
+                converged = true;
+                break;
+            }
+        }
+
+        // Interslice shear from the final E distribution
+        const X = new Float64Array(n + 1);
+        for (let k = 0; k <= n; k++) X[k] = lambda * f[k] * E[k];
+
+        return {
+            fos: roundTo(Math.min(F, 10), 4),
+            lambda: roundTo(lambda, 4),
+            iterations: iterations,
+            converged: converged,
+            interslice: { normal: E, shear: X, fn: fnType },
+            method: label
+        };
+    }
+
     // ========================================================================
     // D. HYDROLOGICAL MODELS
     // ========================================================================
@@ -349,6 +1304,13 @@ const GeotechnicalEngine = (function () {
      * 
      * F(t) = K·t + ψ·Δθ·ln(1 + F(t)/(ψ·Δθ))
      * f(t) = K·(1 + ψ·Δθ/F(t))
+     *
+     * Closed-form solution with ponding (Mein & Larson, 1973):
+     *   before ponding  F = F₀ + r·t                (all rain infiltrates)
+     *   ponding depth   Fp = K·ψΔθ / (r − K),  tp = (Fp − F₀) / r
+     *   after ponding   F solved from the Green-Ampt relation via the
+     *                   lower branch of the Lambert W function
+     * Cost is O(hours) — one evaluation per recorded hour.
      * 
      * @param {Object} params
      * @returns {Object}
@@ -363,49 +1325,96 @@ const GeotechnicalEngine = (function () {
             duration = 24       // hours
         } = params;
 
-        const delta_theta = theta_s - theta_i;
+        const S = psi * Math.max(0, theta_s - theta_i);
         const rainfall_ms = rainfall_rate / (1000 * 3600); // Convert mm/hr to m/s
-        const dt = 60; // Time step: 60 seconds
-        const totalSteps = Math.floor(duration * 3600 / dt);
-
-        let F = 0.001; // Cumulative infiltration (m)
-        let infiltrationHistory = [];
-        let saturationTime = null;
-
-        for (let step = 0; step < totalSteps; step++) {
-            const t = step * dt;
-            // Infiltration capacity
-            const f_capacity = K * (1 + (psi * delta_theta) / F);
-
-            // Actual infiltration
+        const pond = greenAmptPonding(K, S, rainfall_ms);
+        const totalSeconds = duration * 3600;
+
+        const infiltrationHistory = [];
+        const hours = Math.ceil(Math.floor(totalSeconds / 60) / 60); // Record hourly
+        for (let h = 0; h < hours; h++) {
+            const t = h * 3600;
+            const F = greenAmptCumulative(K, S, rainfall_ms, t, pond);
+            const f_capacity = S > 0 ? K * (1 + S / F) : K;
             const f_actual = Math.min(f_capacity, rainfall_ms);
-            F += f_actual * dt;
-
-            if (step % 60 === 0) { // Record hourly
-                infiltrationHistory.push({
-                    time_hr: t / 3600,
-                    infiltration_rate_mmhr: f_actual * 1000 * 3600,
-                    cumulative_mm: F * 1000,
-                    capacity_mmhr: f_capacity * 1000 * 3600
-                });
-            }
-
-            // Check if surface saturates
-            if (f_capacity <= rainfall_ms && saturationTime === null) {
-                saturationTime = t / 3600; // hours
-            }
+            infiltrationHistory.push({
+                time_hr: h,
+                infiltration_rate_mmhr: f_actual * 1000 * 3600,
+                cumulative_mm: F * 1000,
+                capacity_mmhr: f_capacity * 1000 * 3600
+            });
         }
 
+        const F = greenAmptCumulative(K, S, rainfall_ms, totalSeconds, pond);
+        const saturationTime = pond.tp !== null && pond.tp < totalSeconds ? pond.tp / 3600 : null;
+
         return {
-            cumulative_infiltration_mm: parseFloat((F * 1000).toFixed(2)),
-            final_rate_mmhr: parseFloat((infiltrationHistory[infiltrationHistory.length - 1]?.infiltration_rate_mmhr || 0).toFixed(3)),
-            saturation_time_hr: saturationTime ? parseFloat(saturationTime.toFixed(1)) : null,
+            cumulative_infiltration_mm: roundTo(F * 1000, 2),
+            final_rate_mmhr: roundTo(infiltrationHistory[infiltrationHistory.length - 1]?.infiltration_rate_mmhr || 0, 3),
+            saturation_time_hr: saturationTime !== null ? roundTo(saturationTime, 1) : null,
             runoff_onset: saturationTime !== null,
             history: infiltrationHistory,
             method: 'Green-Ampt Infiltration Model'
         };
     }
 
+    const GA_INITIAL_F = 0.001; // m — initial cumulative infiltration
+
+    /**
+     * Ponding state for constant rainfall
+     * @returns {Object} { Fp, tp } — tp is null when the surface never ponds
+     */
+    function greenAmptPonding(K, S, rain) {
+        if (rain <= K) return { Fp: Infinity, tp: null };
+        if (S <= 0) return { Fp: GA_INITIAL_F, tp: 0 };
+        const Fp = Math.max(GA_INITIAL_F, K * S / (rain - K));
+        return { Fp: Fp, tp: (Fp - GA_INITIAL_F) / rain };
+    }
+
+    /**
+     * Cumulative Green-Ampt infiltration F(t) in metres (numeric core,
+     * no formatting — safe to call inside Monte Carlo and forecast loops)
+     *
+     * @param {number} K - Hydraulic conductivity (m/s)
+     * @param {number} S - ψ·Δθ (m)
+     * @param {number} rain - Rainfall rate (m/s)
+     * @param {number} t - Time since rainfall onset (s)
+     * @param {Object} [pond] - Precomputed greenAmptPonding(K, S, rain)
+     * @returns {number}
+     */
+    function greenAmptCumulative(K, S, rain, t, pond) {
+        const p = pond || greenAmptPonding(K, S, rain);
+        if (p.tp === null || t <= p.tp) return GA_INITIAL_F + rain * t;
+        if (S <= 0) return p.Fp + K * (t - p.tp);
+
+        // (S + F) − S·ln(S + F) = K·(t − tp) + (S + Fp) − S·ln(S + Fp)
+        // ⇒ S + F = −S·W₋₁(−e^(−A/S) / S), evaluated in log space
+        const A = K * (t - p.tp) + (S + p.Fp) - S * Math.log(S + p.Fp);
+        const w = lambertWm1Log(-A / S - Math.log(S));
+        return Math.max(p.Fp, -S * w - S);
+    }
+
+    /**
+     * Lower branch W₋₁ of the Lambert W function, with the argument given
+     * as its logarithm: solves w + ln(−w) = L for w ≤ −1 (L ≤ −1).
+     * Working in log space avoids underflow of e^(−A/S) for long storms.
+     */
+    function lambertWm1Log(L) {
+        if (L >= -1) return -1;
+        // Asymptotic starting guess, then Newton on g(w) = w + ln(−w) − L
+        let w = L - Math.log(-L);
+        if (w > -1.0001) w = -1.0001;
+        for (let i = 0; i < 20; i++) {
+            const g = w + Math.log(-w) - L;
+            const step = g / (1 + 1 / w);
+            let wn = w - step;
+            if (wn >= -1) wn = (w - 1) / 2;
+            if (Math.abs(wn - w) < 1e-12 * Math.abs(w)) return wn;
+            w = wn;
+        }
+        return w;
+    }
+
     /**
      * Pore Pressure Ratio (ru) Calculator
      * ru = u / (γ × z)
@@ -438,6 +1447,29 @@ const GeotechnicalEngine = (function () {
         return Math.log(upslopeArea / tanBeta);
     }
 
+    const ID_STATUS = [
+        'SAFE',
+        'CAUTION — Approaching Regional Threshold',
+        'WARNING — Exceeds Himalayan Regional Threshold',
+        'CRITICAL — Exceeds Global Threshold'
+    ];
+
+    function caineThreshold(duration_hr) {
+        return 14.82 * Math.pow(duration_hr, -0.39);
+    }
+
+    function himalayanThreshold(duration_hr) {
+        return 9.0 * Math.pow(duration_hr, -0.25);
+    }
+
+    // 0 safe, 1 caution (≥ 70% of regional), 2 regional exceeded, 3 global exceeded
+    function idThresholdLevel(intensity, thresholdCaine, thresholdHimalaya) {
+        if (intensity > thresholdCaine) return 3;
+        if (intensity > thresholdHimalaya) return 2;
+        if (intensity > thresholdHimalaya * 0.7) return 1;
+        return 0;
+    }
+
     /**
      * Rainfall Intensity-Duration Threshold Check
      * 
@@ -449,31 +1481,20 @@ const GeotechnicalEngine = (function () {
      * @returns {Object}
      */
     function checkIDThreshold(intensity_mmhr, duration_hr) {
-        const threshold_caine = 14.82 * Math.pow(duration_hr, -0.39);
-        const threshold_himalaya = 9.0 * Math.pow(duration_hr, -0.25);
-
-        let status = 'SAFE';
-        let level = 0;
-        if (intensity_mmhr > threshold_caine) {
-            status = 'CRITICAL — Exceeds Global Threshold';
-            level = 3;
-        } else if (intensity_mmhr > threshold_himalaya) {
-            status = 'WARNING — Exceeds Himalayan Regional Threshold';
-            level = 2;
-        } else if (intensity_mmhr > threshold_himalaya * 0.7) {
-            status = 'CAUTION — Approaching Regional Threshold';
-            level = 1;
-        }
+        const threshold_caine = caineThreshold(duration_hr);
+        const threshold_himalaya = himalayanThreshold(duration_hr);
+        const level = idThresholdLevel(intensity_mmhr, threshold_caine, threshold_himalaya);
+        const status = ID_STATUS[level];
 
         return {
-            threshold_caine: parseFloat(threshold_caine.toFixed(3)),
-            threshold_himalaya: parseFloat(threshold_himalaya.toFixed(3)),
+            threshold_caine: roundTo(threshold_caine, 3),
+            threshold_himalaya: roundTo(threshold_himalaya, 3),
             current_intensity: intensity_mmhr,
             current_duration: duration_hr,
             status: status,
             level: level,
-            exceedance_pct_global: parseFloat(((intensity_mmhr / threshold_caine) * 100).toFixed(1)),
-            exceedance_pct_regional: parseFloat(((intensity_mmhr / threshold_himalaya) * 100).toFixed(1))
+            exceedance_pct_global: roundTo((intensity_mmhr / threshold_caine) * 100, 1),
+            exceedance_pct_regional: roundTo((intensity_mmhr / threshold_himalaya) * 100, 1)
         };
     }
 
@@ -488,13 +1509,1185 @@ const GeotechnicalEngine = (function () {
 
         for (let d = 1; d <= 72; d += 0.5) {
             durations.push(d);
-            caine.push(14.82 * Math.pow(d, -0.39));
-            himalaya.push(9.0 * Math.pow(d, -0.25));
+            caine.push(caineThreshold(d));
+            himalaya.push(himalayanThreshold(d));
         }
 
         return { durations, caine, himalaya };
     }
 
+    // ========================================================================
+    // D1. TRANSIENT INFILTRATION (IVERSON / TRIGRS)
+    // ========================================================================
+
+    const TRANSIENT_DEPTH_NODES = 50;
+    const TRANSIENT_DIFFUSIVITY_RATIO = 200;  // D0 ≈ Ks / C0, C0 ≈ 0.005 m⁻¹
+
+    /**
+     * Transient pore pressure and FoS over depth and time from an hourly
+     * rainfall series — Iverson (2000) linearized Richards solution for a
+     * tension-saturated infinite slope, as implemented in TRIGRS (Baum et
+     * al., 2002):
+     *
+     *   ψ(Z,t) = (Z − d)·β + 2 Σn (In/Ks) [G(Z, t − tn) − G(Z, t − tn+1)]
+     *   G(Z,τ) = √(D1·τ) · ierfc(Z / 2√(D1·τ)),   β = cos²δ − Iss/Ks,
+     *   D1 = D0 / cos²δ,   ψ ≤ Z·β
+     *
+     *   FoS(Z,t) = tan φ'/tan δ + (c' − ψ·γw·tan φ') / (γ·Z·sin δ·cos δ)
+     *
+     * With uniform hourly pulses G depends only on the lag, so G is tabulated
+     * once per (lag, depth) and ψ becomes a discrete convolution of the wet
+     * hours with ΔG over the depth grid — plain multiply-adds on typed
+     * arrays. Rain above Ks runs off. Suction (ψ < 0) is ignored in the
+     * strength term, which keeps FoS conservative above the water table.
+     *
+     * The initial water table sits at d = depth·(1 − saturation/100), the
+     * same water column the static Infinite Slope model assumes.
+     *
+     * @param {Object} params - { cohesion, frictionAngle, unitWeight, slopeAngle,
+     *   depth, saturation, permeability (m/s), diffusivity (m²/s), steadyFlux (m/s),
+     *   rootCohesion }
+     * @param {ArrayLike<number>} rainfall - Hourly rainfall depths (mm)
+     * @param {Object} [options]
+     * @param {number} [options.nz=50] - Depth nodes (Δz = depth / nz)
+     * @param {boolean} [options.grid=true] - Return the full FoS / ψ grids
+     * @returns {Object} Per-hour minimum FoS and critical depth (aligned with
+     *   the rainfall series, state at the end of each hour), plus the grids
+     */
+    function transientPorePressure(params, rainfall, options = {}) {
+        const {
+            cohesion = 10,
+            frictionAngle = 30,
+            unitWeight = 19,
+            slopeAngle = 35,
+            depth = DEFAULT_DEPTH,
+            saturation = 50,
+            permeability = 1e-5,
+            diffusivity = permeability * TRANSIENT_DIFFUSIVITY_RATIO,
+            steadyFlux = 0,
+            rootCohesion = 0
+        } = params;
+        const { nz = TRANSIENT_DEPTH_NODES, grid = true } = options;
+
+        const nt = rainfall.length;
+        const dt = 3600;
+        const delta = slopeAngle * Math.PI / 180;
+        const cos2 = Math.cos(delta) * Math.cos(delta);
+        const beta = cos2 - Math.min(steadyFlux, permeability) / permeability;
+        const D1 = diffusivity / cos2;
+        const d = depth * (1 - saturation / 100);
+        const tanPhi = Math.tan(frictionAngle * Math.PI / 180);
+        const frictional = tanPhi / Math.tan(delta);
+        const c = cohesion + rootCohesion;
+        const normal = unitWeight * Math.sin(delta) * Math.cos(delta);
+
+        const depths = new Float64Array(nz);
+        for (let k = 0; k < nz; k++) depths[k] = depth * (k + 1) / nz;
+
+        // ΔG(lag) = G(lag) − G(lag − 1) per depth node, G(0) = 0
+        const dG = new Float64Array((nt + 1) * nz);
+        let prev = new Float64Array(nz);
+        let curr = new Float64Array(nz);
+        for (let lag = 1; lag <= nt; lag++) {
+            const s = Math.sqrt(D1 * lag * dt);
+            for (let k = 0; k < nz; k++) {
+                const eta = depths[k] / (2 * s);
+                curr[k] = s * (Math.exp(-eta * eta) / Math.sqrt(Math.PI) - eta * erfc(eta));
+                dG[lag * nz + k] = curr[k] - prev[k];
+            }
+            const swap = prev; prev = curr; curr = swap;
+        }
+
+        // Infiltrating pulses as 2·In/Ks (dry hours contribute nothing)
+        const wet = [];
+        const weight = [];
+        for (let n = 0; n < nt; n++) {
+            const I = Math.min((rainfall[n] || 0) / 1000 / dt, permeability);
+            if (I > 0) {
+                wet.push(n);
+                weight.push(2 * I / permeability);
+            }
+        }
+
+        const psiGrid = grid ? new Float64Array(nt * nz) : null;
+        const fosGrid = grid ? new Float64Array(nt * nz) : null;
+        const minFoS = new Float64Array(nt);
+        const criticalDepth = new Float64Array(nt);
+        const psi = new Float64Array(nz);
+
+        const fosAt = (k, p) => Math.min(10,
+            frictional + (c - Math.max(0, p) * WATER_DENSITY * tanPhi) / (normal * depths[k]));
+
+        // Initial (steady) state
+        let initialFoS = Infinity;
+        for (let k = 0; k < nz; k++) {
+            initialFoS = Math.min(initialFoS, fosAt(k, (depths[k] - d) * beta));
+        }
+
+        for (let j = 1; j <= nt; j++) {
+            for (let k = 0; k < nz; k++) psi[k] = (depths[k] - d) * beta;
+            for (let w = 0; w < wet.length && wet[w] < j; w++) {
+                const base = (j - wet[w]) * nz;
+                const a = weight[w];
+                for (let k = 0; k < nz; k++) psi[k] += a * dG[base + k];
+            }
+            let best = Infinity, bestK = 0;
+            const row = (j - 1) * nz;
+            for (let k = 0; k < nz; k++) {
+                const cap = depths[k] * beta;
+                if (psi[k] > cap) psi[k] = cap;
+                const f = fosAt(k, psi[k]);
+                if (f < best) { best = f; bestK = k; }
+                if (grid) {
+                    psiGrid[row + k] = psi[k];
+                    fosGrid[row + k] = f;
+                }
+            }
+            minFoS[j - 1] = best;
+            criticalDepth[j - 1] = depths[bestK];
+        }
+
+        let worst = 0, failureHour = null;
+        for (let j = 0; j < nt; j++) {
+            if (minFoS[j] < minFoS[worst]) worst = j;
+            if (failureHour === null && minFoS[j] < 1) failureHour = j;
+        }
+
+        return {
+            hours: nt,
+            depths: depths,
+            minFoS: minFoS,
+            criticalDepth: criticalDepth,
+            fos: fosGrid,
+            pressureHead: psiGrid,
+            initialFoS: roundTo(initialFoS, 4),
+            minimumFoS: nt > 0 ? roundTo(minFoS[worst], 4) : roundTo(initialFoS, 4),
+            criticalHour: nt > 0 ? worst : null,
+            criticalDepth_m: nt > 0 ? roundTo(criticalDepth[worst], 2) : null,
+            failureHour: failureHour,
+            waterTableDepth: roundTo(d, 2),
+            diffusivity: diffusivity,
+            method: 'Iverson (2000) transient infiltration (TRIGRS)'
+        };
+    }
+
+    // ========================================================================
+    // D2. UNSATURATED FLOW (RICHARDS EQUATION)
+    // ========================================================================
+
+    const RICHARDS_NODES = 100;
+    const RICHARDS_SOIL_TYPES = ['residual_soil', 'colluvial_deposit'];
+    const RICHARDS_DESIGN_HOURS = 168;       // design-storm forecast window (7 days)
+    const RICHARDS_DT_MIN = 1;               // s
+    const RICHARDS_DT_MAX = 3600;            // s
+    const SPECIFIC_STORAGE = 1e-4;           // 1/m — keeps saturated nodes well-posed
+    const VG_AIR_ENTRY = -0.02;              // m — Vogel et al. (2001) air-entry head
+
+    /**
+     * van Genuchten (1980) soil-water characteristic curve with Mualem (1976)
+     * relative conductivity, in the air-entry form of Vogel, van Genuchten &
+     * Cislerova (2001): the curve is shifted so the soil is saturated for
+     * h ≥ hs (−2 cm by default), which removes the near-vertical drop in K
+     * just below saturation for n < 2 and keeps implicit solvers stable
+     *
+     *   Se = [1 + (α|h|)ⁿ]^(−m) / Sc,  m = 1 − 1/n,  Sc = [1 + (α|hs|)ⁿ]^(−m)
+     *   θ  = θr + (θs − θr)·Se,  C = dθ/dh
+     *   Kr = √Se · [(1 − F(Se)) / (1 − F(1))]²,  F(Se) = [1 − (Se·Sc)^(1/m)]^m
+     *
+     * Heads above hs are saturated: θ = θs + Ss·(h − hs), C = Ss, Kr = 1.
+     *
+     * @param {Object} swcc - { thetaR, thetaS, alpha (1/m), n, airEntry (m) }
+     * @param {number} h - Pressure head (m, negative = suction)
+     * @returns {Object} { theta, capacity (1/m), Se, kr }
+     */
+    function vanGenuchten(swcc, h) {
+        const vg = vanGenuchtenConstants(swcc, swcc.thetaS);
+        if (h >= vg.airEntry) {
+            return { theta: vg.thetaS + SPECIFIC_STORAGE * (h - vg.airEntry), capacity: SPECIFIC_STORAGE, Se: 1, kr: 1 };
+        }
+        const ah = -vg.alpha * h;
+        const x = Math.pow(ah, vg.n);
+        const s = Math.pow(1 + x, -vg.m);
+        const t = (1 - x * s / ah) / (1 - vg.f1);     // (x / (1 + x))^m = x·s / (α|h|)
+        return {
+            theta: vg.thetaR + (vg.thetaM - vg.thetaR) * s,
+            capacity: (vg.thetaM - vg.thetaR) * vg.m * vg.n * x * s / ((1 + x) * -h),
+            Se: s / vg.sc,
+            kr: Math.sqrt(s / vg.sc) * t * t
+        };
+    }
+
+    // Curve constants shared by vanGenuchten() and the Richards solver
+    function vanGenuchtenConstants(swcc, thetaS) {
+        const { thetaR, alpha, n, airEntry = VG_AIR_ENTRY } = swcc;
+        const m = 1 - 1 / n;
+        const as = -alpha * airEntry;
+        const xs = Math.pow(as, n);
+        const sc = Math.pow(1 + xs, -m);
+        return {
+            thetaR, thetaS, alpha, n, m, airEntry, sc,
+            thetaM: thetaR + (thetaS - thetaR) / sc,
+            f1: as > 0 ? xs * sc / as : 0
+        };
+    }
+
+    /**
+     * Solve a tridiagonal system in place (Thomas algorithm)
+     * a = sub-diagonal, b = diagonal, c = super-diagonal, d = right-hand side;
+     * the solution overwrites d, c is used as scratch.
+     */
+    function solveTridiagonal(a, b, c, d, n) {
+        c[0] /= b[0];
+        d[0] /= b[0];
+        for (let i = 1; i < n; i++) {
+            const w = 1 / (b[i] - a[i] * c[i - 1]);
+            c[i] *= w;
+            d[i] = (d[i] - a[i] * d[i - 1]) * w;
+        }
+        for (let i = n - 2; i >= 0; i--) d[i] -= c[i] * d[i + 1];
+        return d;
+    }
+
+    /**
+     * Unsaturated infiltration and FoS over depth and time — 1-D Richards
+     * equation in the slope-normal column of an infinite slope (the
+     * unsaturated form used by TRIGRS; Baum et al., 2008):
+     *
+     *   ∂θ/∂t = ∂/∂Z [ K(ψ) (∂ψ/∂Z / cos²δ − 1) ]
+     *
+     * with the van Genuchten–Mualem soil-water curve. Discretised by cell-
+     * centred finite differences and backward Euler in the mixed form with
+     * modified Picard iteration (Celia et al., 1990), which conserves mass;
+     * each iteration is one Thomas solve on preallocated arrays. The step
+     * adapts to the iteration count (×1.3 when ≤ 3, ×0.7 when > 7, halved
+     * on non-convergence) and lands on every hour boundary.
+     *
+     * The surface takes the rainfall flux until it ponds, then holds ψ = 0
+     * (the excess runs off). The base is impermeable (water table rises) or
+     * drained (head held at its initial value). The initial profile is
+     * hydrostatic about a water table at d = depth·(1 − saturation/100).
+     *
+     * Shear strength follows Fredlund et al. (1978): below the water table
+     * pore pressure reduces σ' as usual, above it matric suction adds
+     * s·tan φᵇ to the cohesion (φᵇ defaults to φ'/2):
+     *
+     *   FoS(Z,t) = tan φ'/tan δ + (c' − γw·ψ·tan φ*) / (γ·Z·sin δ·cos δ),
+     *   φ* = φ' for ψ > 0, φᵇ for ψ < 0
+     *
+     * @param {Object} params - { cohesion, frictionAngle, unitWeight, slopeAngle,
+     *   depth, saturation, permeability (m/s), porosity, swcc { thetaR, alpha, n },
+     *   suctionFrictionAngle, rootCohesion }
+     * @param {ArrayLike<number>} rainfall - Hourly rainfall depths (mm)
+     * @param {Object} [options]
+     * @param {number} [options.nz=100] - Nodes from surface to base
+     * @param {string} [options.base='impermeable'] - 'impermeable' | 'drained'
+     * @param {number} [options.tolerance=1e-3] - Picard head tolerance (m)
+     * @param {number} [options.thetaTolerance=1e-4] - Picard water content tolerance
+     * @param {boolean} [options.grid=true] - Return the full FoS / ψ grids
+     * @returns {Object} Per-hour minimum FoS, critical depth and water table
+     *   (state at the end of each hour), mass balance and solver statistics
+     */
+    function richardsInfiltration(params, rainfall, options = {}) {
+        const {
+            cohesion = 10,
+            frictionAngle = 30,
+            unitWeight = 19,
+            slopeAngle = 35,
+            depth = DEFAULT_DEPTH,
+            saturation = 50,
+            permeability = 1e-5,
+            porosity = 0.4,
+            swcc = SOIL_DATABASE.residual_soil.swcc,
+            suctionFrictionAngle = frictionAngle / 2,
+            rootCohesion = 0
+        } = params;
+        const {
+            nz = RICHARDS_NODES,
+            base = 'impermeable',
+            tolerance = 1e-3,
+            thetaTolerance = 1e-4,
+            maxIterations = 20,
+            grid = true
+        } = options;
+
+        const nt = rainfall.length;
+        const delta = slopeAngle * Math.PI / 180;
+        const cos2 = Math.cos(delta) * Math.cos(delta);
+        const d = depth * (1 - saturation / 100);
+        const dz = depth / (nz - 1);
+        const drained = base === 'drained';
+
+        // Soil-water curve constants
+        const vg = vanGenuchtenConstants(swcc, porosity);
+        const { thetaR, thetaS, thetaM, alpha, airEntry } = vg;
+        const vgN = vg.n, vgM = vg.m, invSc = 1 / vg.sc, invF1 = 1 / (1 - vg.f1);
+
+        // Strength constants
+        const tanPhi = Math.tan(frictionAngle * Math.PI / 180);
+        const tanPhiB = Math.tan(suctionFrictionAngle * Math.PI / 180);
+        const frictional = tanPhi / Math.tan(delta);
+        const c = cohesion + rootCohesion;
+        const normal = unitWeight * Math.sin(delta) * Math.cos(delta);
+
+        // Preallocated state and work arrays
+        const depths = new Float64Array(nz);
+        const h = new Float64Array(nz);
+        const hOld = new Float64Array(nz);
+        const theta = new Float64Array(nz);
+        const thetaOld = new Float64Array(nz);
+        const thetaIt = new Float64Array(nz);
+        const cap = new Float64Array(nz);
+        const K = new Float64Array(nz);
+        const Kf = new Float64Array(nz);     // face conductivity between k and k+1
+        const A = new Float64Array(nz);
+        const B = new Float64Array(nz);
+        const C = new Float64Array(nz);
+        const R = new Float64Array(nz);
+
+        for (let k = 0; k < nz; k++) {
+            depths[k] = k * dz;
+            h[k] = (depths[k] - d) * cos2;
+        }
+
+        // θ, C and K at node k for the current head
+        const evaluate = k => {
+            const hk = h[k];
+            if (hk >= airEntry) {
+                theta[k] = thetaS + SPECIFIC_STORAGE * (hk - airEntry);
+                cap[k] = SPECIFIC_STORAGE;
+                K[k] = permeability;
+                return;
+            }
+            // (x / (1 + x))^m = x·s / (α|h|), so two powers suffice (exp/log
+            // is about twice as fast as Math.pow here)
+            const ah = -alpha * hk;
+            const x = Math.exp(vgN * Math.log(ah));
+            const s = Math.exp(-vgM * Math.log(1 + x));
+            const t = (1 - x * s / ah) * invF1;
+            theta[k] = thetaR + (thetaM - thetaR) * s;
+            cap[k] = (thetaM - thetaR) * vgM * vgN * x * s / ((1 + x) * -hk) + SPECIFIC_STORAGE;
+            K[k] = permeability * Math.sqrt(s * invSc) * t * t;
+        };
+        const evaluateAll = () => {
+            for (let k = 0; k < nz; k++) evaluate(k);
+            for (let k = 0; k < nz - 1; k++) Kf[k] = 0.5 * (K[k] + K[k + 1]);
+        };
+        // Flux term K(∂ψ/∂Z / cos²δ − 1) across face k+½ (negative = downward)
+        const faceFlux = k => Kf[k] * ((h[k + 1] - h[k]) / (dz * cos2) - 1);
+        const storage = () => {
+            let s = 0.5 * (theta[0] + theta[nz - 1]);
+            for (let k = 1; k < nz - 1; k++) s += theta[k];
+            return s * dz;
+        };
+
+        evaluateAll();
+        const initialStorage = storage();
+        const initialPressureHead = Float64Array.from(h);
+
+        /**
+         * One backward-Euler step of length dt under surface flux q (m/s),
+         * or with the surface held at ψ = 0 when `ponded`. Expects θ, C, K
+         * evaluated at the current head and leaves them evaluated at the
+         * result. A node has converged when its head change is below
+         * `tolerance`, or — if unsaturated — its water content change is
+         * below `thetaTolerance` (as in HYDRUS). Updates are capped for dry
+         * nodes and halved after four iterations to break Picard cycles.
+         * @returns {number} Picard iterations, or −1 if not converged
+         */
+        const step = (dt, q, ponded) => {
+            if (ponded && h[0] !== 0) {
+                h[0] = 0;
+                evaluate(0);
+                Kf[0] = 0.5 * (K[0] + K[1]);
+            }
+            const g = 1 / (dz * dz * cos2);
+            for (let it = 1; it <= maxIterations; it++) {
+                // Surface node (half cell)
+                if (ponded) {
+                    A[0] = 0; B[0] = 1; C[0] = 0; R[0] = 0;
+                } else {
+                    A[0] = 0;
+                    C[0] = -2 * Kf[0] * g;
+                    B[0] = cap[0] / dt - C[0];
+                    R[0] = 2 * (faceFlux(0) + q) / dz - (theta[0] - thetaOld[0]) / dt;
+                }
+                // Interior nodes
+                for (let k = 1; k < nz - 1; k++) {
+                    A[k] = -Kf[k - 1] * g;
+                    C[k] = -Kf[k] * g;
+                    B[k] = cap[k] / dt - A[k] - C[k];
+                    R[k] = (faceFlux(k) - faceFlux(k - 1)) / dz - (theta[k] - thetaOld[k]) / dt;
+                }
+                // Base node
+                const nb = nz - 1;
+                if (drained) {
+                    A[nb] = 0; B[nb] = 1; C[nb] = 0; R[nb] = 0;
+                } else {
+                    A[nb] = -2 * Kf[nb - 1] * g;
+                    C[nb] = 0;
+                    B[nb] = cap[nb] / dt - A[nb];
+                    R[nb] = -2 * faceFlux(nb - 1) / dz - (theta[nb] - thetaOld[nb]) / dt;
+                }
+
+                solveTridiagonal(A, B, C, R, nz);
+                thetaIt.set(theta);
+                let finite = true;
+                const relax = it > 4 ? 0.5 : 1;     // break Picard 2-cycles near saturation
+                for (let k = 0; k < nz; k++) {
+                    // Damp large updates (dry nodes overshoot on the first iterations)
+                    const limit = 0.5 + 0.5 * Math.abs(h[k]);
+                    R[k] *= relax;
+                    if (R[k] > limit) R[k] = limit;
+                    else if (R[k] < -limit) R[k] = -limit;
+                    else if (!(R[k] === R[k])) finite = false;
+                    h[k] += R[k];
+                }
+                if (!finite) return -1;
+                evaluateAll();
+
+                let converged = true;
+                for (let k = 0; k < nz; k++) {
+                    const dh = Math.abs(R[k]);
+                    if (dh >= tolerance && !(h[k] < 0 && dh < 10 * tolerance &&
+                        Math.abs(theta[k] - thetaIt[k]) < thetaTolerance)) {
+                        converged = false;
+                        break;
+                    }
+                }
+                if (converged) return it;
+            }
+            return -1;
+        };
+        const restore = () => {
+            h.set(hOld);
+            evaluateAll();
+        };
+
+        const psiGrid = grid ? new Float64Array(nt * nz) : null;
+        const fosGrid = grid ? new Float64Array(nt * nz) : null;
+        const minFoS = new Float64Array(nt);
+        const criticalDepth = new Float64Array(nt);
+        const waterTable = new Float64Array(nt);
+
+        const fosAt = (k, p) => Math.min(10,
+            frictional + (c - p * WATER_DENSITY * (p > 0 ? tanPhi : tanPhiB)) / (normal * depths[k]));
+
+        let initialFoS = Infinity;
+        for (let k = 1; k < nz; k++) initialFoS = Math.min(initialFoS, fosAt(k, h[k]));
+
+        let dt = 60;
+        let ponded = false;
+        let steps = 0, iterations = 0, rejected = 0, unconverged = 0;
+        let infiltrated = 0, rained = 0, drainedOut = 0;
+
+        for (let j = 0; j < nt; j++) {
+            const q = Math.max(0, rainfall[j] || 0) / 1000 / 3600;
+            rained += q * 3600;
+            let elapsed = 0;
+            while (elapsed < 3600) {
+                const span = Math.min(dt, 3600 - elapsed);
+                hOld.set(h);
+                thetaOld.set(theta);
+
+                // Keep last step's surface condition unless this step violates it
+                let surfacePonded = ponded;
+                let iters = step(span, q, surfacePonded);
+                if (!surfacePonded && (iters < 0 || h[0] > 0)) {
+                    restore();
+                    surfacePonded = true;
+                    iters = step(span, q, true);
+                } else if (surfacePonded && iters > 0) {
+                    if (0.5 * dz * (theta[0] - thetaOld[0]) / span - faceFlux(0) > q) {
+                        restore();
+                        surfacePonded = false;
+                        iters = step(span, q, false);
+                    }
+                }
+
+                if (iters < 0) {
+                    if (span > RICHARDS_DT_MIN) {
+                        restore();
+                        rejected++;
+                        dt = Math.max(RICHARDS_DT_MIN, span / 2);
+                        continue;
+                    }
+                    // Cannot shrink further: keep the last iterate (shows in the mass balance)
+                    if (!(h[0] === h[0])) restore();
+                    unconverged++;
+                    iters = maxIterations;
+                }
+
+                // Accept — boundary fluxes from the half-cell balances
+                infiltrated += surfacePonded
+                    ? 0.5 * dz * (theta[0] - thetaOld[0]) - faceFlux(0) * span
+                    : q * span;
+                if (drained) {
+                    drainedOut -= 0.5 * dz * (theta[nz - 1] - thetaOld[nz - 1]) + faceFlux(nz - 2) * span;
+                }
+                ponded = surfacePonded;
+                elapsed += span;
+                steps++;
+                iterations += iters;
+                if (iters <= 3) dt = Math.min(RICHARDS_DT_MAX, dt * 1.3);
+                else if (iters > 7) dt = Math.max(RICHARDS_DT_MIN, dt * 0.7);
+            }
+
+            // End-of-hour state: FoS over depth, shallowest continuous water table
+            let best = Infinity, bestK = 1;
+            const row = j * nz;
+            for (let k = 1; k < nz; k++) {
+                const f = fosAt(k, h[k]);
+                if (f < best) { best = f; bestK = k; }
+                if (grid) {
+                    psiGrid[row + k] = h[k];
+                    fosGrid[row + k] = f;
+                }
+            }
+            if (grid) {
+                psiGrid[row] = h[0];
+                fosGrid[row] = NaN;
+            }
+            let wt = nz - 1;
+            if (h[wt] < 0) {
+                waterTable[j] = NaN;
+            } else {
+                while (wt > 0 && h[wt - 1] >= 0) wt--;
+                waterTable[j] = depths[wt];
+            }
+            minFoS[j] = best;
+            criticalDepth[j] = depths[bestK];
+        }
+
+        let worst = 0, failureHour = null;
+        for (let j = 0; j < nt; j++) {
+            if (minFoS[j] < minFoS[worst]) worst = j;
+            if (failureHour === null && minFoS[j] < 1) failureHour = j;
+        }
+
+        const storageChange = storage() - initialStorage;
+        const massBalanceError = infiltrated > 0
+            ? Math.abs(storageChange + drainedOut - infiltrated) / infiltrated
+            : 0;
+
+        return {
+            hours: nt,
+            depths: depths,
+            minFoS: minFoS,
+            criticalDepth: criticalDepth,
+            waterTable: waterTable,
+            fos: fosGrid,
+            pressureHead: psiGrid,
+            initialPressureHead: initialPressureHead,
+            finalPressureHead: Float64Array.from(h),
+            initialFoS: roundTo(initialFoS, 4),
+            minimumFoS: nt > 0 ? roundTo(minFoS[worst], 4) : roundTo(initialFoS, 4),
+            criticalHour: nt > 0 ? worst : null,
+            criticalDepth_m: nt > 0 ? roundTo(criticalDepth[worst], 2) : null,
+            failureHour: failureHour,
+            waterTableDepth: roundTo(d, 2),
+            rainfall_mm: roundTo(rained * 1000, 2),
+            infiltration_mm: roundTo(infiltrated * 1000, 2),
+            runoff_mm: roundTo(Math.max(0, rained - infiltrated) * 1000, 2),
+            massBalanceError: roundSig(massBalanceError, 3),
+            steps: steps,
+            iterations: iterations,
+            rejectedSteps: rejected,
+            unconvergedSteps: unconverged,
+            base: drained ? 'drained' : 'impermeable',
+            method: 'Richards equation (van Genuchten–Mualem, Fredlund strength)'
+        };
+    }
+
+    // ========================================================================
+    // D3. TERRAIN STABILITY (DEM RASTER — SINMAP / SHALSTAB)
+    // ========================================================================
+
+    const RASTER_TILE_ROWS = 256;            // rows per tile (parallel work unit)
+    const SI_QUADRATURE = 8;                 // midpoint nodes over R/T
+    const RECHARGE_RANGE = [25, 75];         // mm/day — steady recharge bounds
+    const MIN_TAN_SLOPE = 1e-4;              // flats: treated as saturated and stable
+    const SI_MIN_SPAN = 1e-9;                // narrower C / tan φ bounds are constants
+
+    // Stability index classes (Pack et al., 1998); class 0 = no data
+    const SI_CLASSES = [
+        { id: 1, min: 1.5, label: 'Stable' },
+        { id: 2, min: 1.25, label: 'Moderately stable' },
+        { id: 3, min: 1.0, label: 'Quasi-stable' },
+        { id: 4, min: 0.5, label: 'Lower threshold' },
+        { id: 5, min: 0, label: 'Upper threshold' },
+        { id: 6, min: -Infinity, label: 'Defended (unstable)' }
+    ];
+
+    // D∞ facets (Tarboton, 1997): cardinal neighbour e1, diagonal neighbour e2
+    const DINF_FACETS = [
+        [0, 1, -1, 1], [-1, 0, -1, 1], [-1, 0, -1, -1], [0, -1, -1, -1],
+        [0, -1, 1, -1], [1, 0, 1, -1], [1, 0, 1, 1], [0, 1, 1, 1]
+    ];
+
+    /**
+     * Parse an ESRI ASCII grid (.asc) DEM
+     *
+     * @param {string} text
+     * @returns {Object} { nrows, ncols, cellSize, xllcorner, yllcorner, nodata,
+     *   data: Float32Array (row-major from the north edge, no-data = NaN) }
+     */
+    function parseAsciiGrid(text) {
+        const header = {};
+        let pos = 0;
+        while (pos < text.length) {
+            const end = text.indexOf('\n', pos);
+            const line = text.slice(pos, end === -1 ? text.length : end).trim();
+            const m = /^([A-Za-z_]+)\s+(\S+)$/.exec(line);
+            if (!m) break;
+            header[m[1].toLowerCase()] = parseFloat(m[2]);
+            pos = end === -1 ? text.length : end + 1;
+        }
+        const nrows = header.nrows, ncols = header.ncols;
+        if (!(nrows > 0) || !(ncols > 0) || !(header.cellsize > 0)) {
+            throw new Error('Invalid ASCII grid header');
+        }
+        const nodata = header.nodata_value !== undefined ? header.nodata_value : -9999;
+        const data = new Float32Array(nrows * ncols);
+        const re = /\S+/g;
+        re.lastIndex = pos;
+        let i = 0, m;
+        while (i < data.length && (m = re.exec(text)) !== null) {
+            const v = parseFloat(m[0]);
+            data[i++] = v === nodata ? NaN : v;
+        }
+        if (i < data.length) throw new Error(`ASCII grid has ${i} of ${data.length} values`);
+        return {
+            nrows, ncols,
+            cellSize: header.cellsize,
+            xllcorner: header.xllcorner !== undefined ? header.xllcorner : header.xllcenter,
+            yllcorner: header.yllcorner !== undefined ? header.yllcorner : header.yllcenter,
+            nodata,
+            data
+        };
+    }
+
+    /**
+     * Specific catchment area a (m²/m) by D∞ flow routing (Tarboton, 1997)
+     * Each cell drains along the steepest of its eight triangular facets,
+     * split between the two facet neighbours in proportion to the flow
+     * angle. Upslope area is accumulated in topological order (donor counts
+     * and a queue), so the pass is O(N) with no recursion. Depressions and
+     * flats act as sinks — fill the DEM first for continuous flow paths.
+     *
+     * @param {Float32Array|Float64Array} dem - Row-major elevations (m), NaN = no data
+     * @param {number} nrows
+     * @param {number} ncols
+     * @param {number} cellSize - m
+     * @returns {Float32Array} Specific catchment area (NaN = no data)
+     */
+    function specificCatchmentArea(dem, nrows, ncols, cellSize) {
+        const n = nrows * ncols;
+        const recv1 = new Int32Array(n).fill(-1);
+        const recv2 = new Int32Array(n).fill(-1);
+        const frac1 = new Float32Array(n);
+        const donors = new Uint8Array(n);
+        const QUARTER_PI = Math.PI / 4;
+        const diag = cellSize * Math.SQRT2;
+
+        // Flow directions
+        for (let r = 0; r < nrows; r++) {
+            for (let c = 0; c < ncols; c++) {
+                const i = r * ncols + c;
+                const e0 = dem[i];
+                if (!(e0 === e0)) continue;
+                let best = 0, bestF = -1, bestS1 = 0, bestS2 = 0, bestKind = 0;
+                for (let f = 0; f < 8; f++) {
+                    const F = DINF_FACETS[f];
+                    const r1 = r + F[0], c1 = c + F[1], r2 = r + F[2], c2 = c + F[3];
+                    if (r2 < 0 || r2 >= nrows || c2 < 0 || c2 >= ncols ||
+                        r1 < 0 || r1 >= nrows || c1 < 0 || c1 >= ncols) continue;
+                    const e1 = dem[r1 * ncols + c1], e2 = dem[r2 * ncols + c2];
+                    if (!(e1 === e1) || !(e2 === e2)) continue;
+                    const s1 = (e0 - e1) / cellSize;
+                    const s2 = (e1 - e2) / cellSize;
+                    let s, kind;
+                    if (s2 <= 0) { s = s1; kind = 0; }                       // along e1
+                    else if (s2 >= s1) { s = (e0 - e2) / diag; kind = 2; }   // along e2
+                    else { s = Math.sqrt(s1 * s1 + s2 * s2); kind = 1; }    // inside facet
+                    if (s > best) { best = s; bestF = f; bestS1 = s1; bestS2 = s2; bestKind = kind; }
+                }
+                if (bestF < 0) continue;
+                const F = DINF_FACETS[bestF];
+                const j1 = (r + F[0]) * ncols + c + F[1];
+                const j2 = (r + F[2]) * ncols + c + F[3];
+                if (bestKind === 0) {
+                    recv1[i] = j1; frac1[i] = 1;
+                } else if (bestKind === 2) {
+                    recv1[i] = j2; frac1[i] = 1;
+                } else {
+                    const p = 1 - Math.atan(bestS2 / bestS1) / QUARTER_PI;
+                    recv1[i] = j1; frac1[i] = p;
+                    recv2[i] = j2;
+                }
+                donors[recv1[i]]++;
+                if (recv2[i] >= 0) donors[recv2[i]]++;
+            }
+        }
+
+        // Accumulate upslope area from the ridges down
+        const area = new Float64Array(n);
+        const queue = new Int32Array(n);
+        let head = 0, tail = 0;
+        const cellArea = cellSize * cellSize;
+        for (let i = 0; i < n; i++) {
+            if (dem[i] === dem[i]) {
+                area[i] = cellArea;
+                if (donors[i] === 0) queue[tail++] = i;
+            }
+        }
+        while (head < tail) {
+            const i = queue[head++];
+            const a = area[i];
+            const j1 = recv1[i];
+            if (j1 < 0) continue;
+            const f = frac1[i];
+            area[j1] += a * f;
+            if (--donors[j1] === 0) queue[tail++] = j1;
+            const j2 = recv2[i];
+            if (j2 >= 0) {
+                area[j2] += a * (1 - f);
+                if (--donors[j2] === 0) queue[tail++] = j2;
+            }
+        }
+
+        const sca = new Float32Array(n);
+        for (let i = 0; i < n; i++) sca[i] = dem[i] === dem[i] ? area[i] / cellSize : NaN;
+        return sca;
+    }
+
+    /**
+     * Parameter bounds for the raster stability model from a soil profile
+     * Cohesion and friction span mean ± 1 SD of the soil database entry
+     * (root cohesion added to both bounds); the wetness parameter R/T spans
+     * the steady recharge range over transmissivity T = Ks · depth.
+     *
+     * @param {Object} soil - SOIL_DATABASE entry (or resolveSoilProfile() result)
+     * @param {Object} [options] - { depth (m), rootCohesion (kPa),
+     *   rechargeRange [lo, hi] (mm/day), transmissivity (m²/s) }
+     * @returns {Object} Bounds and means, ready for rasterStabilityTile()
+     */
+    function terrainStabilityParams(soil, options = {}) {
+        const {
+            depth = DEFAULT_DEPTH,
+            rootCohesion = 0,
+            rechargeRange = RECHARGE_RANGE,
+            transmissivity = soil.permeability.mean * depth
+        } = options;
+        const DEG = Math.PI / 180;
+        const c = soil.cohesion, phi = soil.friction;
+        const toRate = mmDay => mmDay / 1000 / 86400 / transmissivity;   // R/T (1/m)
+        return {
+            cohesion: [Math.max(0, c.mean - c.stddev) + rootCohesion, c.mean + c.stddev + rootCohesion],
+            cohesionMean: c.mean + rootCohesion,
+            tanPhi: [Math.tan((phi.mean - phi.stddev) * DEG), Math.tan((phi.mean + phi.stddev) * DEG)],
+            tanPhiMean: Math.tan(phi.mean * DEG),
+            wetness: [toRate(rechargeRange[0]), toRate(rechargeRange[1])],
+            wetnessMean: toRate((rechargeRange[0] + rechargeRange[1]) / 2),
+            unitWeight: soil.unitWeight.mean,
+            depth: depth,
+            densityRatio: WATER_DENSITY / soil.unitWeight.mean
+        };
+    }
+
+    /**
+     * Cut rows [r0, r1) of a grid into a self-contained tile: DEM rows with a
+     * one-row halo on each side (for the 3×3 slope stencil) plus the
+     * matching catchment-area rows. Arrays are copies, so they can be
+     * transferred to a worker.
+     */
+    function createRasterTile(grid, sca, r0, r1) {
+        const { nrows, ncols } = grid;
+        const haloTop = r0 > 0 ? 1 : 0;
+        const haloBottom = r1 < nrows ? 1 : 0;
+        return {
+            dem: grid.data.slice((r0 - haloTop) * ncols, (r1 + haloBottom) * ncols),
+            sca: sca.slice(r0 * ncols, r1 * ncols),
+            rows: r1 - r0,
+            ncols: ncols,
+            haloTop: haloTop,
+            haloBottom: haloBottom,
+            cellSize: grid.cellSize
+        };
+    }
+
+    // ∫ clamp(u, 0, 1) du
+    function clampIntegral(u) {
+        if (u <= 0) return 0;
+        if (u < 1) return 0.5 * u * u;
+        return u - 0.5;
+    }
+
+    function clamp01(u) {
+        return u <= 0 ? 0 : u >= 1 ? 1 : u;
+    }
+
+    /**
+     * Slope, wetness, FoS and stability index for one tile
+     *
+     * Slope: Horn (1981) 3×3 gradient. Wetness and FoS follow SINMAP
+     * (Pack et al., 1998), the infinite-slope model with the water table
+     * from steady recharge (SHALSTAB; Montgomery & Dietrich, 1994):
+     *
+     *   w   = min(R·a / (T·sin θ), 1)
+     *   FoS = [C + cos θ·(1 − w·r)·tan φ] / sin θ,  C = c / (γ·z·cos θ),  r = γw/γ
+     *
+     * which equals infiniteSlope() with saturation = 100·w. The stability
+     * index SI is FoS at the most conservative bounds when that exceeds 1,
+     * 0 when even the most favourable bounds fail, and otherwise the
+     * probability that FoS > 1 with c, tan φ and R/T uniform over their
+     * bounds — exact in c and tan φ, midpoint quadrature over R/T. TWI is
+     * saturationIndex() per cell, ln(a / tan θ).
+     *
+     * @param {Object} tile - From createRasterTile()
+     * @param {Object} params - From terrainStabilityParams()
+     * @returns {Object} { slope (°), twi, wetness, fos, si, siClass } for the tile rows
+     */
+    function rasterStabilityTile(tile, params) {
+        const { dem, sca, rows, ncols, haloTop, haloBottom, cellSize } = tile;
+        const n = rows * ncols;
+        const slope = new Float32Array(n);
+        const twi = new Float32Array(n);
+        const wetness = new Float32Array(n);
+        const fos = new Float32Array(n);
+        const si = new Float32Array(n);
+        const siClass = new Uint8Array(n);
+
+        const [C1, C2] = params.cohesion;
+        const [t1, t2] = params.tanPhi;
+        const [x1, x2] = params.wetness;
+        const cMean = params.cohesionMean, tMean = params.tanPhiMean, xMean = params.wetnessMean;
+        const r = params.densityRatio;
+        const gz = params.unitWeight * params.depth;
+        const dC = C2 - C1, dT = t2 - t1, dX = (x2 - x1) / SI_QUADRATURE;
+        const inv8 = 1 / (8 * cellSize);
+        const totalRows = rows + haloTop + haloBottom;
+        const RAD = 180 / Math.PI;
+        const z = (rr, cc, e) => {
+            const v = dem[rr * ncols + cc];
+            return v === v ? v : e;
+        };
+
+        for (let row = 0; row < rows; row++) {
+            const tr = row + haloTop;                       // row within the DEM tile
+            const up = tr > 0 ? tr - 1 : tr;
+            const down = tr < totalRows - 1 ? tr + 1 : tr;
+            for (let col = 0; col < ncols; col++) {
+                const i = row * ncols + col;
+                const e = dem[tr * ncols + col];
+                const a = sca[i];
+                if (!(e === e) || !(a === a)) {
+                    slope[i] = twi[i] = wetness[i] = fos[i] = si[i] = NaN;
+                    continue;
+                }
+                // Horn gradient; missing neighbours take the centre value
+                const left = col > 0 ? col - 1 : col;
+                const right = col < ncols - 1 ? col + 1 : col;
+                const za = z(up, left, e), zb = z(up, col, e), zc = z(up, right, e);
+                const zd = z(tr, left, e), zf = z(tr, right, e);
+                const zg = z(down, left, e), zh = z(down, col, e), zi = z(down, right, e);
+                const gx = ((zc + 2 * zf + zi) - (za + 2 * zd + zg)) * inv8 * (right - left === 2 ? 1 : 2);
+                const gy = ((zg + 2 * zh + zi) - (za + 2 * zb + zc)) * inv8 * (down - up === 2 ? 1 : 2);
+                const tanB = Math.sqrt(gx * gx + gy * gy);
+                slope[i] = Math.atan(tanB) * RAD;
+
+                if (tanB < MIN_TAN_SLOPE) {
+                    twi[i] = Math.log(a / MIN_TAN_SLOPE);
+                    wetness[i] = 1;
+                    fos[i] = 10;
+                    si[i] = 10;
+                    siClass[i] = 1;
+                    continue;
+                }
+                const cosB = 1 / Math.sqrt(1 + tanB * tanB);
+                const sinB = tanB * cosB;
+                const scale = 1 / (gz * cosB);              // c → dimensionless C
+                twi[i] = Math.log(a / tanB);
+
+                const w = Math.min(xMean * a / sinB, 1);
+                wetness[i] = w;
+                fos[i] = Math.min(10, (cMean * scale + cosB * (1 - w * r) * tMean) / sinB);
+
+                // Stability index over the parameter bounds
+                const wHi = Math.min(x2 * a / sinB, 1), wLo = Math.min(x1 * a / sinB, 1);
+                const fsMin = (C1 * scale + cosB * (1 - wHi * r) * t1) / sinB;
+                const fsMax = (C2 * scale + cosB * (1 - wLo * r) * t2) / sinB;
+                let index;
+                if (fsMin >= 1) {
+                    index = Math.min(10, fsMin);
+                } else if (fsMax < 1) {
+                    index = 0;
+                } else {
+                    // P(C + B·t > sin θ) with C, t uniform: integrate the clamped
+                    // linear C-fraction over t exactly, average over R/T nodes.
+                    // A zero-width bound (stddev 0) makes that parameter a constant
+                    const span = dC * scale;
+                    const fixedC = !(span > SI_MIN_SPAN), fixedT = !(dT > SI_MIN_SPAN);
+                    let p = 0;
+                    for (let q = 0; q < SI_QUADRATURE; q++) {
+                        const wq = Math.min((x1 + (q + 0.5) * dX) * a / sinB, 1);
+                        const B = cosB * (1 - wq * r);
+                        if (fixedC && fixedT) {
+                            p += C1 * scale + B * t1 > sinB ? 1 : 0;
+                        } else if (fixedC) {
+                            // Fraction of tan φ above (sin θ − C) / B
+                            p += clamp01((t2 - (sinB - C1 * scale) / B) / dT);
+                        } else if (fixedT) {
+                            // Fraction of C above sin θ − B·tan φ
+                            p += clamp01((C2 * scale - sinB + B * t1) / span);
+                        } else {
+                            const a0 = (C2 * scale - sinB) / span;
+                            const b0 = B / span;
+                            p += (clampIntegral(a0 + b0 * t2) - clampIntegral(a0 + b0 * t1)) / (b0 * dT);
+                        }
+                    }
+                    index = p / SI_QUADRATURE;
+                }
+                si[i] = index;
+                // An unresolved index never reads as stable: most conservative class
+                let k = index === index ? 0 : SI_CLASSES.length - 1;
+                while (index < SI_CLASSES[k].min) k++;
+                siClass[i] = SI_CLASSES[k].id;
+            }
+        }
+
+        return { slope, twi, wetness, fos, si, siClass };
+    }
+
+    /**
+     * Output rasters for a grid (filled tile by tile with writeRasterTile())
+     */
+    function createStabilityRaster(nrows, ncols) {
+        const n = nrows * ncols;
+        return {
+            nrows, ncols,
+            slope: new Float32Array(n),
+            sca: null,
+            twi: new Float32Array(n),
+            wetness: new Float32Array(n),
+            fos: new Float32Array(n),
+            si: new Float32Array(n),
+            siClass: new Uint8Array(n),
+            summary: null
+        };
+    }
+
+    function writeRasterTile(raster, result, r0) {
+        const offset = r0 * raster.ncols;
+        raster.slope.set(result.slope, offset);
+        raster.twi.set(result.twi, offset);
+        raster.wetness.set(result.wetness, offset);
+        raster.fos.set(result.fos, offset);
+        raster.si.set(result.si, offset);
+        raster.siClass.set(result.siClass, offset);
+        return raster;
+    }
+
+    /**
+     * Cell counts and area fractions per stability class, plus FoS extremes
+     */
+    function summarizeStabilityClasses(raster) {
+        const counts = new Array(SI_CLASSES.length + 1).fill(0);
+        let valid = 0, unstable = 0, fosSum = 0, fosMin = Infinity;
+        for (let i = 0; i < raster.siClass.length; i++) {
+            const k = raster.siClass[i];
+            counts[k]++;
+            if (k === 0) continue;
+            valid++;
+            const f = raster.fos[i];
+            fosSum += f;
+            if (f < fosMin) fosMin = f;
+            if (f < 1) unstable++;
+        }
+        return {
+            cells: valid,
+            classes: SI_CLASSES.map(cls => ({
+                id: cls.id,
+                label: cls.label,
+                cells: counts[cls.id],
+                fraction: valid > 0 ? roundTo(counts[cls.id] / valid, 4) : 0
+            })),
+            meanFoS: valid > 0 ? roundTo(fosSum / valid, 4) : null,
+            minFoS: valid > 0 ? roundTo(fosMin, 4) : null,
+            unstableFraction: valid > 0 ? roundTo(unstable / valid, 4) : 0
+        };
+    }
+
+    /**
+     * Regional shallow-landslide susceptibility over a DEM — single-threaded
+     * reference of WorkerPool.terrainStability() (same tiles, same result)
+     *
+     * @param {Object} grid - { data, nrows, ncols, cellSize } (e.g. parseAsciiGrid())
+     * @param {Object} soil - SOIL_DATABASE entry
+     * @param {Object} [options] - terrainStabilityParams() options, plus tileRows
+     * @returns {Object} Rasters { slope, sca, twi, wetness, fos, si, siClass } and summary
+     */
+    function terrainStability(grid, soil, options = {}) {
+        const params = terrainStabilityParams(soil, options);
+        const tileRows = options.tileRows || RASTER_TILE_ROWS;
+        const sca = specificCatchmentArea(grid.data, grid.nrows, grid.ncols, grid.cellSize);
+        const raster = createStabilityRaster(grid.nrows, grid.ncols);
+        for (let r0 = 0; r0 < grid.nrows; r0 += tileRows) {
+            const r1 = Math.min(grid.nrows, r0 + tileRows);
+            writeRasterTile(raster, rasterStabilityTile(createRasterTile(grid, sca, r0, r1), params), r0);
+        }
+        raster.sca = sca;
+        raster.summary = summarizeStabilityClasses(raster);
+        return raster;
+    }
+
+    // ========================================================================
+    // D4. HOURLY STABILITY FORECAST
+    // ========================================================================
+
+    const FORECAST_EVENT_GAP = 6;          // dry hours that close a rainfall event
+    const FORECAST_MIN_STORAGE = 0.05;     // floor on drainable porosity (fraction of n)
+    const SOIL_MOISTURE_SATURATED = 0.5;   // m³/m³ read as 100% (as in the rainfall stage)
+
+    /**
+     * Hourly FoS / I-D timeline over the Open-Meteo hourly series (2 past +
+     * 7 forecast days = 216 hours), for the same site the static analysis
+     * describes.
+     *
+     * State carried forward hour by hour:
+     *   - Rainfall event — opens on the first wet hour and closes after
+     *     FORECAST_EVENT_GAP dry hours; I-D status uses the event mean
+     *     intensity over its duration up to the last wet hour (Caine, 1980).
+     *   - Water table ratio m (the static model's saturation) — infiltration,
+     *     capped at Ks, fills the drainable pore space nd = n·(1 − m0), and
+     *     lateral Darcy drainage recedes towards the baseline m0:
+     *
+     *       m ← m0 + (m − m0)·exp(−Δt/τ) + min(P, Ks·Δt) / (nd·z),   τ = nd·z / (Ks·sin β)
+     *
+     *     Hourly soil moisture, mapped as in the rainfall stage, is a floor.
+     *
+     * FoS for all hours is then a single infiniteSlopeBatch() pass. With
+     * options.compositeFoS the composite is carried along in proportion to
+     * the infinite-slope FoS (the limit-equilibrium methods share its
+     * pore-pressure dependence), and the minimum / first FoS < 1 crossing
+     * refer to it.
+     *
+     * @param {Object} params - slopeParams plus { permeability (m/s), porosity,
+     *   crackReduction, rootCohesion, drainageModifier }
+     * @param {Object} hourly - Open-Meteo hourly block { time, precipitation (mm),
+     *   soilMoisture0to7 (m³/m³) }
+     * @param {Object} [options] - { compositeFoS }
+     * @returns {Object} Per-hour typed arrays, worst hour and first crossings
+     */
+    function fosForecast(params, hourly, options = {}) {
+        const {
+            slopeAngle = 35,
+            depth = DEFAULT_DEPTH,
+            saturation = 50,
+            permeability = 1e-5,
+            porosity = 0.4,
+            drainageModifier = 1
+        } = params;
+        const { compositeFoS = null } = options;
+
+        const rain = hourly.precipitation || [];
+        const moisture = hourly.soilMoisture0to7 || [];
+        const time = hourly.time || [];
+        const n = rain.length;
+        const dt = 3600;
+
+        const m0 = Math.min(1, Math.max(0, saturation / 100));
+        const storage = porosity * Math.max(1 - m0, FORECAST_MIN_STORAGE) * depth;   // nd·z (m)
+        const sinB = Math.sin(slopeAngle * Math.PI / 180);
+        const recession = sinB > 0 ? Math.exp(-dt * permeability * sinB / storage) : 1;
+        const infiltrationCap = permeability * dt * 1000;                            // mm/h
+
+        const cumulative = new Float64Array(n);
+        const eventIntensity = new Float64Array(n);
+        const eventDuration = new Float64Array(n);
+        const idLevel = new Uint8Array(n);
+        const idExceedance = new Float64Array(n);       // % of the regional threshold
+        const sat = new Float64Array(n);
+
+        let total = 0, m = m0;
+        let eventStart = -1, lastWet = -1, eventRain = 0;
+        for (let t = 0; t < n; t++) {
+            const p = rain[t] > 0 ? rain[t] : 0;
+            total += p;
+            cumulative[t] = total;
+
+            // Rainfall event
+            if (p > 0) {
+                if (eventStart < 0) { eventStart = t; eventRain = 0; }
+                eventRain += p;
+                lastWet = t;
+            } else if (eventStart >= 0 && t - lastWet >= FORECAST_EVENT_GAP) {
+                eventStart = -1;
+            }
+            if (eventStart >= 0) {
+                const D = lastWet - eventStart + 1;
+                const I = eventRain / D;
+                const himalaya = himalayanThreshold(D);
+                eventIntensity[t] = I;
+                eventDuration[t] = D;
+                idLevel[t] = idThresholdLevel(I, caineThreshold(D), himalaya);
+                idExceedance[t] = I / himalaya * 100;
+            }
+
+            // Water table
+            m = m0 + (m - m0) * recession + Math.min(p, infiltrationCap) / 1000 / storage;
+            if (m > 1) m = 1;
+            const sm = moisture[t];
+            const floor = sm != null ? sm / SOIL_MOISTURE_SATURATED * drainageModifier : 0;
+            sat[t] = 100 * Math.min(1, Math.max(m, floor));
+        }
+
+        const inputs = Object.assign({}, params, { saturation: sat });
+        const fos = infiniteSlopeBatch(inputs, { fos: new Float64Array(n) }, n).fos;
+        const baselineFoS = infiniteSlopeBatch(Object.assign({}, params, { saturation: 100 * m0 }),
+            { fos: new Float64Array(1) }, 1).fos[0];
+
+        let composite = null;
+        if (compositeFoS !== null) {
+            composite = new Float64Array(n);
+            const scale = compositeFoS / baselineFoS;
+            for (let t = 0; t < n; t++) composite[t] = fos[t] * scale;
+        }
+
+        // Summaries follow the composite when given, the infinite slope otherwise
+        const governing = composite || fos;
+        let worst = 0, fosCrossing = null, idCrossing = null;
+        for (let t = 0; t < n; t++) {
+            if (governing[t] < governing[worst]) worst = t;
+            if (fosCrossing === null && governing[t] < 1) fosCrossing = t;
+            if (idCrossing === null && idLevel[t] >= 2) idCrossing = t;
+        }
+        const at = t => t === null ? null : { hour: t, time: time[t] || null };
+
+        return {
+            hours: n,
+            time: time,
+            rainfall: Float64Array.from(rain, v => v > 0 ? v : 0),
+            cumulativeRainfall: cumulative,
+            eventIntensity: eventIntensity,
+            eventDuration: eventDuration,
+            idLevel: idLevel,
+            idExceedance: idExceedance,
+            saturation: sat,
+            fos: fos,
+            compositeFoS: composite,
+            baselineFoS: roundTo(baselineFoS, 4),
+            minimumFoS: n > 0 ? roundTo(governing[worst], 4) : null,
+            criticalHour: n > 0 ? at(worst) : null,
+            peakSaturation: n > 0 ? roundTo(Math.max.apply(null, sat), 1) : roundTo(100 * m0, 1),
+            totalRainfall: roundTo(total, 1),
+            firstCrossing: {
+                fos: at(fosCrossing),
+                idThreshold: idCrossing === null ? null : Object.assign(at(idCrossing), { level: idLevel[idCrossing] })
+            },
+            method: 'Hourly infinite-slope forecast (event I-D, linear-reservoir water table)'
+        };
+    }
+
     // ========================================================================
     // E. ENVIRONMENTAL MODELS
     // ========================================================================
@@ -546,7 +2739,7 @@ const GeotechnicalEngine = (function () {
             rootCohesion: rootCohesion,
             category: category,
             deforestationRisk: deforestationRisk,
-            ndvi_estimate: parseFloat(ndvi_estimate.toFixed(2)),
+            ndvi_estimate: roundTo(ndvi_estimate, 2),
             vegetationPct: vegetationPct,
             treeDensity_est: Math.round(vegetationPct * 8) // trees per hectare estimate
         };
@@ -560,12 +2753,135 @@ const GeotechnicalEngine = (function () {
      * Monte Carlo Simulation for reliability analysis
      * Generates random parameter sets from distributions,
      * computes FoS for each, estimates probability of failure
+     *
+     * Samples are drawn in blocks of MC_BLOCK_SIZE, held struct-of-arrays
+     * and evaluated by infiniteSlopeKernel(). Moments are accumulated
+     * online (Welford), so memory stays flat regardless of iteration count.
+     * With options.pfTolerance set, sampling stops once the 95% Wilson
+     * interval on P(failure) is narrower than ±pfTolerance percentage points.
+     *
+     * Sampling strategies (options.sampler):
+     *   'random' — seeded xoshiro128** pseudo-random draws
+     *   'lhs'    — Latin Hypercube, stratified within each block
+     *   'sobol'  — digitally shifted Sobol sequence (quasi-Monte Carlo)
+     * LHS and Sobol uniforms are mapped through the inverse normal CDF.
      * 
      * @param {Object} params - Mean values
-     * @param {number} iterations
+     * @param {number} iterations - Maximum number of samples
+     * @param {Object} [options] - { seed, stream, sampler, pfTolerance, minIterations }
      * @returns {Object}
      */
-    function monteCarloSimulation(params, iterations = MC_ITERATIONS) {
+    function monteCarloSimulation(params, iterations = MC_ITERATIONS, options = {}) {
+        const run = monteCarloPartial(params, iterations, options);
+        return summarizeMonteCarlo(run.accumulator, run);
+    }
+
+    /**
+     * Monte Carlo with the shard layout of WorkerPool.monteCarlo(), run
+     * sequentially: chunk k of MC_CHUNK_SIZE samples draws from stream k
+     * and chunks merge in order, with the early-stop test after each merge.
+     * The result is identical to the pooled run, so the analysis can hand
+     * this stage to the pool or run it inline interchangeably.
+     *
+     * @param {Object} params - Mean values
+     * @param {number} iterations - Total (maximum) samples
+     * @param {Object} [options] - { seed, sampler, pfTolerance, minIterations, chunkSize }
+     * @returns {Object} As monteCarloSimulation(), plus shards
+     */
+    function monteCarloSharded(params, iterations = MC_ITERATIONS, options = {}) {
+        const {
+            seed = MC_DEFAULT_SEED,
+            sampler = 'random',
+            pfTolerance = null,
+            minIterations = MC_MIN_ITERATIONS,
+            chunkSize = MC_CHUNK_SIZE
+        } = options;
+
+        const total = Math.max(2, Math.floor(iterations || MC_ITERATIONS));
+        const nChunks = Math.ceil(total / chunkSize);
+        const acc = createMCAccumulator();
+        let method = sampler;
+        let merged = 0;
+        let stoppedEarly = false;
+
+        while (merged < nChunks) {
+            const count = Math.min(chunkSize, total - merged * chunkSize);
+            const partial = monteCarloPartial(params, count, { seed: seed, stream: merged, sampler: sampler });
+            if (merged === 0) method = partial.sampler;
+            mergeMCAccumulators(acc, partial.accumulator);
+            merged++;
+            if (pfTolerance !== null && acc.n >= minIterations && merged < nChunks) {
+                const ci = wilsonInterval(acc.failures, acc.n);
+                if (ci.halfWidth * 100 <= pfTolerance) {
+                    stoppedEarly = true;
+                    break;
+                }
+            }
+        }
+
+        const result = summarizeMonteCarlo(acc, { seed: seed, sampler: method, stoppedEarly: stoppedEarly });
+        result.shards = merged;
+        return result;
+    }
+
+    /**
+     * Run Monte Carlo sampling and return the raw accumulator
+     * Used directly by parallel runs (WorkerPool), which merge accumulators
+     * from independent streams before summarising.
+     *
+     * @param {Object} params - Mean values
+     * @param {number} iterations - Maximum number of samples
+     * @param {Object} [options] - As monteCarloSimulation()
+     * @returns {Object} { accumulator, seed, stream, sampler, stoppedEarly }
+     */
+    function monteCarloPartial(params, iterations = MC_ITERATIONS, options = {}) {
+        const {
+            seed = MC_DEFAULT_SEED,
+            stream = 0,
+            sampler = 'random',
+            pfTolerance = null,        // ± percentage points on P(failure)
+            minIterations = MC_MIN_ITERATIONS
+        } = options;
+
+        const maxN = Math.max(2, Math.floor(iterations));
+        const rng = new SeededRandom(seed, stream);
+        const source = createSampler(sampler, 4, rng);
+        const acc = createMCAccumulator();
+        const inputs = createMCInputs(params);
+        const block = createMCBlock(Math.min(MC_BLOCK_SIZE, maxN));
+
+        let stoppedEarly = false;
+
+        while (acc.n < maxN) {
+            const count = Math.min(block.size, maxN - acc.n);
+            sampleMCBlock(inputs, source, block, count);
+            infiniteSlopeKernel(block.c, block.phi, block.gamma, block.slope,
+                inputs.depth, inputs.saturation, block.fos, count);
+            accumulateFoS(acc, block.fos, count);
+
+            if (pfTolerance !== null && acc.n >= minIterations && acc.n < maxN) {
+                const ci = wilsonInterval(acc.failures, acc.n);
+                if (ci.halfWidth * 100 <= pfTolerance) {
+                    stoppedEarly = true;
+                    break;
+                }
+            }
+        }
+
+        return {
+            accumulator: acc,
+            seed: seed,
+            stream: stream,
+            sampler: source.method,
+            stoppedEarly: stoppedEarly
+        };
+    }
+
+    /**
+     * Resolve Monte Carlo input distributions from mean values
+     * Standard deviations are coefficient-of-variation based.
+     */
+    function createMCInputs(params) {
         const {
             cohesion = 5,
             frictionAngle = 30,
@@ -575,70 +2891,647 @@ const GeotechnicalEngine = (function () {
             depth = DEFAULT_DEPTH
         } = params;
 
-        // Standard deviations (coefficient of variation-based)
-        const cv_c = 0.3;      // Cohesion: 30% CoV
-        const cv_phi = 0.1;    // Friction: 10% CoV
-        const cv_gamma = 0.05; // Unit weight: 5% CoV
-        const sd_slope = 2.0;  // degrees
-
-        const fosResults = [];
-        let failureCount = 0;
-
-        for (let i = 0; i < iterations; i++) {
-            const c_i = Math.max(0.1, normalRandom(cohesion, cohesion * cv_c));
-            const phi_i = Math.max(5, normalRandom(frictionAngle, frictionAngle * cv_phi));
-            const gamma_i = normalRandom(unitWeight, unitWeight * cv_gamma);
-            const slope_i = Math.max(5, normalRandom(slopeAngle, sd_slope));
-
-            const result = infiniteSlope({
-                cohesion: c_i,
-                frictionAngle: phi_i,
-                slopeAngle: slope_i,
-                unitWeight: gamma_i,
-                depth: depth,
-                saturation: saturation
-            });
+        return {
+            cohesion: cohesion, sd_c: cohesion * 0.3,              // Cohesion: 30% CoV
+            frictionAngle: frictionAngle, sd_phi: frictionAngle * 0.1, // Friction: 10% CoV
+            unitWeight: unitWeight, sd_gamma: unitWeight * 0.05,   // Unit weight: 5% CoV
+            slopeAngle: slopeAngle, sd_slope: 2.0,                 // degrees
+            saturation: saturation,
+            depth: depth
+        };
+    }
+
+    function createMCBlock(size) {
+        return {
+            size: size,
+            z: [new Float64Array(size), new Float64Array(size), new Float64Array(size), new Float64Array(size)],
+            c: new Float64Array(size),
+            phi: new Float64Array(size),
+            gamma: new Float64Array(size),
+            slope: new Float64Array(size),
+            fos: new Float64Array(size)
+        };
+    }
 
-            fosResults.push(result.fos);
-            if (result.fos < 1.0) failureCount++;
+    function sampleMCBlock(inputs, source, block, count) {
+        source.fill(block.z, count);
+        const z_c = block.z[0], z_phi = block.z[1], z_gamma = block.z[2], z_slope = block.z[3];
+        for (let i = 0; i < count; i++) {
+            block.c[i] = Math.max(0.1, inputs.cohesion + z_c[i] * inputs.sd_c);
+            block.phi[i] = Math.max(5, inputs.frictionAngle + z_phi[i] * inputs.sd_phi);
+            block.gamma[i] = inputs.unitWeight + z_gamma[i] * inputs.sd_gamma;
+            block.slope[i] = Math.max(5, inputs.slopeAngle + z_slope[i] * inputs.sd_slope);
         }
+    }
+
+    // ------------------------------------------------------------------------
+    // Sampling strategies
+    // ------------------------------------------------------------------------
+
+    const SAMPLER_LABELS = {
+        random: 'Pseudo-random',
+        lhs: 'Latin Hypercube',
+        sobol: 'Sobol QMC'
+    };
 
-        const mean_fos = fosResults.reduce((a, b) => a + b, 0) / iterations;
-        const std_fos = Math.sqrt(
-            fosResults.reduce((sum, f) => sum + Math.pow(f - mean_fos, 2), 0) / (iterations - 1)
-        );
-        const pf = (failureCount / iterations) * 100;
+    /**
+     * Create a standard-normal sample source
+     * fill(Z, count) writes `count` variates into each of the `dims`
+     * Float64Arrays in Z.
+     *
+     * @param {string} method - 'random' | 'lhs' | 'sobol'
+     * @param {number} dims
+     * @param {SeededRandom} rng
+     * @returns {Object} { method, label, fill }
+     */
+    function createSampler(method, dims, rng) {
+        if (method === 'lhs') {
+            let perm = new Uint32Array(0);
+            return {
+                method: 'lhs',
+                label: SAMPLER_LABELS.lhs,
+                fill(Z, count) {
+                    if (perm.length < count) perm = new Uint32Array(count);
+                    for (let d = 0; d < dims; d++) {
+                        const z = Z[d];
+                        for (let i = 0; i < count; i++) perm[i] = i;
+                        for (let i = count - 1; i > 0; i--) {
+                            const j = Math.floor(rng.next() * (i + 1));
+                            const t = perm[i]; perm[i] = perm[j]; perm[j] = t;
+                        }
+                        for (let i = 0; i < count; i++) {
+                            z[i] = inverseNormalCDF((perm[i] + rng.next() + 1e-12) / (count + 2e-12));
+                        }
+                    }
+                }
+            };
+        }
+        if (method === 'sobol') {
+            const seq = new SobolSequence(dims, rng);
+            const u = new Float64Array(dims);
+            return {
+                method: 'sobol',
+                label: SAMPLER_LABELS.sobol,
+                fill(Z, count) {
+                    for (let i = 0; i < count; i++) {
+                        seq.next(u);
+                        for (let d = 0; d < dims; d++) Z[d][i] = inverseNormalCDF(u[d]);
+                    }
+                }
+            };
+        }
+        return {
+            method: 'random',
+            label: SAMPLER_LABELS.random,
+            fill(Z, count) {
+                for (let d = 0; d < dims; d++) {
+                    const z = Z[d];
+                    for (let i = 0; i < count; i++) z[i] = rng.nextNormal();
+                }
+            }
+        };
+    }
+
+    // Joe & Kuo (2008) direction numbers: [degree s, coefficients a, initial m]
+    const SOBOL_DIRECTIONS = [
+        [1, 0, [1]],
+        [2, 1, [1, 3]],
+        [3, 1, [1, 3, 1]],
+        [3, 2, [1, 1, 1]],
+        [4, 1, [1, 1, 3, 3]],
+        [4, 4, [1, 3, 5, 13]],
+        [5, 2, [1, 1, 5, 5, 17]],
+        [5, 4, [1, 1, 5, 5, 5]],
+        [5, 7, [1, 1, 7, 11, 19]],
+        [5, 11, [1, 1, 5, 1, 1]],
+        [5, 13, [1, 1, 1, 3, 11]],
+        [5, 14, [1, 3, 5, 5, 31]],
+        [6, 1, [1, 3, 3, 9, 7, 49]],
+        [6, 13, [1, 1, 1, 15, 21, 21]],
+        [6, 16, [1, 3, 1, 13, 27, 49]]
+    ];
+    const SOBOL_MAX_DIMS = SOBOL_DIRECTIONS.length + 1;
+
+    /**
+     * Sobol low-discrepancy sequence (Gray-code construction, 32-bit)
+     * Randomised with a per-dimension digital shift drawn from `rng`, so
+     * estimates stay unbiased and independent streams can be combined.
+     * Points are centred in their 2^-32 cell and never touch 0 or 1.
+     * Ref: Bratley & Fox (1988); Joe & Kuo (2008)
+     */
+    class SobolSequence {
+        constructor(dims, rng = null) {
+            if (dims > SOBOL_MAX_DIMS) {
+                throw new Error(`Sobol sequence supports at most ${SOBOL_MAX_DIMS} dimensions`);
+            }
+            this.dims = dims;
+            this.index = 0;
+            this.V = new Uint32Array(dims * 32);
+            this.X = new Uint32Array(dims);
+            this.shift = new Uint32Array(dims);
+
+            for (let k = 0; k < 32; k++) this.V[k] = (1 << (31 - k)) >>> 0;
+            for (let d = 1; d < dims; d++) {
+                const [deg, a, m] = SOBOL_DIRECTIONS[d - 1];
+                const base = d * 32;
+                for (let k = 0; k < 32; k++) {
+                    if (k < deg) {
+                        this.V[base + k] = (m[k] << (31 - k)) >>> 0;
+                    } else {
+                        let v = this.V[base + k - deg] ^ (this.V[base + k - deg] >>> deg);
+                        for (let j = 1; j < deg; j++) {
+                            if ((a >>> (deg - 1 - j)) & 1) v ^= this.V[base + k - j];
+                        }
+                        this.V[base + k] = v >>> 0;
+                    }
+                }
+            }
+            if (rng) {
+                for (let d = 0; d < dims; d++) this.shift[d] = rng.nextUint32();
+            }
+        }
+
+        // Write the next point (uniform on (0, 1)^dims) into `out`
+        next(out) {
+            const n = this.index++;
+            if (n > 0) {
+                // Position of the lowest zero bit of n - 1
+                let c = 0, m = n - 1;
+                while (m & 1) { m >>>= 1; c++; }
+                for (let d = 0; d < this.dims; d++) this.X[d] ^= this.V[d * 32 + c];
+            }
+            for (let d = 0; d < this.dims; d++) {
+                out[d] = (((this.X[d] ^ this.shift[d]) >>> 0) + 0.5) / 4294967296;
+            }
+            return out;
+        }
+    }
+
+    /**
+     * Inverse standard normal CDF (Acklam's rational approximation,
+     * relative error < 1.15e-9)
+     * @param {number} p - Probability in (0, 1)
+     * @returns {number}
+     */
+    function inverseNormalCDF(p) {
+        if (p <= 0) return -Infinity;
+        if (p >= 1) return Infinity;
+
+        const a1 = -3.969683028665376e+01, a2 = 2.209460984245205e+02,
+            a3 = -2.759285104469687e+02, a4 = 1.383577518672690e+02,
+            a5 = -3.066479806614716e+01, a6 = 2.506628277459239e+00;
+        const b1 = -5.447609879822406e+01, b2 = 1.615858368580409e+02,
+            b3 = -1.556989798598866e+02, b4 = 6.680131188771972e+01,
+            b5 = -1.328068155288572e+01;
+        const c1 = -7.784894002430293e-03, c2 = -3.223964580411365e-01,
+            c3 = -2.400758277161838e+00, c4 = -2.549732539343734e+00,
+            c5 = 4.374664141464968e+00, c6 = 2.938163982698783e+00;
+        const d1 = 7.784695709041462e-03, d2 = 3.224671290700398e-01,
+            d3 = 2.445134137142996e+00, d4 = 3.754408661907416e+00;
+        const pLow = 0.02425;
+
+        if (p < pLow) {
+            const q = Math.sqrt(-2 * Math.log(p));
+            return (((((c1 * q + c2) * q + c3) * q + c4) * q + c5) * q + c6) /
+                ((((d1 * q + d2) * q + d3) * q + d4) * q + 1);
+        }
+        if (p <= 1 - pLow) {
+            const q = p - 0.5;
+            const r = q * q;
+            return (((((a1 * r + a2) * r + a3) * r + a4) * r + a5) * r + a6) * q /
+                (((((b1 * r + b2) * r + b3) * r + b4) * r + b5) * r + 1);
+        }
+        const q = Math.sqrt(-2 * Math.log(1 - p));
+        return -(((((c1 * q + c2) * q + c3) * q + c4) * q + c5) * q + c6) /
+            ((((d1 * q + d2) * q + d3) * q + d4) * q + 1);
+    }
+
+    /**
+     * Standard normal CDF Φ(x)
+     */
+    function normalCDF(x) {
+        return 0.5 * erfc(-x / Math.SQRT2);
+    }
+
+    /**
+     * Complementary error function (Numerical Recipes erfcc, |ε| < 1.2e-7)
+     */
+    function erfc(x) {
+        const z = Math.abs(x);
+        const t = 1 / (1 + 0.5 * z);
+        const r = t * Math.exp(-z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 +
+            t * (0.09678418 + t * (-0.18628806 + t * (0.27886807 + t * (-1.13520398 +
+            t * (1.48851587 + t * (-0.82215223 + t * 0.17087277)))))))));
+        return x >= 0 ? r : 2 - r;
+    }
+
+    /**
+     * Streaming Monte Carlo accumulator
+     * Welford moments, min/max, failure count and a fixed-grid fine
+     * histogram. Accumulators from independent streams merge exactly.
+     */
+    function createMCAccumulator() {
+        return {
+            n: 0,
+            mean: 0,
+            m2: 0,
+            min: Infinity,
+            max: -Infinity,
+            failures: 0,
+            fineHist: new Uint32Array(MC_FINE_BINS)
+        };
+    }
+
+    function accumulateFoS(acc, fos, count) {
+        const hist = acc.fineHist;
+        const scale = MC_FINE_BINS / 10.0;
+        let n = acc.n, mean = acc.mean, m2 = acc.m2;
+        let min = acc.min, max = acc.max, failures = acc.failures;
+
+        for (let i = 0; i < count; i++) {
+            const f = fos[i];
+            n++;
+            const delta = f - mean;
+            mean += delta / n;
+            m2 += delta * (f - mean);
+            if (f < min) min = f;
+            if (f > max) max = f;
+            if (f < 1.0) failures++;
+            let bin = Math.floor(f * scale);
+            if (bin < 0) bin = 0;
+            else if (bin >= MC_FINE_BINS) bin = MC_FINE_BINS - 1;
+            hist[bin]++;
+        }
+
+        acc.n = n; acc.mean = mean; acc.m2 = m2;
+        acc.min = min; acc.max = max; acc.failures = failures;
+        return acc;
+    }
+
+    /**
+     * Merge accumulator b into a (Chan et al. parallel variance)
+     */
+    function mergeMCAccumulators(a, b) {
+        if (b.n === 0) return a;
+        if (a.n === 0) {
+            a.n = b.n; a.mean = b.mean; a.m2 = b.m2;
+        } else {
+            const n = a.n + b.n;
+            const delta = b.mean - a.mean;
+            a.m2 += b.m2 + delta * delta * a.n * b.n / n;
+            a.mean += delta * b.n / n;
+            a.n = n;
+        }
+        a.min = Math.min(a.min, b.min);
+        a.max = Math.max(a.max, b.max);
+        a.failures += b.failures;
+        for (let i = 0; i < MC_FINE_BINS; i++) a.fineHist[i] += b.fineHist[i];
+        return a;
+    }
+
+    /**
+     * Build the public Monte Carlo result from an accumulator
+     * Fine-grid counts are re-binned into 40 bins over [min, max].
+     */
+    function summarizeMonteCarlo(acc, meta = {}) {
+        const n = acc.n;
+        const mean_fos = acc.mean;
+        const std_fos = n > 1 ? Math.sqrt(acc.m2 / (n - 1)) : 0;
+        const pf = n > 0 ? (acc.failures / n) * 100 : 0;
         const beta_index = std_fos > 0 ? (mean_fos - 1) / std_fos : 99;
+        const ci = wilsonInterval(acc.failures, n);
+
+        // Histogram data
+        const bins = 40;
+        const min_fos = acc.min;
+        const max_fos = acc.max;
+        const binWidth = (max_fos - min_fos) / bins;
+        const histogram = Array(bins).fill(0);
+        const binEdges = [];
+
+        for (let b = 0; b <= bins; b++) {
+            binEdges.push(roundTo(min_fos + b * binWidth, 3));
+        }
+
+        const fineWidth = 10.0 / MC_FINE_BINS;
+        const invWidth = binWidth > 0 ? 1 / binWidth : 0;
+        for (let i = 0; i < MC_FINE_BINS; i++) {
+            const count = acc.fineHist[i];
+            if (count === 0) continue;
+            const centre = Math.min(max_fos, Math.max(min_fos, (i + 0.5) * fineWidth));
+            const idx = Math.min(Math.floor((centre - min_fos) * invWidth), bins - 1);
+            histogram[idx] += count;
+        }
+
+        return {
+            mean_fos: roundTo(mean_fos, 4),
+            std_fos: roundTo(std_fos, 4),
+            min_fos: roundTo(min_fos, 4),
+            max_fos: roundTo(max_fos, 4),
+            probability_of_failure: roundTo(pf, 2),
+            pf_ci95: [roundTo(ci.lower * 100, 2), roundTo(ci.upper * 100, 2)],
+            reliability_index: roundTo(beta_index, 3),
+            iterations: n,
+            histogram: histogram,
+            binEdges: binEdges,
+            seed: meta.seed,
+            sampler: meta.sampler || 'random',
+            stoppedEarly: !!meta.stoppedEarly,
+            method: `Monte Carlo (${n} iterations` +
+                (meta.sampler && meta.sampler !== 'random' ? `, ${SAMPLER_LABELS[meta.sampler]}` : '') +
+                (meta.stoppedEarly ? ', converged' : '') + ')'
+        };
+    }
+
+    /**
+     * 95% Wilson score interval for a binomial proportion
+     * Non-degenerate at 0 failures, so it is safe as a stopping rule.
+     */
+    function wilsonInterval(failures, n, z = 1.96) {
+        if (n === 0) return { lower: 0, upper: 1, halfWidth: 0.5 };
+        const p = failures / n;
+        const z2 = z * z;
+        const denom = 1 + z2 / n;
+        const centre = (p + z2 / (2 * n)) / denom;
+        const half = z * Math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / denom;
+        return {
+            lower: Math.max(0, centre - half),
+            upper: Math.min(1, centre + half),
+            halfWidth: half
+        };
+    }
+
+    /**
+     * Batched Infinite Slope kernel (struct-of-arrays)
+     * Same formula and 10.0 cap as infiniteSlope(), evaluated in one tight
+     * loop over parallel Float64Arrays with no rounding or object creation.
+     *
+     * @param {Float64Array} c - Effective cohesion (kPa)
+     * @param {Float64Array} phiDeg - Friction angle (degrees)
+     * @param {Float64Array} gamma - Unit weight (kN/m³)
+     * @param {Float64Array} betaDeg - Slope angle (degrees)
+     * @param {number} depth - m
+     * @param {number} saturation - percentage (0-100)
+     * @param {Float64Array} fosOut - Receives FoS per sample
+     * @param {number} n - Number of samples
+     * @returns {Float64Array} fosOut
+     */
+    function infiniteSlopeKernel(c, phiDeg, gamma, betaDeg, depth, saturation, fosOut, n) {
+        const DEG = Math.PI / 180;
+        const hw = (saturation / 100) * depth;
+        const uFactor = WATER_DENSITY * hw;
+
+        for (let i = 0; i < n; i++) {
+            const beta = betaDeg[i] * DEG;
+            const cb = Math.cos(beta);
+            const sb = Math.sin(beta);
+            const cos2 = cb * cb;
+            const gz = gamma[i] * depth;
+
+            let sigma_prime = gz * cos2 - uFactor * cos2;
+            if (sigma_prime < 0) sigma_prime = 0;
+
+            const resisting = c[i] + sigma_prime * Math.tan(phiDeg[i] * DEG);
+            const driving = gz * sb * cb;
+
+            const fos = driving <= 0 ? 10.0 : resisting / driving;
+            fosOut[i] = fos > 10.0 ? 10.0 : fos;
+        }
+
+        return fosOut;
+    }
+
+    // ========================================================================
+    // F1. FIRST-ORDER RELIABILITY METHOD (FORM)
+    // ========================================================================
+
+    /**
+     * Hasofer-Lind reliability index by FORM (HL-RF iteration)
+     * 
+     * Same random variables as monteCarloSimulation() — c', φ', γ and β,
+     * independent normals with the CoVs of createMCInputs() — mapped to
+     * standard normal space u. The limit state g(u) = FoS(x(u)) − 1 is the
+     * infinite-slope FoS, differentiated analytically, and the design point
+     * u* (closest point on g = 0 to the origin) is found by HL-RF:
+     * 
+     *   u_{k+1} = [(∇g·u_k − g) / |∇g|²] ∇g
+     * 
+     * β = ±|u*| (negative when the mean point already fails),
+     * P(failure) ≈ Φ(−β), and the sensitivity factors α = −∇g/|∇g| at u*
+     * (u* = β·α) give each variable's share of the failure probability
+     * (Σα² = 1). MC truncation of c', φ' and β at their lower bounds is
+     * not modelled.
+     * 
+     * @param {Object} params - Mean values (as monteCarloSimulation)
+     * @param {Object} [options] - { maxIter, tolerance }
+     * @returns {Object}
+     */
+    function formAnalysis(params, options = {}) {
+        const { maxIter = 50, tolerance = 1e-6 } = options;
+        const inputs = createMCInputs(params);
+        const names = ['cohesion', 'frictionAngle', 'unitWeight', 'slopeAngle'];
+        const mean = [inputs.cohesion, inputs.frictionAngle, inputs.unitWeight, inputs.slopeAngle];
+        const sd = [inputs.sd_c, inputs.sd_phi, inputs.sd_gamma, inputs.sd_slope];
+
+        const u = [0, 0, 0, 0];
+        const x = [0, 0, 0, 0];
+        const grad = [0, 0, 0, 0];
+        let evaluations = 0;
+
+        // g(u) and ∇g(u) in standard normal space
+        function limitState(uk) {
+            for (let i = 0; i < 4; i++) x[i] = mean[i] + sd[i] * uk[i];
+            evaluations++;
+            const g = formLimitState(x[0], x[1], x[2], x[3], inputs.depth, inputs.saturation, grad);
+            for (let i = 0; i < 4; i++) grad[i] *= sd[i];
+            return g;
+        }
+
+        const g0 = limitState(u);
+        let g = g0;
+        let converged = false;
+        let iterations = 0;
+
+        for (let iter = 0; iter < maxIter; iter++) {
+            iterations = iter + 1;
+            let gu = 0, gg = 0;
+            for (let i = 0; i < 4; i++) { gu += grad[i] * u[i]; gg += grad[i] * grad[i]; }
+            if (gg === 0) break;
+
+            const scale = (gu - g) / gg;
+            let step = 0;
+            for (let i = 0; i < 4; i++) {
+                const next = scale * grad[i];
+                step = Math.max(step, Math.abs(next - u[i]));
+                u[i] = next;
+            }
+
+            g = limitState(u);
+            if (step < tolerance * Math.max(1, Math.hypot(...u)) && Math.abs(g) < 1e-4) {
+                converged = true;
+                break;
+            }
+        }
+
+        const dist = Math.hypot(...u);
+        const beta = g0 >= 0 ? dist : -dist;
+        const gNorm = Math.hypot(...grad);
+        const designPoint = {};
+        const sensitivity = {};
+        names.forEach((name, i) => {
+            designPoint[name] = roundTo(mean[i] + sd[i] * u[i], 3);
+            sensitivity[name] = roundTo(gNorm > 0 ? -grad[i] / gNorm : 0, 4);
+        });
+
+        return {
+            reliability_index: roundTo(beta, 3),
+            probability_of_failure: roundTo(normalCDF(-beta) * 100, 4),
+            designPoint: designPoint,
+            designPointU: u.slice(),
+            sensitivity: sensitivity,
+            iterations: iterations,
+            evaluations: evaluations,
+            converged: converged,
+            method: 'FORM (Hasofer-Lind, HL-RF)'
+        };
+    }
+
+    /**
+     * Infinite-slope limit state g = FoS − 1 (uncapped) and its analytic
+     * gradient with respect to (c', φ'°, γ, β°), written into gradOut
+     */
+    function formLimitState(c, phiDeg, gamma, betaDeg, depth, saturation, gradOut) {
+        const DEG = Math.PI / 180;
+        const phi = phiDeg * DEG;
+        const beta = betaDeg * DEG;
+        const cb = Math.cos(beta);
+        const sb = Math.sin(beta);
+        const tanPhi = Math.tan(phi);
+        const uw = WATER_DENSITY * (saturation / 100) * depth;
+
+        const net = gamma * depth - uw;          // σ' = net·cos²β while positive
+        const active = net > 0 ? 1 : 0;
+        const sigma_prime = active * net * cb * cb;
+        const R = c + sigma_prime * tanPhi;
+        const D = gamma * depth * sb * cb;
+        const D2 = D * D;
+
+        const dR_dgamma = active * depth * cb * cb * tanPhi;
+        const dD_dgamma = depth * sb * cb;
+        const dR_dbeta = -2 * active * net * sb * cb * tanPhi;
+        const dD_dbeta = gamma * depth * (cb * cb - sb * sb);
+
+        gradOut[0] = 1 / D;
+        gradOut[1] = sigma_prime / (Math.cos(phi) * Math.cos(phi)) / D * DEG;
+        gradOut[2] = (dR_dgamma * D - R * dD_dgamma) / D2;
+        gradOut[3] = (dR_dbeta * D - R * dD_dbeta) / D2 * DEG;
+
+        return R / D - 1;
+    }
+
+    // ========================================================================
+    // F2. RARE-EVENT PROBABILITY (IMPORTANCE SAMPLING)
+    // ========================================================================
+
+    /**
+     * Small failure probabilities by importance sampling at the FORM
+     * design point
+     * 
+     * Crude Monte Carlo needs ~100/Pf samples for a 10% CoV, so a 2,000
+     * sample run reports 0% for any Pf below ~1e-3. Here standard normal
+     * samples are drawn from N(u*, I), centred on the FORM design point u*,
+     * and each failure is weighted by the likelihood ratio
+     * 
+     *   w(u) = φ(u) / φ(u − u*) = exp(−u·u* + |u*|²/2)
+     * 
+     * Samples are mapped to c', φ', γ, β exactly as in monteCarloSimulation()
+     * (same truncations) and evaluated by infiniteSlopeKernel(). Sampling
+     * continues in blocks until the estimator's CoV is below targetCoV.
+     * When β ≤ 0 (mean point fails) no shift is applied — crude sampling is
+     * already efficient there.
+     * 
+     * @param {Object} params - Mean values (as monteCarloSimulation)
+     * @param {Object} [options] - { seed, targetCoV, minSamples, maxSamples, form }
+     * @returns {Object}
+     */
+    function rareEventProbability(params, options = {}) {
+        const {
+            seed = MC_DEFAULT_SEED,
+            targetCoV = 0.1,
+            minSamples = 1000,
+            maxSamples = 50000
+        } = options;
+
+        const form = options.form || formAnalysis(params);
+        const inputs = createMCInputs(params);
+        const shift = form.reliability_index > 0 ? form.designPointU : [0, 0, 0, 0];
+        const shiftSq = shift.reduce((s, v) => s + v * v, 0);
+
+        const rng = new SeededRandom(seed, 0);
+        const normals = createSampler('random', 4, rng);
+        const block = createMCBlock(MC_BLOCK_SIZE);
+        const logW = new Float64Array(MC_BLOCK_SIZE);
+
+        // Shifted source: u = z + u*, recording the log likelihood ratio
+        const source = {
+            fill(Z, count) {
+                normals.fill(Z, count);
+                logW.fill(shiftSq / 2, 0, count);
+                for (let d = 0; d < 4; d++) {
+                    const z = Z[d], s = shift[d];
+                    if (s === 0) continue;
+                    for (let i = 0; i < count; i++) {
+                        z[i] += s;
+                        logW[i] -= z[i] * s;
+                    }
+                }
+            }
+        };
 
-        // Histogram data
-        const bins = 40;
-        const min_fos = Math.min(...fosResults);
-        const max_fos = Math.max(...fosResults);
-        const binWidth = (max_fos - min_fos) / bins;
-        const histogram = Array(bins).fill(0);
-        const binEdges = [];
+        let n = 0, hits = 0, sumW = 0, sumW2 = 0;
+        let cov = Infinity;
+
+        while (n < maxSamples) {
+            const count = Math.min(block.size, maxSamples - n);
+            sampleMCBlock(inputs, source, block, count);
+            infiniteSlopeKernel(block.c, block.phi, block.gamma, block.slope,
+                inputs.depth, inputs.saturation, block.fos, count);
+
+            for (let i = 0; i < count; i++) {
+                if (block.fos[i] < 1.0) {
+                    const w = Math.exp(logW[i]);
+                    hits++;
+                    sumW += w;
+                    sumW2 += w * w;
+                }
+            }
+            n += count;
 
-        for (let b = 0; b <= bins; b++) {
-            binEdges.push(parseFloat((min_fos + b * binWidth).toFixed(3)));
+            if (sumW > 0) {
+                const pf = sumW / n;
+                const variance = Math.max(0, sumW2 / n - pf * pf) / n;
+                cov = Math.sqrt(variance) / pf;
+            }
+            if (n >= minSamples && hits > 0 && cov <= targetCoV) break;
         }
 
-        for (const f of fosResults) {
-            const idx = Math.min(Math.floor((f - min_fos) / binWidth), bins - 1);
-            histogram[idx]++;
-        }
+        const pf = sumW / n;
+        const half = isFinite(cov) ? 1.96 * cov * pf : 0;
 
         return {
-            mean_fos: parseFloat(mean_fos.toFixed(4)),
-            std_fos: parseFloat(std_fos.toFixed(4)),
-            min_fos: parseFloat(min_fos.toFixed(4)),
-            max_fos: parseFloat(max_fos.toFixed(4)),
-            probability_of_failure: parseFloat(pf.toFixed(2)),
-            reliability_index: parseFloat(beta_index.toFixed(3)),
-            iterations: iterations,
-            histogram: histogram,
-            binEdges: binEdges,
-            rawResults: fosResults,
-            method: `Monte Carlo (${iterations} iterations)`
+            probability_of_failure: roundSig(pf * 100, 4),
+            pf_ci95: [
+                roundSig(Math.max(0, pf - half) * 100, 4),
+                roundSig(Math.min(1, pf + half) * 100, 4)
+            ],
+            cov: isFinite(cov) ? roundTo(cov, 4) : null,
+            reliability_index: pf > 0 && pf < 1 ? roundTo(-inverseNormalCDF(pf), 3) : null,
+            samples: n,
+            failures: hits,
+            converged: hits > 0 && cov <= targetCoV,
+            form_beta: form.reliability_index,
+            seed: seed,
+            method: `Importance Sampling at FORM design point (${n} samples)`
         };
     }
 
@@ -663,8 +3556,6 @@ const GeotechnicalEngine = (function () {
             depth = DEFAULT_DEPTH
         } = baseParams;
 
-        const base_fos = infiniteSlope(baseParams).fos;
-        const results = {};
         const paramMap = {
             cohesion: { label: 'Cohesion (c\')', value: cohesion },
             frictionAngle: { label: 'Friction Angle (φ\')', value: frictionAngle },
@@ -672,35 +3563,47 @@ const GeotechnicalEngine = (function () {
             unitWeight: { label: 'Unit Weight (γ)', value: unitWeight },
             saturation: { label: 'Saturation (%)', value: saturation }
         };
+        const keys = Object.keys(paramMap);
+
+        // Point 0 is the base case; points 2k+1 / 2k+2 are +10% / −10% of key k
+        const nPoints = 1 + 2 * keys.length;
+        const inputs = Object.assign({}, baseParams);
+        keys.forEach(key => {
+            const column = new Float64Array(nPoints).fill(paramMap[key].value);
+            inputs[key] = column;
+        });
+        keys.forEach((key, k) => {
+            const high = paramMap[key].value * 1.1;
+            inputs[key][2 * k + 1] = key === 'saturation' ? Math.min(100, high) : high;
+            inputs[key][2 * k + 2] = paramMap[key].value * 0.9;
+        });
+        const fos = infiniteSlopeBatch(inputs, { fos: new Float64Array(nPoints) }, nPoints).fos;
 
-        for (const [key, info] of Object.entries(paramMap)) {
-            // +10% case
-            const highParams = { ...baseParams };
-            highParams[key] = info.value * 1.1;
-            if (key === 'saturation') highParams[key] = Math.min(100, highParams[key]);
-            const fos_high = infiniteSlope(highParams).fos;
+        // Swing from the reported (rounded) FoS, so swing = |high − low| as displayed
+        const base_fos = roundTo(fos[0], 4);
+        const results = {};
 
-            // -10% case
-            const lowParams = { ...baseParams };
-            lowParams[key] = info.value * 0.9;
-            const fos_low = infiniteSlope(lowParams).fos;
+        keys.forEach((key, k) => {
+            const info = paramMap[key];
+            const fos_high = roundTo(fos[2 * k + 1], 4);
+            const fos_low = roundTo(fos[2 * k + 2], 4);
 
             results[key] = {
                 label: info.label,
                 baseValue: info.value,
-                fos_high: parseFloat(fos_high.toFixed(4)),
-                fos_low: parseFloat(fos_low.toFixed(4)),
-                swing: parseFloat(Math.abs(fos_high - fos_low).toFixed(4)),
-                sensitivity_pct: parseFloat((Math.abs(fos_high - fos_low) / base_fos * 100).toFixed(1))
+                fos_high: fos_high,
+                fos_low: fos_low,
+                swing: roundTo(Math.abs(fos_high - fos_low), 4),
+                sensitivity_pct: roundTo(Math.abs(fos_high - fos_low) / base_fos * 100, 1)
             };
-        }
+        });
 
         // Sort by sensitivity
         const sortedKeys = Object.keys(results).sort((a, b) => results[b].swing - results[a].swing);
         const mostSensitive = sortedKeys[0];
 
         return {
-            base_fos: parseFloat(base_fos.toFixed(4)),
+            base_fos: base_fos,
             results: results,
             sortedKeys: sortedKeys,
             mostSensitive: mostSensitive,
@@ -709,6 +3612,170 @@ const GeotechnicalEngine = (function () {
         };
     }
 
+    /**
+     * Parameters and spreads for global sensitivity (standard normal z → value)
+     * c', φ', γ and β match createMCInputs(); saturation and depth add
+     * ±15 percentage points and 20% CoV respectively.
+     */
+    const GSA_PARAMS = [
+        { key: 'cohesion', label: 'Cohesion (c\')', map: (m, z) => Math.max(0.1, m * (1 + 0.3 * z)) },
+        { key: 'frictionAngle', label: 'Friction Angle (φ\')', map: (m, z) => Math.max(5, m * (1 + 0.1 * z)) },
+        { key: 'slopeAngle', label: 'Slope Angle (β)', map: (m, z) => Math.max(5, m + 2.0 * z) },
+        { key: 'unitWeight', label: 'Unit Weight (γ)', map: (m, z) => m * (1 + 0.05 * z) },
+        { key: 'saturation', label: 'Saturation (%)', map: (m, z) => Math.min(100, Math.max(0, m + 15 * z)) },
+        { key: 'depth', label: 'Failure Depth (z)', map: (m, z) => Math.max(0.5, m * (1 + 0.2 * z)) }
+    ];
+
+    /**
+     * Global variance-based (Sobol) sensitivity indices
+     * 
+     * Saltelli (2010) scheme on a scrambled Sobol sequence: matrices A, B
+     * and A_B^(i) (A with column i from B) give N·(k + 2) FoS evaluations,
+     * all in one infiniteSlopeBatch() call.
+     * 
+     *   S_i  = mean[f(B)·(f(A_B^i) − f(A))] / V        (first order)
+     *   ST_i = mean[(f(A) − f(A_B^i))²] / 2V           (total effect, Jansen)
+     * 
+     * ST_i − S_i measures interactions that a one-at-a-time tornado misses.
+     * With screening, a Morris-style radial pre-pass (elementary effects of
+     * +1σ steps from random base points) fixes parameters whose μ* is below
+     * screenThreshold × max μ* at their mean, shrinking k.
+     * 
+     * @param {Object} params - Mean values (cohesion, frictionAngle, slopeAngle,
+     *                          unitWeight, saturation, depth, rootCohesion, ...)
+     * @param {Object} [options] - { samples, seed, screening, trajectories, screenThreshold }
+     * @returns {Object}
+     */
+    function sobolSensitivity(params, options = {}) {
+        const {
+            samples = 512,
+            seed = MC_DEFAULT_SEED,
+            screening = false,
+            trajectories = 10,
+            screenThreshold = 0.1
+        } = options;
+
+        const defaults = { cohesion: 5, frictionAngle: 30, slopeAngle: 35, unitWeight: 19, saturation: 50, depth: DEFAULT_DEPTH };
+        const means = GSA_PARAMS.map(p => params[p.key] !== undefined ? params[p.key] : defaults[p.key]);
+        const rng = new SeededRandom(seed, 1);
+        const results = {};
+        let evaluations = 0;
+
+        // Inputs not varied (root cohesion, crack reduction, ...) are broadcast
+        function batchInputs() {
+            const inputs = Object.assign({}, params);
+            GSA_PARAMS.forEach((p, i) => { inputs[p.key] = means[i]; });
+            return inputs;
+        }
+
+        // --- Optional Morris screening ---
+        let active = GSA_PARAMS.map((p, i) => i);
+        if (screening) {
+            const d = GSA_PARAMS.length;
+            const nPts = trajectories * (d + 1);
+            const inputs = batchInputs();
+            const cols = GSA_PARAMS.map(() => new Float64Array(nPts));
+            for (let t = 0; t < trajectories; t++) {
+                const z0 = GSA_PARAMS.map(() => rng.nextNormal());
+                for (let j = 0; j <= d; j++) {
+                    const row = t * (d + 1) + j;
+                    GSA_PARAMS.forEach((p, i) => {
+                        cols[i][row] = p.map(means[i], z0[i] + (j === i + 1 ? 1 : 0));
+                    });
+                }
+            }
+            GSA_PARAMS.forEach((p, i) => { inputs[p.key] = cols[i]; });
+            const f = infiniteSlopeBatch(inputs, { fos: new Float64Array(nPts) }, nPts).fos;
+            evaluations += nPts;
+
+            const muStar = GSA_PARAMS.map((p, i) => {
+                let sum = 0;
+                for (let t = 0; t < trajectories; t++) {
+                    const base = t * (d + 1);
+                    sum += Math.abs(f[base + i + 1] - f[base]);
+                }
+                return sum / trajectories;
+            });
+            const maxMu = Math.max(...muStar);
+            active = active.filter(i => muStar[i] >= screenThreshold * maxMu);
+            GSA_PARAMS.forEach((p, i) => {
+                results[p.key] = { label: p.label, baseValue: means[i], mu_star: roundTo(muStar[i], 4) };
+            });
+        } else {
+            GSA_PARAMS.forEach((p, i) => { results[p.key] = { label: p.label, baseValue: means[i] }; });
+        }
+
+        // --- Saltelli design: rows [A | B | A_B^(1) ... A_B^(k)] ---
+        const k = active.length;
+        const N = Math.max(16, Math.floor(samples));
+        const nRows = N * (k + 2);
+        const Z = [];
+        for (let j = 0; j < 2 * k; j++) Z.push(new Float64Array(N));
+        createSampler('sobol', 2 * k, rng).fill(Z, N);
+
+        const inputs = batchInputs();
+        active.forEach((pi, a) => {
+            const p = GSA_PARAMS[pi];
+            const col = new Float64Array(nRows);
+            const zA = Z[a], zB = Z[k + a];
+            for (let r = 0; r < N; r++) {
+                const vA = p.map(means[pi], zA[r]);
+                const vB = p.map(means[pi], zB[r]);
+                col[r] = vA;
+                col[N + r] = vB;
+                for (let m = 0; m < k; m++) col[(2 + m) * N + r] = m === a ? vB : vA;
+            }
+            inputs[p.key] = col;
+        });
+        const f = infiniteSlopeBatch(inputs, { fos: new Float64Array(nRows) }, nRows).fos;
+        evaluations += nRows;
+
+        // Output mean and variance over A ∪ B
+        let mean = 0;
+        for (let r = 0; r < 2 * N; r++) mean += f[r];
+        mean /= 2 * N;
+        let variance = 0;
+        for (let r = 0; r < 2 * N; r++) variance += (f[r] - mean) * (f[r] - mean);
+        variance /= 2 * N - 1;
+
+        active.forEach((pi, a) => {
+            let first = 0, total = 0;
+            const off = (2 + a) * N;
+            for (let r = 0; r < N; r++) {
+                const fA = f[r], fB = f[N + r], fAB = f[off + r];
+                first += fB * (fAB - fA);
+                total += (fA - fAB) * (fA - fAB);
+            }
+            const S = variance > 0 ? first / N / variance : 0;
+            const ST = variance > 0 ? total / N / (2 * variance) : 0;
+            Object.assign(results[GSA_PARAMS[pi].key], {
+                first: roundTo(Math.min(1, Math.max(0, S)), 4),
+                total: roundTo(Math.min(1, Math.max(0, ST)), 4),
+                screened: false
+            });
+        });
+        GSA_PARAMS.forEach((p, i) => {
+            if (active.indexOf(i) < 0) Object.assign(results[p.key], { first: 0, total: 0, screened: true });
+        });
+
+        const sortedKeys = Object.keys(results).sort((a, b) => results[b].total - results[a].total);
+        const interaction = sortedKeys.reduce((s, key) => s + results[key].total - results[key].first, 0);
+
+        return {
+            mean_fos: roundTo(mean, 4),
+            variance: roundTo(variance, 6),
+            results: results,
+            sortedKeys: sortedKeys,
+            mostSensitive: sortedKeys[0],
+            mostSensitiveLabel: results[sortedKeys[0]].label,
+            interactionShare: roundTo(Math.max(0, interaction), 4),
+            samples: N,
+            evaluations: evaluations,
+            screened: GSA_PARAMS.filter((p, i) => active.indexOf(i) < 0).map(p => p.key),
+            method: `Sobol indices (Saltelli, N=${N}${screening ? ', Morris screening' : ''})`
+        };
+    }
+
     // ========================================================================
     // H. KALMAN FILTER
     // ========================================================================
@@ -750,6 +3817,284 @@ const GeotechnicalEngine = (function () {
         }
     }
 
+    function fillChannels(size, value) {
+        const out = new Float64Array(size);
+        if (typeof value === 'number') out.fill(value);
+        else out.set(value);
+        return out;
+    }
+
+    /**
+     * Bank of independent 1D Kalman filters on typed arrays
+     * Same random-walk model as KalmanFilter, for many channels at once
+     * (the piezometers, tiltmeters and rain gauges of a site or district):
+     * state, variance and gain live in Float64Arrays and update() advances
+     * every channel in one allocation-free pass. Channel i tracks exactly
+     * what a KalmanFilter with the same Q, R, P would.
+     */
+    class KalmanFilterBank {
+        /**
+         * @param {number} size - Channel count
+         * @param {Object} [options] - { Q, R, P } — one number for all channels, or per-channel arrays
+         */
+        constructor(size, options = {}) {
+            const { Q = 0.1, R = 1.0, P = 1.0 } = options;
+            this.size = size;
+            this.Q = fillChannels(size, Q);
+            this.R = fillChannels(size, R);
+            this.P0 = fillChannels(size, P);
+            this.P = this.P0.slice();
+            this.K = new Float64Array(size);
+            this.X = new Float64Array(size);
+            this.initialized = new Uint8Array(size);
+        }
+
+        /**
+         * Advance all channels one timestep
+         * @param {ArrayLike<number>} measurements - One reading per channel; NaN = no
+         *   reading (the channel only predicts, so its variance grows)
+         * @returns {Float64Array} State estimates (live view of this.X)
+         */
+        update(measurements) {
+            const { size, Q, R, P, K, X, initialized } = this;
+            for (let i = 0; i < size; i++) {
+                const z = measurements[i];
+                if (!(z === z)) {
+                    if (initialized[i]) P[i] += Q[i];
+                    continue;
+                }
+                if (!initialized[i]) {
+                    X[i] = z;
+                    initialized[i] = 1;
+                    continue;
+                }
+                const p = P[i] + Q[i];
+                const k = p / (p + R[i]);
+                X[i] += k * (z - X[i]);
+                P[i] = (1 - k) * p;
+                K[i] = k;
+            }
+            return X;
+        }
+
+        /**
+         * @param {number} [channel] - Reset one channel; all when omitted
+         */
+        reset(channel) {
+            if (channel === undefined) {
+                this.P.set(this.P0);
+                this.K.fill(0);
+                this.X.fill(0);
+                this.initialized.fill(0);
+                return;
+            }
+            this.P[channel] = this.P0[channel];
+            this.K[channel] = 0;
+            this.X[channel] = 0;
+            this.initialized[channel] = 0;
+        }
+    }
+
+    function identityMatrix(n) {
+        const I = new Float64Array(n * n);
+        for (let i = 0; i < n; i++) I[i * n + i] = 1;
+        return I;
+    }
+
+    /**
+     * Linear Kalman filter for a few correlated channels (e.g. pore
+     * pressure driven by rainfall)
+     *
+     *   x ← F·x,  P ← F·P·Fᵀ + Q
+     *   K = P·Hᵀ·(H·P·Hᵀ + R)⁻¹,  x ← x + K·(z − H·x),  P ← P − K·S·Kᵀ
+     *
+     * Matrices are row-major Float64Arrays and all scratch space is
+     * allocated up front, so a step allocates nothing. The innovation
+     * covariance is solved by Cholesky. Missing readings (NaN) drop their
+     * rows from the update, so a silent sensor still gets its state
+     * inferred through the correlations.
+     */
+    class MultivariateKalmanFilter {
+        /**
+         * @param {Object} model - { F (n×n), H (m×n), Q (n×n), R (m×m), x0 (n), P0 (n×n) };
+         *   F, H and P0 default to identity, Q to zero
+         */
+        constructor(model) {
+            const n = model.x0 ? model.x0.length : Math.round(Math.sqrt(model.F.length));
+            const m = model.H ? model.H.length / n : n;
+            this.n = n;
+            this.m = m;
+            this.F = model.F ? Float64Array.from(model.F) : identityMatrix(n);
+            this.H = model.H ? Float64Array.from(model.H) : identityMatrix(n);
+            this.Q = model.Q ? Float64Array.from(model.Q) : new Float64Array(n * n);
+            this.R = Float64Array.from(model.R);
+            this.x = model.x0 ? Float64Array.from(model.x0) : new Float64Array(n);
+            this.P = model.P0 ? Float64Array.from(model.P0) : identityMatrix(n);
+            this.innovation = new Float64Array(m);
+
+            this.scratch = {
+                x: new Float64Array(n),
+                FP: new Float64Array(n * n),
+                PHt: new Float64Array(n * m),
+                S: new Float64Array(m * m),
+                K: new Float64Array(n * m),
+                y: new Float64Array(m),
+                rows: new Int32Array(m)
+            };
+        }
+
+        predict() {
+            const { n, F, Q, x, P } = this;
+            const { x: tx, FP } = this.scratch;
+            for (let i = 0; i < n; i++) {
+                let s = 0;
+                for (let j = 0; j < n; j++) s += F[i * n + j] * x[j];
+                tx[i] = s;
+            }
+            x.set(tx);
+            for (let i = 0; i < n; i++) {
+                for (let j = 0; j < n; j++) {
+                    let s = 0;
+                    for (let k = 0; k < n; k++) s += F[i * n + k] * P[k * n + j];
+                    FP[i * n + j] = s;
+                }
+            }
+            for (let i = 0; i < n; i++) {
+                for (let j = i; j < n; j++) {
+                    let s = Q[i * n + j];
+                    for (let k = 0; k < n; k++) s += FP[i * n + k] * F[j * n + k];
+                    P[i * n + j] = s;
+                    P[j * n + i] = s;
+                }
+            }
+            return x;
+        }
+
+        /**
+         * @param {ArrayLike<number>} z - Measurement vector (m), NaN = missing
+         * @returns {Float64Array} State estimate (live view of this.x)
+         */
+        update(z) {
+            const { n, m, H, R, x, P, innovation } = this;
+            const { PHt, S, K, y, rows } = this.scratch;
+
+            let k = 0;
+            for (let j = 0; j < m; j++) {
+                innovation[j] = NaN;
+                if (z[j] === z[j]) rows[k++] = j;
+            }
+            if (k === 0) return x;
+
+            for (let r = 0; r < k; r++) {
+                const h = rows[r] * n;
+                let s = z[rows[r]];
+                for (let b = 0; b < n; b++) s -= H[h + b] * x[b];
+                y[r] = s;
+                innovation[rows[r]] = s;
+            }
+            // PHt (n×k) and S = H·P·Hᵀ + R (k×k)
+            for (let a = 0; a < n; a++) {
+                for (let r = 0; r < k; r++) {
+                    const h = rows[r] * n;
+                    let s = 0;
+                    for (let b = 0; b < n; b++) s += P[a * n + b] * H[h + b];
+                    PHt[a * k + r] = s;
+                }
+            }
+            for (let r = 0; r < k; r++) {
+                const h = rows[r] * n;
+                for (let c = 0; c <= r; c++) {
+                    let s = R[rows[r] * m + rows[c]];
+                    for (let b = 0; b < n; b++) s += H[h + b] * PHt[b * k + c];
+                    S[r * k + c] = s;
+                }
+            }
+            // Cholesky S = L·Lᵀ (lower triangle, in place)
+            for (let r = 0; r < k; r++) {
+                for (let c = 0; c <= r; c++) {
+                    let s = S[r * k + c];
+                    for (let q = 0; q < c; q++) s -= S[r * k + q] * S[c * k + q];
+                    if (r === c) {
+                        if (!(s > 0)) throw new Error('Innovation covariance is not positive definite');
+                        S[r * k + r] = Math.sqrt(s);
+                    } else {
+                        S[r * k + c] = s / S[c * k + c];
+                    }
+                }
+            }
+            // K = PHt·S⁻¹, row by row: L·Lᵀ·kᵀ = PHtᵀ
+            for (let a = 0; a < n; a++) {
+                const o = a * k;
+                for (let r = 0; r < k; r++) {
+                    let s = PHt[o + r];
+                    for (let q = 0; q < r; q++) s -= S[r * k + q] * K[o + q];
+                    K[o + r] = s / S[r * k + r];
+                }
+                for (let r = k - 1; r >= 0; r--) {
+                    let s = K[o + r];
+                    for (let q = r + 1; q < k; q++) s -= S[q * k + r] * K[o + q];
+                    K[o + r] = s / S[r * k + r];
+                }
+            }
+            // x += K·y;  P −= K·S·Kᵀ = K·PHtᵀ (kept symmetric)
+            for (let a = 0; a < n; a++) {
+                let s = 0;
+                for (let r = 0; r < k; r++) s += K[a * k + r] * y[r];
+                x[a] += s;
+            }
+            for (let a = 0; a < n; a++) {
+                for (let b = a; b < n; b++) {
+                    let s = 0;
+                    for (let r = 0; r < k; r++) s += K[a * k + r] * PHt[b * k + r];
+                    const v = P[a * n + b] - s;
+                    P[a * n + b] = v;
+                    P[b * n + a] = v;
+                }
+            }
+            return x;
+        }
+
+        /**
+         * Predict then update — one timestep
+         */
+        step(z) {
+            this.predict();
+            return this.update(z);
+        }
+    }
+
+    /**
+     * Two-state filter fusing a piezometer with a rain gauge
+     * State [u (kPa), r (mm/h)], both observed. Rain persists as AR(1)
+     * and loads pore pressure over the next step, so a rain reading moves
+     * the pore-pressure estimate before the piezometer responds (and fills
+     * it in while the piezometer is silent). A short-horizon model for
+     * fusing readings, not a seepage model.
+     *
+     * @param {Object} [options] - { dt (h), gain (kPa per mm), persistence,
+     *   processNoise [qu, qr], measurementNoise [ru, rr], u0, r0 }
+     * @returns {MultivariateKalmanFilter}
+     */
+    function createPorePressureRainfallFilter(options = {}) {
+        const {
+            dt = 1,
+            gain = 0.2,
+            persistence = 0.8,
+            processNoise = [0.05, 1.0],
+            measurementNoise = [0.5, 0.25],
+            u0 = 0,
+            r0 = 0
+        } = options;
+        return new MultivariateKalmanFilter({
+            F: [1, gain * dt, 0, persistence],
+            H: [1, 0, 0, 1],
+            Q: [processNoise[0], 0, 0, processNoise[1]],
+            R: [measurementNoise[0], 0, 0, measurementNoise[1]],
+            x0: [u0, r0],
+            P0: [10, 0, 0, 10]
+        });
+    }
+
     // ========================================================================
     // I. STRUCTURAL ASSESSMENT
     // ========================================================================
@@ -785,12 +4130,12 @@ const GeotechnicalEngine = (function () {
             distanceFromCrest / (effectiveSetback * 1.5));
 
         return {
-            minSetback_IS: parseFloat(minSetback_IS.toFixed(1)),
-            minSetback_IRC: parseFloat(minSetback_IRC.toFixed(1)),
-            effectiveSetback: parseFloat(effectiveSetback.toFixed(1)),
+            minSetback_IS: roundTo(minSetback_IS, 1),
+            minSetback_IRC: roundTo(minSetback_IRC, 1),
+            effectiveSetback: roundTo(effectiveSetback, 1),
             actualSetback: distanceFromCrest,
             isSetbackSafe: isSetbackSafe,
-            bearingCapacityReduction: parseFloat(((1 - reductionFactor) * 100).toFixed(1)),
+            bearingCapacityReduction: roundTo((1 - reductionFactor) * 100, 1),
             recommendation: isSetbackSafe
                 ? 'Foundation within safe setback distance as per IS 14458 / IRC:SP:48.'
                 : `UNSAFE: Foundation is ${(effectiveSetback - distanceFromCrest).toFixed(1)}m closer than minimum setback. Relocation or retaining structure required.`,
@@ -842,12 +4187,12 @@ const GeotechnicalEngine = (function () {
         const fosSliding = friction_base / Pa;
 
         return {
-            Ka: parseFloat(Ka.toFixed(4)),
-            activePressure_kN: parseFloat(Pa.toFixed(2)),
-            minBaseWidth: parseFloat(minBaseWidth.toFixed(2)),
-            wallWeight_kN: parseFloat(wallWeight.toFixed(1)),
-            fosOverturning: parseFloat(fosOverturning.toFixed(3)),
-            fosSliding: parseFloat(fosSliding.toFixed(3)),
+            Ka: roundTo(Ka, 4),
+            activePressure_kN: roundTo(Pa, 2),
+            minBaseWidth: roundTo(minBaseWidth, 2),
+            wallWeight_kN: roundTo(wallWeight, 1),
+            fosOverturning: roundTo(fosOverturning, 3),
+            fosSliding: roundTo(fosSliding, 3),
             isStable: fosOverturning >= 2.0 && fosSliding >= 1.5,
             overturningStatus: fosOverturning >= 2.0 ? 'SAFE (≥2.0)' : 'INADEQUATE (<2.0)',
             slidingStatus: fosSliding >= 1.5 ? 'SAFE (≥1.5)' : 'INADEQUATE (<1.5)',
@@ -861,39 +4206,14 @@ const GeotechnicalEngine = (function () {
     // ========================================================================
 
     /**
-     * Run complete site analysis combining all modules
-     * This is the main entry point for the risk assessment
+     * Soil properties for a site — SOIL_DATABASE entry, with SoilGrids
+     * engineering estimates substituted where available
      * 
-     * @param {Object} siteData - All field inputs
-     * @returns {Object} Comprehensive analysis results
+     * @param {string} soilType - SOIL_DATABASE key
+     * @param {Object|null} liveSoil - ApiService soil result
+     * @returns {Object} Soil profile (SOIL_DATABASE shape)
      */
-    function runComprehensiveAnalysis(siteData) {
-        const {
-            location = {},
-            slopeAngle = 35,
-            soilType = 'clayey_sand',
-            vegetationPct = 40,
-            rainfallIntensity = 5,
-            rainfallDuration = 24,
-            houseDistance = 6,
-            drainageCondition = 'poor',
-            saturation = 50,
-            cracks = false,
-            seepage = false,
-            pastLandslides = false,
-            construction = false,
-            // Live data from APIs
-            liveWeather = null,
-            liveHistorical = null,
-            liveElevation = null,
-            liveEarthquakes = null,
-            liveSoil = null,
-            liveGeocode = null,
-            demSlope = null,
-            elevation = null
-        } = siteData;
-
-        // Get soil properties — prefer live SoilGrids data if available
+    function resolveSoilProfile(soilType, liveSoil = null) {
         let soil = SOIL_DATABASE[soilType] || SOIL_DATABASE['clayey_sand'];
 
         // Override soil params with real SoilGrids engineering properties
@@ -910,201 +4230,646 @@ const GeotechnicalEngine = (function () {
             });
         }
 
-        // Use DEM slope if available and user hasn't manually overridden
-        var effectiveSlope = slopeAngle;
-        if (demSlope && demSlope > 0 && Math.abs(demSlope - 35) > 1) {
-            // Blend DEM slope with user input (DEM takes 60% weight for better accuracy)
-            effectiveSlope = Math.round(demSlope * 0.6 + slopeAngle * 0.4);
-        }
+        return soil;
+    }
+
+    /**
+     * Composite FoS alone (0.40 IS + 0.35 Bishop + 0.25 Janbu) — the
+     * deterministic core of runComprehensiveAnalysis() on the synthetic
+     * slip surface, without the hydrological, stochastic and structural
+     * stages. Used for what-if sweeps and surrogate fitting.
+     * 
+     * @param {Object} params - { cohesion, frictionAngle, unitWeight, slopeAngle,
+     *                            saturation, rootCohesion, crackReduction }
+     * @returns {Object} { fos, infiniteSlope, bishop, janbu }
+     */
+    function compositeFoS(params) {
+        const {
+            cohesion = 5,
+            frictionAngle = 30,
+            unitWeight = 19,
+            slopeAngle = 35,
+            saturation = 50,
+            rootCohesion = 0,
+            crackReduction = 0
+        } = params;
+
+        const is = infiniteSlope({
+            cohesion: cohesion,
+            frictionAngle: frictionAngle,
+            slopeAngle: slopeAngle,
+            unitWeight: unitWeight,
+            depth: DEFAULT_DEPTH,
+            saturation: saturation,
+            crackReduction: crackReduction,
+            rootCohesion: rootCohesion
+        }).fos;
+        const slices = generateSliceSet({
+            cohesion: cohesion,
+            frictionAngle: frictionAngle,
+            slopeAngle: slopeAngle,
+            unitWeight: unitWeight,
+            depth: DEFAULT_DEPTH,
+            saturation: saturation
+        });
+        const bishop = bishopSimplified(slices).fos;
+        const janbu = janbuSimplified(slices).fos;
+
+        return {
+            fos: is * 0.4 + bishop * 0.35 + janbu * 0.25,
+            infiniteSlope: is,
+            bishop: bishop,
+            janbu: janbu
+        };
+    }
+
+    // ========================================================================
+    // J1. ANALYSIS STAGE GRAPH
+    // ========================================================================
 
-        // Override rainfall params with live weather if more severe
-        var effectiveRainIntensity = rainfallIntensity;
-        var effectiveRainDuration = rainfallDuration;
-        var effectiveSat = saturation;
+    /**
+     * Site inputs read by the comprehensive analysis, with their defaults
+     * (undefined → default, as with destructuring defaults)
+     */
+    const ANALYSIS_INPUTS = {
+        location: {},
+        slopeAngle: 35,
+        soilType: 'clayey_sand',
+        vegetationPct: 40,
+        rainfallIntensity: 5,
+        rainfallDuration: 24,
+        houseDistance: 6,
+        drainageCondition: 'poor',
+        saturation: 50,
+        cracks: false,
+        seepage: false,
+        pastLandslides: false,
+        construction: false,
+        // Monte Carlo controls (tolerance in ± % points on P(failure))
+        mcIterations: MC_ITERATIONS,
+        mcTolerance: null,
+        mcSeed: MC_DEFAULT_SEED,
+        mcSampler: 'random',      // 'random' | 'lhs' | 'sobol'
+        // Bishop: search for the critical circle instead of the synthetic surface
+        slipSearch: false,
+        slopeHeight: 10,
+        // Circular-surface method in the composite: 'bishop' | 'spencer' | 'morgenstern-price'
+        lemMethod: 'bishop',
+        // Live data from APIs
+        liveWeather: null,
+        liveHistorical: null,
+        liveElevation: null,
+        liveEarthquakes: null,
+        liveSoil: null,
+        liveGeocode: null,
+        demSlope: null,
+        elevation: null
+    };
 
-        if (liveWeather && liveWeather.derived) {
-            var d = liveWeather.derived;
-            effectiveRainIntensity = Math.max(rainfallIntensity, d.currentIntensity || 0, d.maxIntensity24h || 0);
-            if (d.effectiveDuration > 0) {
-                effectiveRainDuration = Math.max(rainfallDuration, d.effectiveDuration);
+    /**
+     * Stages of the comprehensive analysis in topological order. Each
+     * declares the inputs / earlier stages it reads; run() receives the
+     * value map and returns the stage output. Expensive stages set
+     * memoize (see createAnalysisRun's stageCache); offload describes a
+     * WorkerPool job giving the same value.
+     */
+    const ANALYSIS_STAGES = [
+        {
+            // Soil properties — prefer live SoilGrids data if available
+            id: 'soil',
+            deps: ['soilType', 'liveSoil'],
+            run: v => resolveSoilProfile(v.soilType, v.liveSoil)
+        },
+        {
+            id: 'effectiveSlope',
+            deps: ['slopeAngle', 'demSlope'],
+            run: v => {
+                // Use DEM slope if available and user hasn't manually overridden
+                if (v.demSlope && v.demSlope > 0 && Math.abs(v.demSlope - 35) > 1) {
+                    // Blend DEM slope with user input (DEM takes 60% weight for better accuracy)
+                    return Math.round(v.demSlope * 0.6 + v.slopeAngle * 0.4);
+                }
+                return v.slopeAngle;
             }
-            if (d.avgSoilMoisture) {
-                var liveSatPct = Math.min(100, Math.round(d.avgSoilMoisture * 100 / 0.5));
-                effectiveSat = Math.max(saturation, liveSatPct);
+        },
+        {
+            // Override rainfall params with live weather if more severe
+            id: 'rainfall',
+            deps: ['rainfallIntensity', 'rainfallDuration', 'saturation', 'liveWeather', 'liveHistorical'],
+            run: v => {
+                let intensity = v.rainfallIntensity;
+                let duration = v.rainfallDuration;
+                let sat = v.saturation;
+
+                if (v.liveWeather && v.liveWeather.derived) {
+                    const d = v.liveWeather.derived;
+                    intensity = Math.max(v.rainfallIntensity, d.currentIntensity || 0, d.maxIntensity24h || 0);
+                    if (d.effectiveDuration > 0) {
+                        duration = Math.max(v.rainfallDuration, d.effectiveDuration);
+                    }
+                    if (d.avgSoilMoisture) {
+                        const liveSatPct = Math.min(100, Math.round(d.avgSoilMoisture * 100 / 0.5));
+                        sat = Math.max(v.saturation, liveSatPct);
+                    }
+                }
+
+                // Antecedent rainfall modifier from historical data
+                let antecedent = 0;
+                if (v.liveHistorical) {
+                    const recentRain = (v.liveHistorical.stats && v.liveHistorical.stats.totalRainfall30d) || 0;
+                    if (recentRain > 500) antecedent = 0.2;
+                    else if (recentRain > 300) antecedent = 0.15;
+                    else if (recentRain > 150) antecedent = 0.1;
+                    else if (recentRain > 50) antecedent = 0.05;
+                    // Also boost saturation based on recent rainfall
+                    if (recentRain > 100) {
+                        sat = Math.min(100, sat + Math.round(recentRain / 50));
+                    }
+                }
+
+                return { intensity: intensity, duration: duration, saturation: sat, antecedentModifier: antecedent };
             }
-        }
-
-        // Antecedent rainfall modifier from historical data
-        var antecedentModifier = 0;
-        if (liveHistorical) {
-            var recentRain = (liveHistorical.stats && liveHistorical.stats.totalRainfall30d) || 0;
-            if (recentRain > 500) antecedentModifier = 0.2;
-            else if (recentRain > 300) antecedentModifier = 0.15;
-            else if (recentRain > 150) antecedentModifier = 0.1;
-            else if (recentRain > 50) antecedentModifier = 0.05;
-            // Also boost saturation based on recent rainfall
-            if (recentRain > 100) {
-                effectiveSat = Math.min(100, effectiveSat + Math.round(recentRain / 50));
+        },
+        {
+            // Crack reduction factor
+            id: 'crackReduction',
+            deps: ['cracks'],
+            run: v => v.cracks ? CRACK_REDUCTION : 0
+        },
+        {
+            id: 'vegetation',
+            deps: ['vegetationPct'],
+            run: v => vegetationFactor(v.vegetationPct)
+        },
+        {
+            // Drainage condition modifier
+            id: 'effectiveSaturation',
+            deps: ['rainfall', 'drainageCondition'],
+            run: v => Math.min(100, v.rainfall.saturation * (DRAINAGE_SAT_MODIFIER[v.drainageCondition] || 1.0))
+        },
+        {
+            // Mean-value parameters shared by the slice and stochastic stages
+            id: 'slopeParams',
+            deps: ['soil', 'effectiveSlope', 'effectiveSaturation'],
+            run: v => ({
+                cohesion: v.soil.cohesion.mean,
+                frictionAngle: v.soil.friction.mean,
+                slopeAngle: v.effectiveSlope,
+                unitWeight: v.soil.unitWeight.mean,
+                depth: DEFAULT_DEPTH,
+                saturation: v.effectiveSaturation
+            })
+        },
+        {
+            // 1. Infinite Slope Analysis
+            id: 'infiniteSlope',
+            deps: ['slopeParams', 'crackReduction', 'vegetation'],
+            run: v => infiniteSlope(Object.assign({}, v.slopeParams, {
+                crackReduction: v.crackReduction,
+                rootCohesion: v.vegetation.rootCohesion
+            }))
+        },
+        {
+            id: 'slices',
+            deps: ['slopeParams'],
+            run: v => generateSliceSet(v.slopeParams)
+        },
+        {
+            id: 'bishopSearch',
+            memoize: true,
+            deps: ['slipSearch', 'slopeParams', 'slopeHeight'],
+            run: v => v.slipSearch ? bishopCircleSearch({
+                slopeAngle: v.slopeParams.slopeAngle,
+                slopeHeight: v.slopeHeight,
+                cohesion: v.slopeParams.cohesion,
+                frictionAngle: v.slopeParams.frictionAngle,
+                unitWeight: v.slopeParams.unitWeight,
+                saturation: v.slopeParams.saturation
+            }) : null
+        },
+        {
+            // 2. Bishop Analysis
+            id: 'bishop',
+            deps: ['slices', 'bishopSearch'],
+            run: v => v.bishopSearch && v.bishopSearch.found ? {
+                fos: v.bishopSearch.fos,
+                iterations: v.bishopSearch.iterations,
+                converged: v.bishopSearch.converged,
+                method: 'Bishop Simplified (critical circle)'
+            } : bishopSimplified(v.slices)
+        },
+        {
+            // 2b. Rigorous limit equilibrium (force + moment) on the same surface
+            id: 'rigorous',
+            deps: ['lemMethod', 'slices', 'bishopSearch', 'bishop'],
+            run: v => {
+                if (v.lemMethod !== 'spencer' && v.lemMethod !== 'morgenstern-price') return null;
+                const surface = v.bishopSearch && v.bishopSearch.found ? toSliceSet(v.bishopSearch.slices) : v.slices;
+                const solver = v.lemMethod === 'spencer' ? spencerMethod : morgensternPrice;
+                const result = solver(surface, { initialFoS: v.bishop.fos });
+                return result.converged ? result : null;
+            }
+        },
+        {
+            // 3. Janbu Analysis
+            id: 'janbu',
+            deps: ['slices'],
+            run: v => janbuSimplified(v.slices)
+        },
+        {
+            // 4. Rainfall Threshold
+            id: 'rainfallThreshold',
+            deps: ['rainfall'],
+            run: v => checkIDThreshold(v.rainfall.intensity, v.rainfall.duration)
+        },
+        {
+            // 5. Infiltration Analysis
+            id: 'infiltration',
+            deps: ['soil', 'rainfall'],
+            run: v => greenAmptInfiltration({
+                K: v.soil.permeability.mean,
+                theta_i: v.soil.porosity * (1 - v.rainfall.saturation / 100),
+                theta_s: v.soil.porosity,
+                rainfall_rate: v.rainfall.intensity,
+                duration: v.rainfall.duration
+            })
+        },
+        {
+            // 5b. Transient pore pressure over depth from the hourly rainfall series
+            id: 'transientInfiltration',
+            deps: ['slopeParams', 'soil', 'vegetation', 'liveWeather'],
+            run: v => {
+                const rain = v.liveWeather && v.liveWeather.hourly && v.liveWeather.hourly.precipitation;
+                if (!rain || rain.length === 0) return null;
+                return transientPorePressure(Object.assign({}, v.slopeParams, {
+                    permeability: v.soil.permeability.mean,
+                    rootCohesion: v.vegetation.rootCohesion
+                }), rain, { grid: false });
+            }
+        },
+        {
+            // Richards-equation suction/infiltration model where matric suction
+            // governs (residual and colluvial soils): the live hourly series, or
+            // the design storm over a 7-day window when offline
+            id: 'unsaturatedFlow',
+            deps: ['soilType', 'slopeParams', 'soil', 'vegetation', 'rainfall', 'liveWeather'],
+            run: v => {
+                if (RICHARDS_SOIL_TYPES.indexOf(v.soilType) === -1 || !v.soil.swcc) return null;
+                let rain = v.liveWeather && v.liveWeather.hourly && v.liveWeather.hourly.precipitation;
+                if (!rain || rain.length === 0) {
+                    rain = new Float64Array(RICHARDS_DESIGN_HOURS);
+                    rain.fill(v.rainfall.intensity, 0, Math.min(RICHARDS_DESIGN_HOURS, Math.ceil(v.rainfall.duration)));
+                }
+                return richardsInfiltration(Object.assign({}, v.slopeParams, {
+                    permeability: v.soil.permeability.mean,
+                    porosity: v.soil.porosity,
+                    swcc: v.soil.swcc,
+                    rootCohesion: v.vegetation.rootCohesion
+                }), rain, { grid: false });
+            }
+        },
+        {
+            // 6. Foundation Safety
+            id: 'foundation',
+            deps: ['effectiveSlope', 'houseDistance'],
+            run: v => foundationSafetyCheck({
+                slopeAngle: v.effectiveSlope,
+                distanceFromCrest: v.houseDistance,
+                slopeHeight: DEFAULT_DEPTH / Math.sin(v.effectiveSlope * Math.PI / 180) * Math.cos(v.effectiveSlope * Math.PI / 180)
+            })
+        },
+        {
+            // 7. Monte Carlo — sharded, so createAnalysisRun() callers may
+            //    hand it to WorkerPool.monteCarlo() for the same result
+            id: 'monteCarlo',
+            memoize: true,
+            deps: ['slopeParams', 'mcIterations', 'mcSeed', 'mcSampler', 'mcTolerance'],
+            run: v => monteCarloSharded(v.slopeParams, v.mcIterations,
+                { seed: v.mcSeed, sampler: v.mcSampler, pfTolerance: v.mcTolerance }),
+            offload: v => ({
+                fn: 'monteCarlo',
+                args: [v.slopeParams, v.mcIterations,
+                    { seed: v.mcSeed, sampler: v.mcSampler, pfTolerance: v.mcTolerance }]
+            })
+        },
+        {
+            // 7b. FORM reliability index (same random variables, ~10 evaluations)
+            id: 'form',
+            deps: ['slopeParams'],
+            run: v => formAnalysis(v.slopeParams)
+        },
+        {
+            // 7c. Rare-event P(failure) where crude Monte Carlo resolves too few failures
+            id: 'rareEvent',
+            memoize: true,
+            deps: ['slopeParams', 'form', 'mcSeed'],
+            run: v => v.form.reliability_index > 2
+                ? rareEventProbability(v.slopeParams, { seed: v.mcSeed, form: v.form })
+                : null
+        },
+        {
+            // 8. Sensitivity
+            id: 'sensitivity',
+            deps: ['slopeParams'],
+            run: v => sensitivityAnalysis(v.slopeParams)
+        },
+        {
+            // 8b. Global (Sobol) sensitivity with Morris screening
+            id: 'globalSensitivity',
+            memoize: true,
+            deps: ['slopeParams', 'mcSeed'],
+            run: v => sobolSensitivity(v.slopeParams, { seed: v.mcSeed, screening: true })
+        },
+        {
+            // Composite FoS (weighted average of methods)
+            id: 'compositeFoS',
+            deps: ['infiniteSlope', 'bishop', 'rigorous', 'janbu'],
+            run: v => {
+                const circularFoS = v.rigorous ? v.rigorous.fos : v.bishop.fos;
+                return roundTo(
+                    v.infiniteSlope.fos * 0.4 +
+                    circularFoS * 0.35 +
+                    v.janbu.fos * 0.25
+                , 4);
+            }
+        },
+        {
+            // Hour-by-hour FoS / I-D timeline over the Open-Meteo hourly series
+            id: 'forecast',
+            deps: ['slopeParams', 'soil', 'crackReduction', 'vegetation', 'drainageCondition', 'compositeFoS', 'liveWeather'],
+            run: v => {
+                const hourly = v.liveWeather && v.liveWeather.hourly;
+                if (!hourly || !hourly.precipitation || hourly.precipitation.length === 0) return null;
+                return fosForecast(Object.assign({}, v.slopeParams, {
+                    permeability: v.soil.permeability.mean,
+                    porosity: v.soil.porosity,
+                    crackReduction: v.crackReduction,
+                    rootCohesion: v.vegetation.rootCohesion,
+                    drainageModifier: DRAINAGE_SAT_MODIFIER[v.drainageCondition] || 1.0
+                }), hourly, { compositeFoS: v.compositeFoS });
+            }
+        },
+        {
+            // Newmark displacement for every USGS event in the catalogue result
+            id: 'seismic',
+            deps: ['slopeParams', 'crackReduction', 'vegetation', 'liveEarthquakes', 'mcSeed'],
+            run: v => {
+                const eq = v.liveEarthquakes;
+                if (!eq || !eq.events || eq.events.length === 0) return null;
+                return seismicDisplacementBatch(Object.assign({}, v.slopeParams, {
+                    crackReduction: v.crackReduction,
+                    rootCohesion: v.vegetation.rootCohesion
+                }), eq.events, { seed: v.mcSeed });
+            }
+        },
+        {
+            // Additional risk modifiers
+            id: 'riskModifiers',
+            deps: ['seepage', 'pastLandslides', 'construction', 'rainfallThreshold', 'rainfall', 'liveEarthquakes', 'seismic'],
+            run: v => {
+                let riskModifier = 0;
+                if (v.seepage) riskModifier += 0.15;
+                if (v.pastLandslides) riskModifier += 0.2;
+                if (v.construction) riskModifier += 0.1;
+                if (v.rainfallThreshold.level >= 2) riskModifier += 0.15;
+                riskModifier += v.rainfall.antecedentModifier; // Historical rainfall modifier
+
+                // Seismic modifier from live earthquake data
+                let seismicNote = 'No recent seismic activity data';
+                const eq = v.liveEarthquakes;
+                if (eq) {
+                    riskModifier += eq.riskModifier || 0;
+                    seismicNote = eq.seismicRisk + ' seismic risk (' +
+                        eq.totalEvents + ' events, max M' +
+                        eq.maxMagnitude.toFixed(1) + ')';
+                }
+                if (v.seismic) {
+                    seismicNote += v.seismic.staticallyUnstable
+                        ? '; statically unstable (ky ≤ 0)'
+                        : '; Newmark Dn max ' + v.seismic.maxDisplacement.toFixed(1) + ' cm (' +
+                          v.seismic.hazardClass + '), ky = ' + v.seismic.ky.toFixed(3) + ' g';
+                }
+                return { riskModifier: riskModifier, seismicNote: seismicNote };
             }
         }
+    ];
 
-        // Crack reduction factor
-        const crackReduction = cracks ? 0.25 : 0;
-
-        // Vegetation analysis
-        const vegAnalysis = vegetationFactor(vegetationPct);
-
-        // Drainage condition modifier
-        const drainageSatModifier = {
-            'good': 0.7,
-            'moderate': 0.85,
-            'poor': 1.0,
-            'blocked': 1.15
-        }[drainageCondition] || 1.0;
+    // Structural equality for input/stage values (typed arrays included)
+    function analysisValueEqual(a, b) {
+        if (a === b) return true;
+        if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) {
+            return a !== a && b !== b; // NaN
+        }
+        if (Array.isArray(a) !== Array.isArray(b) || ArrayBuffer.isView(a) !== ArrayBuffer.isView(b)) return false;
+        const keysA = Object.keys(a);
+        if (keysA.length !== Object.keys(b).length) return false;
+        for (let i = 0; i < keysA.length; i++) {
+            const k = keysA[i];
+            if (!Object.prototype.hasOwnProperty.call(b, k) || !analysisValueEqual(a[k], b[k])) return false;
+        }
+        return true;
+    }
 
-        const effectiveSaturation = Math.min(100, effectiveSat * drainageSatModifier);
+    /**
+     * State carried between incremental runs of runComprehensiveAnalysis()
+     *
+     * @returns {Object} { values, executed }
+     */
+    function createAnalysisSession() {
+        return { values: null, executed: [] };
+    }
 
-        // 1. Infinite Slope Analysis
-        const infiniteSlopeResult = infiniteSlope({
-            cohesion: soil.cohesion.mean,
-            frictionAngle: soil.friction.mean,
-            slopeAngle: effectiveSlope,
-            unitWeight: soil.unitWeight.mean,
-            depth: DEFAULT_DEPTH,
-            saturation: effectiveSaturation,
-            crackReduction: crackReduction,
-            rootCohesion: vegAnalysis.rootCohesion
-        });
+    /**
+     * Declared dependencies of every analysis stage, in execution order
+     *
+     * @returns {Array<{id: string, deps: string[]}>}
+     */
+    function getAnalysisGraph() {
+        return ANALYSIS_STAGES.map(stage => ({ id: stage.id, deps: stage.deps.slice() }));
+    }
 
-        // 2. Bishop Analysis
-        const slices = generateSlices({
-            cohesion: soil.cohesion.mean,
-            frictionAngle: soil.friction.mean,
-            slopeAngle: effectiveSlope,
-            unitWeight: soil.unitWeight.mean,
-            depth: DEFAULT_DEPTH,
-            saturation: effectiveSaturation
+    /**
+     * Evaluate the stage graph, yielding after each stage. With a previous
+     * value map only stages whose inputs changed re-execute; a stage that
+     * recomputes to an equal value stops propagation to its dependents.
+     * Stages listed in options.offload first yield their job description
+     * and take the value passed back (running inline if none is).
+     * Returns the value map.
+     */
+    function* analysisGraphSteps(siteData, previous, executed, options) {
+        const offload = options.offload || [];
+        const stageCache = options.stageCache || null;
+        const values = {};
+        const changed = new Set();
+
+        Object.keys(ANALYSIS_INPUTS).forEach(key => {
+            const value = siteData[key] === undefined ? ANALYSIS_INPUTS[key] : siteData[key];
+            if (previous && analysisValueEqual(value, previous[key])) {
+                values[key] = previous[key];
+            } else {
+                values[key] = value;
+                changed.add(key);
+            }
         });
-        const bishopResult = bishopSimplified(slices);
-
-        // 3. Janbu Analysis
-        const janbuResult = janbuSimplified(slices);
 
-        // 4. Rainfall Threshold
-        const idResult = checkIDThreshold(effectiveRainIntensity, effectiveRainDuration);
-
-        // 5. Infiltration Analysis
-        const infiltrationResult = greenAmptInfiltration({
-            K: soil.permeability.mean,
-            theta_i: soil.porosity * (1 - effectiveSat / 100),
-            theta_s: soil.porosity,
-            rainfall_rate: effectiveRainIntensity,
-            duration: effectiveRainDuration
-        });
+        for (let i = 0; i < ANALYSIS_STAGES.length; i++) {
+            const stage = ANALYSIS_STAGES[i];
+            if (previous && !stage.deps.some(dep => changed.has(dep))) {
+                values[stage.id] = previous[stage.id];
+                continue;
+            }
+            let value;
+            const depValues = stage.memoize && stageCache ? stage.deps.map(dep => values[dep]) : null;
+            if (depValues) value = stageCache.get(stage.id, depValues);
+            if (value === undefined && stage.offload && offload.indexOf(stage.id) !== -1) {
+                value = yield { id: stage.id, job: stage.offload(values) };
+            }
+            if (value === undefined) value = stage.run(values);
+            if (depValues) stageCache.set(stage.id, depValues, value);
+            executed.push(stage.id);
+            if (previous && analysisValueEqual(value, previous[stage.id])) {
+                values[stage.id] = previous[stage.id];
+            } else {
+                values[stage.id] = value;
+                changed.add(stage.id);
+            }
+            yield stage.id;
+        }
+        return values;
+    }
 
-        // 6. Foundation Safety
-        const foundationResult = foundationSafetyCheck({
-            slopeAngle: effectiveSlope,
-            distanceFromCrest: houseDistance,
-            slopeHeight: DEFAULT_DEPTH / Math.sin(effectiveSlope * Math.PI / 180) * Math.cos(effectiveSlope * Math.PI / 180)
-        });
+    /**
+     * Resumable comprehensive analysis — step() executes one stage, so a
+     * caller can yield between stages and abandon a superseded run. The
+     * session is only updated by finish(), so an abandoned run leaves it
+     * at the last completed analysis.
+     *
+     * Offloading: with options.offload = ['monteCarlo'], step() stops before
+     * that stage and sets run.pending = { id, job }, where job is
+     * { fn, args } for the matching WorkerPool method. Pass the job's result
+     * to the next step(value); step() without a value runs it inline.
+     *
+     * Memoization: options.stageCache = { get(id, depValues), set(id, depValues, value) }
+     * (e.g. AnalysisCache.stages) serves memoize-flagged stages by the
+     * content of their dependencies, so returning to earlier inputs reuses
+     * the Monte Carlo, rare-event, Sobol and slip-circle results.
+     *
+     * @param {Object} siteData - All field inputs
+     * @param {Object} [session] - From createAnalysisSession()
+     * @param {Object} [options] - { offload: stage ids, stageCache }
+     * @returns {Object} { step(value?) → true when all stages ran, pending, finish() → results }
+     */
+    function createAnalysisRun(siteData, session, options = {}) {
+        const executed = [];
+        const steps = analysisGraphSteps(siteData, session ? session.values : null, executed, options);
+        let values = null;
+        let pending = null;
+
+        function step(value) {
+            if (values) return true;
+            const next = steps.next(pending ? value : undefined);
+            pending = null;
+            if (next.done) values = next.value;
+            else if (typeof next.value === 'object') pending = next.value;
+            return next.done;
+        }
 
-        // 7. Monte Carlo
-        const mcResult = monteCarloSimulation({
-            cohesion: soil.cohesion.mean,
-            frictionAngle: soil.friction.mean,
-            slopeAngle: effectiveSlope,
-            unitWeight: soil.unitWeight.mean,
-            saturation: effectiveSaturation,
-            depth: DEFAULT_DEPTH
-        });
+        function finish() {
+            while (!step());
+            if (session) {
+                session.values = values;
+                session.executed = executed;
+            }
+            return assembleAnalysisResults(values);
+        }
 
-        // 8. Sensitivity
-        const sensResult = sensitivityAnalysis({
-            cohesion: soil.cohesion.mean,
-            frictionAngle: soil.friction.mean,
-            slopeAngle: effectiveSlope,
-            unitWeight: soil.unitWeight.mean,
-            saturation: effectiveSaturation,
-            depth: DEFAULT_DEPTH
-        });
+        return {
+            step,
+            finish,
+            get pending() { return pending; }
+        };
+    }
 
-        // Composite FoS (weighted average of methods)
-        const compositeFoS = (
-            infiniteSlopeResult.fos * 0.4 +
-            bishopResult.fos * 0.35 +
-            janbuResult.fos * 0.25
-        );
-
-        // Additional risk modifiers
-        let riskModifier = 0;
-        if (seepage) riskModifier += 0.15;
-        if (pastLandslides) riskModifier += 0.2;
-        if (construction) riskModifier += 0.1;
-        if (idResult.level >= 2) riskModifier += 0.15;
-        riskModifier += antecedentModifier; // Historical rainfall modifier
-
-        // Seismic modifier from live earthquake data
-        var seismicNote = 'No recent seismic activity data';
-        if (liveEarthquakes) {
-            riskModifier += liveEarthquakes.riskModifier || 0;
-            seismicNote = liveEarthquakes.seismicRisk + ' seismic risk (' +
-                liveEarthquakes.totalEvents + ' events, max M' +
-                liveEarthquakes.maxMagnitude.toFixed(1) + ')';
-        }
+    /**
+     * Run complete site analysis combining all modules
+     * This is the main entry point for the risk assessment
+     * 
+     * The analysis is an explicit graph of stages (ANALYSIS_STAGES). Pass
+     * a session from createAnalysisSession() to make repeat calls
+     * incremental — e.g. editing houseDistance re-runs only the foundation
+     * check; session.executed lists the stages that ran.
+     * 
+     * @param {Object} siteData - All field inputs
+     * @param {Object} [session] - From createAnalysisSession()
+     * @returns {Object} Comprehensive analysis results
+     */
+    function runComprehensiveAnalysis(siteData, session) {
+        return createAnalysisRun(siteData, session).finish();
+    }
 
+    // Result object from the stage value map
+    function assembleAnalysisResults(v) {
         return {
             timestamp: new Date().toISOString(),
-            location: location,
-            soilProperties: soil,
-            slopeAngle: effectiveSlope,
-            inputSlopeAngle: slopeAngle,
-            demSlope: demSlope,
-            effectiveSaturation: effectiveSaturation,
+            location: v.location,
+            soilProperties: v.soil,
+            slopeAngle: v.effectiveSlope,
+            inputSlopeAngle: v.slopeAngle,
+            demSlope: v.demSlope,
+            effectiveSaturation: v.effectiveSaturation,
 
             // Analysis Results
-            infiniteSlope: infiniteSlopeResult,
-            bishop: bishopResult,
-            janbu: janbuResult,
-            compositeFoS: parseFloat(compositeFoS.toFixed(4)),
+            infiniteSlope: v.infiniteSlope,
+            bishop: v.bishop,
+            bishopSearch: v.bishopSearch,
+            rigorous: v.rigorous,
+            janbu: v.janbu,
+            compositeFoS: v.compositeFoS,
+            seismic: v.seismic,
 
             // Hydrological
-            rainfallThreshold: idResult,
-            infiltration: infiltrationResult,
-            effectiveRainIntensity: effectiveRainIntensity,
-            effectiveRainDuration: effectiveRainDuration,
-            antecedentRainfallModifier: antecedentModifier,
+            rainfallThreshold: v.rainfallThreshold,
+            infiltration: v.infiltration,
+            transientInfiltration: v.transientInfiltration,
+            unsaturatedFlow: v.unsaturatedFlow,
+            forecast: v.forecast,
+            effectiveRainIntensity: v.rainfall.intensity,
+            effectiveRainDuration: v.rainfall.duration,
+            antecedentRainfallModifier: v.rainfall.antecedentModifier,
 
             // Environmental
-            vegetation: vegAnalysis,
+            vegetation: v.vegetation,
 
             // Structural
-            foundation: foundationResult,
+            foundation: v.foundation,
 
             // Stochastic
-            monteCarlo: mcResult,
-            sensitivity: sensResult,
+            monteCarlo: v.monteCarlo,
+            form: v.form,
+            rareEvent: v.rareEvent,
+            sensitivity: v.sensitivity,
+            globalSensitivity: v.globalSensitivity,
 
             // Risk Modifiers
-            riskModifier: riskModifier,
-            seismicNote: seismicNote,
+            riskModifier: v.riskModifiers.riskModifier,
+            seismicNote: v.riskModifiers.seismicNote,
             fieldObservations: {
-                cracks: cracks,
-                seepage: seepage,
-                pastLandslides: pastLandslides,
-                construction: construction
+                cracks: v.cracks,
+                seepage: v.seepage,
+                pastLandslides: v.pastLandslides,
+                construction: v.construction
             },
 
             // Live data sources used
             dataSourcesUsed: {
-                soilGrids: !!liveSoil,
-                openMeteoWeather: !!liveWeather,
-                openMeteoHistorical: !!liveHistorical,
-                openMeteoElevation: !!liveElevation,
-                usgsEarthquakes: !!liveEarthquakes,
-                nominatimGeocode: !!liveGeocode
+                soilGrids: !!v.liveSoil,
+                openMeteoWeather: !!v.liveWeather,
+                openMeteoHistorical: !!v.liveHistorical,
+                openMeteoElevation: !!v.liveElevation,
+                usgsEarthquakes: !!v.liveEarthquakes,
+                nominatimGeocode: !!v.liveGeocode
             },
-            elevation: elevation || null,
+            elevation: v.elevation || null,
 
             // Engineering disclaimer
             disclaimer: 'Decision support output only. Final engineering approval required from certified geotechnical engineer per NIDM 2019 guidelines.'
@@ -1115,12 +4880,117 @@ const GeotechnicalEngine = (function () {
     // UTILITY FUNCTIONS
     // ========================================================================
 
-    function normalRandom(mean, stddev) {
-        // Box-Muller transform
-        const u1 = Math.random();
-        const u2 = Math.random();
-        const z = Math.sqrt(-2 * Math.log(u1)) * Math.cos(2 * Math.PI * u2);
-        return mean + z * stddev;
+    /**
+     * Normal variate via the Marsaglia polar method
+     * @param {number} mean
+     * @param {number} stddev
+     * @param {SeededRandom} [rng] - Seeded stream; Math.random() if omitted
+     */
+    function normalRandom(mean, stddev, rng) {
+        if (rng) return mean + rng.nextNormal() * stddev;
+        let u, v, s;
+        do {
+            u = 2 * Math.random() - 1;
+            v = 2 * Math.random() - 1;
+            s = u * u + v * v;
+        } while (s >= 1 || s === 0);
+        return mean + u * Math.sqrt(-2 * Math.log(s) / s) * stddev;
+    }
+
+    /**
+     * Seedable xoshiro128** generator with a polar-method normal sampler
+     * 
+     * Independent streams for parallel runs are produced with jump(),
+     * which advances the state by 2^64 draws.
+     * Ref: Blackman & Vigna (2018) — Scrambled linear PRNGs
+     */
+    class SeededRandom {
+        constructor(seed = MC_DEFAULT_SEED, stream = 0) {
+            let h = hashSeed(seed);
+            this.s = new Uint32Array(4);
+            for (let i = 0; i < 4; i++) {
+                h = (h + 0x9E3779B9) | 0;
+                this.s[i] = splitmix32(h);
+            }
+            if ((this.s[0] | this.s[1] | this.s[2] | this.s[3]) === 0) this.s[0] = 1;
+            this.spare = 0;
+            this.hasSpare = false;
+            for (let k = 0; k < stream; k++) this.jump();
+        }
+
+        nextUint32() {
+            const s = this.s;
+            const result = Math.imul(rotl(Math.imul(s[1], 5), 7), 9);
+            const t = s[1] << 9;
+            s[2] ^= s[0];
+            s[3] ^= s[1];
+            s[1] ^= s[2];
+            s[0] ^= s[3];
+            s[2] ^= t;
+            s[3] = rotl(s[3], 11);
+            return result >>> 0;
+        }
+
+        // Uniform on [0, 1)
+        next() {
+            return this.nextUint32() / 4294967296;
+        }
+
+        // Standard normal (Marsaglia polar method, caches the second variate)
+        nextNormal() {
+            if (this.hasSpare) {
+                this.hasSpare = false;
+                return this.spare;
+            }
+            let u, v, s;
+            do {
+                u = 2 * this.next() - 1;
+                v = 2 * this.next() - 1;
+                s = u * u + v * v;
+            } while (s >= 1 || s === 0);
+            const m = Math.sqrt(-2 * Math.log(s) / s);
+            this.spare = v * m;
+            this.hasSpare = true;
+            return u * m;
+        }
+
+        jump() {
+            const JUMP = [0x8764000b, 0xf542d2d3, 0x6fa035c3, 0x77f2db5b];
+            let s0 = 0, s1 = 0, s2 = 0, s3 = 0;
+            for (let i = 0; i < 4; i++) {
+                for (let b = 0; b < 32; b++) {
+                    if (JUMP[i] & (1 << b)) {
+                        s0 ^= this.s[0]; s1 ^= this.s[1];
+                        s2 ^= this.s[2]; s3 ^= this.s[3];
+                    }
+                    this.nextUint32();
+                }
+            }
+            this.s[0] = s0; this.s[1] = s1; this.s[2] = s2; this.s[3] = s3;
+            this.hasSpare = false;
+        }
+    }
+
+    function rotl(x, k) {
+        return (x << k) | (x >>> (32 - k));
+    }
+
+    function splitmix32(x) {
+        x = Math.imul(x ^ (x >>> 16), 0x85ebca6b);
+        x = Math.imul(x ^ (x >>> 13), 0xc2b2ae35);
+        return (x ^ (x >>> 16)) >>> 0;
+    }
+
+    // FNV-1a hash so string seeds (e.g. site keys) are accepted
+    function hashSeed(seed) {
+        if (typeof seed === 'number' && Number.isFinite(seed)) return seed | 0;
+        const str = String(seed);
+        let h = 0x811c9dc5;
+        for (let i = 0; i < str.length; i++) {
+            h ^= str.charCodeAt(i);
+            h = Math.imul(h, 0x01000193);
+        }
+        return h | 0;
     }
 
     function degreesToRadians(deg) {
@@ -1137,24 +5007,78 @@ const GeotechnicalEngine = (function () {
     return {
         // Core Analyses
         infiniteSlope,
+        infiniteSlopeBatch,
         bishopSimplified,
+        bishopCircleSearch,
         janbuSimplified,
+        spencerMethod,
+        morgensternPrice,
         generateSlices,
+        generateSliceSet,
+        createSliceSet,
+        toSliceSet,
+        sliceSetToArray,
+
+        // Seismic
+        criticalAcceleration,
+        newmarkDisplacement,
+        jibsonDisplacement,
+        syntheticAccelerogram,
+        seismicDisplacementBatch,
 
         // Hydrology
         greenAmptInfiltration,
+        greenAmptCumulative,
         porePressureRatio,
         saturationIndex,
         checkIDThreshold,
+        caineThreshold,
+        himalayanThreshold,
+        idThresholdLevel,
+        transientPorePressure,
+        richardsInfiltration,
+        vanGenuchten,
+        solveTridiagonal,
         generateIDCurveData,
 
+        // Terrain (raster)
+        parseAsciiGrid,
+        specificCatchmentArea,
+        terrainStabilityParams,
+        createRasterTile,
+        rasterStabilityTile,
+        createStabilityRaster,
+        writeRasterTile,
+        summarizeStabilityClasses,
+        terrainStability,
+
+        // Forecast
+        fosForecast,
+
         // Environment
         vegetationFactor,
 
         // Stochastic
         monteCarloSimulation,
+        monteCarloPartial,
+        monteCarloSharded,
+        infiniteSlopeKernel,
+        formAnalysis,
+        rareEventProbability,
+        createMCAccumulator,
+        accumulateFoS,
+        mergeMCAccumulators,
+        summarizeMonteCarlo,
+        wilsonInterval,
+        createSampler,
+        SobolSequence,
+        SeededRandom,
         sensitivityAnalysis,
+        sobolSensitivity,
         KalmanFilter,
+        KalmanFilterBank,
+        MultivariateKalmanFilter,
+        createPorePressureRainfallFilter,
 
         // Structural
         foundationSafetyCheck,
@@ -1162,17 +5086,35 @@ const GeotechnicalEngine = (function () {
 
         // Comprehensive
         runComprehensiveAnalysis,
+        createAnalysisRun,
+        createAnalysisSession,
+        getAnalysisGraph,
+        compositeFoS,
+        resolveSoilProfile,
 
         // Data
         SOIL_DATABASE,
+        DRAINAGE_SAT_MODIFIER,
+        RICHARDS_SOIL_TYPES,
+        SI_CLASSES,
+        RASTER_TILE_ROWS,
+
+        // Output precision
+        setOutputMode,
+        getOutputMode,
 
         // Constants
+        MC_DEFAULT_SEED,
+        MC_CHUNK_SIZE,
         GRAVITY,
         WATER_DENSITY,
         DEFAULT_DEPTH,
+        CRACK_REDUCTION,
 
         // Utilities
         normalRandom,
+        normalCDF,
+        inverseNormalCDF,
         degreesToRadians,
         radiansToDegrees
     };
@@ -0,0 +1,112 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — IndexedDB Store
+ * ============================================================================
+ * Minimal promise wrapper over IndexedDB for persisting precomputed engine
+ * data between sessions. Values are stored with the structured-clone
+ * algorithm, so typed arrays round-trip without serialisation.
+ *
+ * Every call resolves (never rejects) — when IndexedDB is unavailable
+ * (private mode, file://, workers without IDB) get() resolves undefined
+ * and put()/remove() resolve false, so callers simply recompute.
+ *
+ * Object stores:
+ *   fos-tables     — FoS lookup tables per soil profile (FosTables)
+ *   analysis-cache — memoized pipeline results (AnalysisCache)
+ * ============================================================================
+ */
+
+const IdbStore = (function () {
+    'use strict';
+
+    const DB_NAME = 'dhara-rakshak';
+    const DB_VERSION = 2;
+    const STORES = ['fos-tables', 'analysis-cache'];
+
+    let dbPromise = null;
+
+    function isSupported() {
+        return typeof indexedDB !== 'undefined';
+    }
+
+    function open() {
+        if (dbPromise) return dbPromise;
+        dbPromise = new Promise(function (resolve) {
+            if (!isSupported()) {
+                resolve(null);
+                return;
+            }
+            let request;
+            try {
+                request = indexedDB.open(DB_NAME, DB_VERSION);
+            } catch (e) {
+                resolve(null);
+                return;
+            }
+            request.onupgradeneeded = function () {
+                const db = request.result;
+                STORES.forEach(function (name) {
+                    if (!db.objectStoreNames.contains(name)) db.createObjectStore(name);
+                });
+            };
+            request.onsuccess = function () { resolve(request.result); };
+            request.onerror = function () { resolve(null); };
+            request.onblocked = function () { resolve(null); };
+        });
+        return dbPromise;
+    }
+
+    function transact(store, mode, fn, fallback) {
+        return open().then(function (db) {
+            if (!db) return fallback;
+            return new Promise(function (resolve) {
+                try {
+                    const tx = db.transaction(store, mode);
+                    const request = fn(tx.objectStore(store));
+                    tx.oncomplete = function () { resolve(mode === 'readonly' ? request.result : true); };
+                    tx.onerror = function () { resolve(fallback); };
+                    tx.onabort = function () { resolve(fallback); };
+                } catch (e) {
+                    resolve(fallback);
+                }
+            });
+        });
+    }
+
+    /**
+     * @returns {Promise<*>} Stored value, or undefined
+     */
+    function get(store, key) {
+        return transact(store, 'readonly', function (os) { return os.get(key); }, undefined);
+    }
+
+    /**
+     * @returns {Promise<boolean>} true once committed
+     */
+    function put(store, key, value) {
+        return transact(store, 'readwrite', function (os) { return os.put(value, key); }, false);
+    }
+
+    function remove(store, key) {
+        return transact(store, 'readwrite', function (os) { return os.delete(key); }, false);
+    }
+
+    function clear(store) {
+        return transact(store, 'readwrite', function (os) { return os.clear(); }, false);
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        isSupported,
+        get,
+        put,
+        remove,
+        clear
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = IdbStore;
+}
@@ -211,22 +211,28 @@ const MapModule = (function () {
     }
 
     /**
-     * Generate simulated risk data points in a 1km radius.
+     * Generate risk data points in a 1km radius.
      *
      * Each point is [lat, lon, intensity] where intensity ∈ [0, 1].
      *
-     * Risk factors considered:
-     * - Proximity to center (closer to unstable site → higher risk)
-     * - Composite risk score from analysis
-     * - Slope orientation effect (simulated angular variation)
-     * - Terrain heterogeneity (random seed per grid cell)
+     * Without a DEM, the site's slope and saturation are perturbed per grid
+     * cell and the Infinite Slope FoS is evaluated for every cell in one
+     * GeotechnicalEngine.infiniteSlopeBatch() call:
+     * - Slope: site slope, steepest near the centre, varied by aspect and
+     *   terrain heterogeneity (deterministic noise per cell)
+     * - Saturation: site saturation ± terrain noise
+     * - Strength: site soil c_eff (cracks + roots), φ', γ
+     *
+     * Intensity maps FoS 1.5 → 0 and FoS 0.75 → 1, blended with the
+     * composite risk score (which covers non-FoS factors).
      *
      * @returns {Array} [[lat, lon, intensity], ...]
      */
     function generateRiskHeatData(lat, lon, analysisResults, riskAssessment) {
-        const points = [];
         const baseRisk = (riskAssessment?.compositeScore || 50) / 100;
         const slopeAngle = analysisResults?.slopeAngle || 35;
+        const saturation = analysisResults?.effectiveSaturation ?? 50;
+        const soil = analysisResults?.soilProperties || {};
 
         // 1 km ≈ 0.009 degrees latitude
         const radiusDeg = 0.009;
@@ -239,32 +245,50 @@ const MapModule = (function () {
             return s - Math.floor(s);
         }
 
+        // Grid cells inside the circle
+        const cellLat = [];
+        const cellLon = [];
+        const cellFactor = [];
         for (let dlat = -radiusDeg; dlat <= radiusDeg; dlat += step) {
             for (let dlon = -radiusDeg; dlon <= radiusDeg; dlon += step) {
                 const dist = Math.sqrt(dlat * dlat + dlon * dlon);
                 if (dist > radiusDeg) continue; // Circular boundary
-
-                const normalizedDist = dist / radiusDeg; // 0 at center, 1 at edge
-
+                cellLat.push(dlat);
+                cellLon.push(dlon);
                 // Distance decay: risk is highest near center
-                const distanceFactor = Math.pow(1 - normalizedDist, 1.5);
-
-                // Angular variation (simulates slope orientation / aspect)
-                const angle = Math.atan2(dlon, dlat);
-                const aspectFactor = 0.85 + 0.15 * Math.sin(angle * 2 + slopeAngle * 0.05);
-
-                // Terrain noise
-                const noise = seededRandom(lat + dlat, lon + dlon) * 0.25;
-
-                // Slope influence: steeper slopes have wider high-risk zone
-                const slopeFactor = 0.7 + 0.3 * Math.min(1, slopeAngle / 60);
+                cellFactor.push(Math.pow(1 - dist / radiusDeg, 1.5));
+            }
+        }
 
-                // Composite intensity
-                let intensity = baseRisk * distanceFactor * aspectFactor * slopeFactor + noise * 0.15;
-                intensity = Math.max(0, Math.min(1, intensity));
+        const n = cellLat.length;
+        const slopes = new Float64Array(n);
+        const sats = new Float64Array(n);
+        for (let i = 0; i < n; i++) {
+            // Angular variation (simulates slope orientation / aspect)
+            const angle = Math.atan2(cellLon[i], cellLat[i]);
+            const aspectFactor = 0.9 + 0.1 * Math.sin(angle * 2 + slopeAngle * 0.05);
+            // Terrain noise ∈ [-1, 1)
+            const noise = seededRandom(lat + cellLat[i], lon + cellLon[i]) * 2 - 1;
+
+            slopes[i] = Math.max(1, slopeAngle * (0.7 + 0.3 * cellFactor[i]) * aspectFactor * (1 + 0.1 * noise));
+            sats[i] = Math.max(0, Math.min(100, saturation * (1 + 0.15 * noise)));
+        }
 
-                points.push([lat + dlat, lon + dlon, intensity]);
-            }
+        const fos = GeotechnicalEngine.infiniteSlopeBatch({
+            cohesion: analysisResults?.infiniteSlope?.c_eff ?? (soil.cohesion?.mean || 5),
+            frictionAngle: soil.friction?.mean || 30,
+            unitWeight: soil.unitWeight?.mean || 19,
+            depth: GeotechnicalEngine.DEFAULT_DEPTH,
+            slopeAngle: slopes,
+            saturation: sats
+        }, { fos: new Float64Array(n) }).fos;
+
+        const points = new Array(n);
+        for (let i = 0; i < n; i++) {
+            const fosRisk = Math.max(0, Math.min(1, (1.5 - fos[i]) / 0.75));
+            let intensity = 0.7 * fosRisk + 0.3 * baseRisk * cellFactor[i];
+            intensity = Math.max(0, Math.min(1, intensity));
+            points[i] = [lat + cellLat[i], lon + cellLon[i], intensity];
         }
 
         return points;
@@ -149,6 +149,7 @@ const ReportGenerator = (function () {
             <tr><td>Resisting Force</td><td>${analysisResults.infiniteSlope?.resisting?.toFixed(2) || 'N/A'} kPa</td></tr>
             <tr><td>Driving Force</td><td>${analysisResults.infiniteSlope?.driving?.toFixed(2) || 'N/A'} kPa</td></tr>
         </table>
+        ${renderSeismicTable(analysisResults.seismic)}
     </div>
 
     <!-- 4. HYDROLOGICAL ANALYSIS -->
@@ -162,17 +163,20 @@ const ReportGenerator = (function () {
         <table>
             <tr><td>Current Intensity</td><td>${analysisResults.rainfallThreshold?.current_intensity || 'N/A'} mm/hr</td></tr>
             <tr><td>Current Duration</td><td>${analysisResults.rainfallThreshold?.current_duration || 'N/A'} hr</td></tr>
-            <tr><td>Caine Threshold</td><td>${analysisResults.rainfallThreshold?.threshold_caine || 'N/A'} mm/hr</td></tr>
-            <tr><td>Himalayan Threshold</td><td>${analysisResults.rainfallThreshold?.threshold_himalaya || 'N/A'} mm/hr</td></tr>
+            <tr><td>Caine Threshold</td><td>${fmt(analysisResults.rainfallThreshold?.threshold_caine, 3) || 'N/A'} mm/hr</td></tr>
+            <tr><td>Himalayan Threshold</td><td>${fmt(analysisResults.rainfallThreshold?.threshold_himalaya, 3) || 'N/A'} mm/hr</td></tr>
             <tr><td>Status</td><td><strong>${analysisResults.rainfallThreshold?.status || 'N/A'}</strong></td></tr>
         </table>
         <h3>Green-Ampt Infiltration</h3>
         <table>
-            <tr><td>Cumulative Infiltration</td><td>${analysisResults.infiltration?.cumulative_infiltration_mm || 'N/A'} mm</td></tr>
-            <tr><td>Final Infiltration Rate</td><td>${analysisResults.infiltration?.final_rate_mmhr || 'N/A'} mm/hr</td></tr>
-            <tr><td>Surface Saturation Time</td><td>${analysisResults.infiltration?.saturation_time_hr ? analysisResults.infiltration.saturation_time_hr + ' hr' : 'Not reached'}</td></tr>
+            <tr><td>Cumulative Infiltration</td><td>${fmt(analysisResults.infiltration?.cumulative_infiltration_mm, 2) || 'N/A'} mm</td></tr>
+            <tr><td>Final Infiltration Rate</td><td>${fmt(analysisResults.infiltration?.final_rate_mmhr, 3) || 'N/A'} mm/hr</td></tr>
+            <tr><td>Surface Saturation Time</td><td>${analysisResults.infiltration?.saturation_time_hr ? fmt(analysisResults.infiltration.saturation_time_hr, 1) + ' hr' : 'Not reached'}</td></tr>
             <tr><td>Runoff Onset</td><td>${analysisResults.infiltration?.runoff_onset ? 'Yes' : 'No'}</td></tr>
         </table>
+        ${renderTransientTable(analysisResults.transientInfiltration, analysisResults.liveWeather)}
+        ${renderUnsaturatedTable(analysisResults.unsaturatedFlow, analysisResults.liveWeather)}
+        ${renderForecastTable(analysisResults.forecast, riskAssessment?.forecast)}
     </div>
 
     <!-- 5. RISK CLASSIFICATION -->
@@ -202,15 +206,31 @@ const ReportGenerator = (function () {
         <h3>Monte Carlo Simulation</h3>
         <table>
             <tr><td>Iterations</td><td>${analysisResults.monteCarlo?.iterations || 'N/A'}</td></tr>
-            <tr><td>Mean FoS</td><td>${analysisResults.monteCarlo?.mean_fos || 'N/A'}</td></tr>
-            <tr><td>Std Deviation</td><td>${analysisResults.monteCarlo?.std_fos || 'N/A'}</td></tr>
-            <tr><td>Min FoS</td><td>${analysisResults.monteCarlo?.min_fos || 'N/A'}</td></tr>
-            <tr><td>Max FoS</td><td>${analysisResults.monteCarlo?.max_fos || 'N/A'}</td></tr>
-            <tr><td>Probability of Failure</td><td><strong>${analysisResults.monteCarlo?.probability_of_failure || 'N/A'}%</strong></td></tr>
-            <tr><td>Reliability Index (β)</td><td>${analysisResults.monteCarlo?.reliability_index || 'N/A'}</td></tr>
+            <tr><td>Mean FoS</td><td>${fmt(analysisResults.monteCarlo?.mean_fos, 4) || 'N/A'}</td></tr>
+            <tr><td>Std Deviation</td><td>${fmt(analysisResults.monteCarlo?.std_fos, 4) || 'N/A'}</td></tr>
+            <tr><td>Min FoS</td><td>${fmt(analysisResults.monteCarlo?.min_fos, 4) || 'N/A'}</td></tr>
+            <tr><td>Max FoS</td><td>${fmt(analysisResults.monteCarlo?.max_fos, 4) || 'N/A'}</td></tr>
+            <tr><td>Probability of Failure</td><td><strong>${fmt(analysisResults.monteCarlo?.probability_of_failure, 2) || 'N/A'}%</strong></td></tr>
+            <tr><td>Reliability Index (β)</td><td>${fmt(analysisResults.monteCarlo?.reliability_index, 3) || 'N/A'}</td></tr>
         </table>
+        <h3>First-Order Reliability (FORM)</h3>
+        <table>
+            <tr><td>Hasofer-Lind Index (β)</td><td><strong>${fmt(analysisResults.form?.reliability_index, 3) ?? 'N/A'}</strong></td></tr>
+            <tr><td>Probability of Failure Φ(−β)</td><td>${fmt(analysisResults.form?.probability_of_failure, 4) ?? 'N/A'}%</td></tr>
+            <tr><td>Design Point (c', φ', γ, β)</td><td>${analysisResults.form ? ['cohesion', 'frictionAngle', 'unitWeight', 'slopeAngle'].map(k => fmt(analysisResults.form.designPoint[k], 3)).join(', ') : 'N/A'}</td></tr>
+            <tr><td>Sensitivity Factors α</td><td>${analysisResults.form ? ['cohesion', 'frictionAngle', 'unitWeight', 'slopeAngle'].map(k => analysisResults.form.sensitivity[k].toFixed(2)).join(', ') : 'N/A'}</td></tr>
+            <tr><td>Limit-State Evaluations</td><td>${analysisResults.form?.evaluations ?? 'N/A'}</td></tr>
+        </table>
+        ${analysisResults.rareEvent ? `
+        <h3>Rare-Event Probability (Importance Sampling)</h3>
+        <table>
+            <tr><td>Probability of Failure</td><td><strong>${sig(analysisResults.rareEvent.probability_of_failure, 4)}%</strong> (95% CI ${sig(analysisResults.rareEvent.pf_ci95[0], 4)}–${sig(analysisResults.rareEvent.pf_ci95[1], 4)}%)</td></tr>
+            <tr><td>Coefficient of Variation</td><td>${fmt(analysisResults.rareEvent.cov, 4) ?? 'N/A'}</td></tr>
+            <tr><td>Samples</td><td>${analysisResults.rareEvent.samples}</td></tr>
+        </table>` : ''}
         <h3>Sensitivity Analysis</h3>
-        <p>Most Sensitive Parameter: <strong>${analysisResults.sensitivity?.mostSensitiveLabel || 'N/A'}</strong></p>
+        <p>Most Sensitive Parameter: <strong>${analysisResults.globalSensitivity?.mostSensitiveLabel || analysisResults.sensitivity?.mostSensitiveLabel || 'N/A'}</strong></p>
+        ${renderSobolTable(analysisResults.globalSensitivity)}
         ${renderSensitivityTable(analysisResults.sensitivity)}
     </div>
 
@@ -218,12 +238,12 @@ const ReportGenerator = (function () {
     <div class="section">
         <h2>7. Structural & Foundation Safety</h2>
         <table>
-            <tr><td>Setback (IS 14458)</td><td>${analysisResults.foundation?.minSetback_IS || 'N/A'} m</td></tr>
-            <tr><td>Setback (IRC:SP:48)</td><td>${analysisResults.foundation?.minSetback_IRC || 'N/A'} m</td></tr>
-            <tr><td>Required Setback</td><td>${analysisResults.foundation?.effectiveSetback || 'N/A'} m</td></tr>
+            <tr><td>Setback (IS 14458)</td><td>${fmt(analysisResults.foundation?.minSetback_IS, 1) || 'N/A'} m</td></tr>
+            <tr><td>Setback (IRC:SP:48)</td><td>${fmt(analysisResults.foundation?.minSetback_IRC, 1) || 'N/A'} m</td></tr>
+            <tr><td>Required Setback</td><td>${fmt(analysisResults.foundation?.effectiveSetback, 1) || 'N/A'} m</td></tr>
             <tr><td>Actual Setback</td><td>${analysisResults.foundation?.actualSetback || 'N/A'} m</td></tr>
             <tr><td>Status</td><td><strong>${analysisResults.foundation?.isSetbackSafe ? 'SAFE' : 'UNSAFE'}</strong></td></tr>
-            <tr><td>Bearing Capacity Reduction</td><td>${analysisResults.foundation?.bearingCapacityReduction || 'N/A'}%</td></tr>
+            <tr><td>Bearing Capacity Reduction</td><td>${fmt(analysisResults.foundation?.bearingCapacityReduction, 1) || 'N/A'}%</td></tr>
         </table>
         <p>${analysisResults.foundation?.recommendation || ''}</p>
     </div>
@@ -247,14 +267,14 @@ const ReportGenerator = (function () {
             <div style="background:#FFEBEE;padding:16px;border-radius:8px;text-align:center">
                 <div style="font-size:11px;color:#888;text-transform:uppercase;letter-spacing:1px">Before Mitigation</div>
                 <div style="font-size:28px;font-weight:700;color:#D32F2F;margin:8px 0">${outcome.before.fos}</div>
-                <div style="font-size:12px">Failure Probability: ${outcome.before.failureProbability}</div>
+                <div style="font-size:12px">Failure Probability: ${fmt(outcome.before.failureProbability, 3)}</div>
                 <div style="font-size:11px;color:#D32F2F;font-weight:600">${outcome.before.riskLabel}</div>
             </div>
             <div style="background:#E8F5E9;padding:16px;border-radius:8px;text-align:center">
                 <div style="font-size:11px;color:#888;text-transform:uppercase;letter-spacing:1px">After Mitigation</div>
                 <div style="font-size:28px;font-weight:700;color:#2E7D32;margin:8px 0">${outcome.after.fos}</div>
                 <div style="font-size:12px">FoS Range: ${outcome.after.fosRange}</div>
-                <div style="font-size:12px">Failure Probability: ${outcome.after.failureProbability}</div>
+                <div style="font-size:12px">Failure Probability: ${fmt(outcome.after.failureProbability, 3)}</div>
                 <div style="font-size:11px;color:#2E7D32;font-weight:600">${outcome.after.riskLabel}</div>
             </div>
         </div>
@@ -273,7 +293,7 @@ const ReportGenerator = (function () {
         <table>
             <tr><td>Vegetation Cover</td><td>${analysisResults.vegetation?.vegetationPct || 'N/A'}%</td></tr>
             <tr><td>Category</td><td>${analysisResults.vegetation?.category || 'N/A'}</td></tr>
-            <tr><td>NDVI Estimate</td><td>${analysisResults.vegetation?.ndvi_estimate || 'N/A'}</td></tr>
+            <tr><td>NDVI Estimate</td><td>${fmt(analysisResults.vegetation?.ndvi_estimate, 2) || 'N/A'}</td></tr>
             <tr><td>Root Cohesion Addition</td><td>${analysisResults.vegetation?.rootCohesion || 'N/A'} kPa</td></tr>
             <tr><td>Tree Density Estimate</td><td>${analysisResults.vegetation?.treeDensity_est || 'N/A'} trees/ha</td></tr>
             <tr><td>Deforestation Risk</td><td>${analysisResults.vegetation?.deforestationRisk || 'N/A'}</td></tr>
@@ -313,6 +333,15 @@ const ReportGenerator = (function () {
     // HELPER FUNCTIONS
     // ========================================================================
 
+    // Display rounding for engine numbers (results may be full precision)
+    function fmt(value, digits) {
+        return typeof value === 'number' && isFinite(value) ? parseFloat(value.toFixed(digits)) : value;
+    }
+
+    function sig(value, digits) {
+        return typeof value === 'number' && isFinite(value) ? parseFloat(value.toPrecision(digits)) : value;
+    }
+
     function getFoSStatus(fos) {
         if (fos == null) return 'N/A';
         if (fos >= 1.5) return '<span style="color:#2E7D32;font-weight:600">SAFE</span>';
@@ -367,12 +396,86 @@ const ReportGenerator = (function () {
         return html;
     }
 
+    function renderTransientTable(tr, weather) {
+        if (!tr) return '';
+        const times = weather?.hourly?.time || [];
+        const at = h => h === null ? 'Not reached' : (times[h] ? times[h].replace('T', ' ') : `hour ${h}`);
+        return `<h3>Transient Infiltration (Iverson / TRIGRS)</h3>
+        <p>Pressure head over a ${tr.depths.length}-node depth grid driven by the ${tr.hours}-hour Open-Meteo rainfall series; initial water table at ${fmt(tr.waterTableDepth, 2)} m depth.</p>
+        <table>
+            <tr><td>Initial FoS (critical depth)</td><td>${fmt(tr.initialFoS, 3)}</td></tr>
+            <tr><td>Minimum FoS</td><td><strong>${fmt(tr.minimumFoS, 3)}</strong> at ${fmt(tr.criticalDepth_m, 2)} m depth</td></tr>
+            <tr><td>Time of Minimum</td><td>${at(tr.criticalHour)}</td></tr>
+            <tr><td>First FoS &lt; 1.0</td><td>${at(tr.failureHour)}</td></tr>
+        </table>`;
+    }
+
+    function renderUnsaturatedTable(uf, weather) {
+        if (!uf) return '';
+        const times = weather?.hourly?.precipitation?.length === uf.hours ? weather.hourly.time : [];
+        const at = h => h === null ? 'Not reached' : (times[h] ? times[h].replace('T', ' ') : `hour ${h}`);
+        return `<h3>Unsaturated Flow (Richards Equation)</h3>
+        <p>Suction and pore pressure over a ${uf.depths.length}-node column for ${uf.hours} hours of ${times.length ? 'Open-Meteo hourly rainfall' : 'design-storm rainfall'}; shear strength includes matric suction (Fredlund). Initial water table at ${fmt(uf.waterTableDepth, 2)} m depth, ${uf.base} base.</p>
+        <table>
+            <tr><td>Initial FoS (critical depth)</td><td>${fmt(uf.initialFoS, 3)}</td></tr>
+            <tr><td>Minimum FoS</td><td><strong>${fmt(uf.minimumFoS, 3)}</strong> at ${fmt(uf.criticalDepth_m, 2)} m depth</td></tr>
+            <tr><td>Time of Minimum</td><td>${at(uf.criticalHour)}</td></tr>
+            <tr><td>First FoS &lt; 1.0</td><td>${at(uf.failureHour)}</td></tr>
+            <tr><td>Rainfall / Infiltration / Runoff</td><td>${fmt(uf.rainfall_mm, 1)} / ${fmt(uf.infiltration_mm, 1)} / ${fmt(uf.runoff_mm, 1)} mm</td></tr>
+            <tr><td>Solver</td><td>${uf.steps} steps, ${uf.iterations} Picard iterations, mass balance error ${fmt(uf.massBalanceError * 100, 3)}%</td></tr>
+        </table>`;
+    }
+
+    function renderForecastTable(fc, risk) {
+        if (!fc) return '';
+        const at = c => c ? c.time ? c.time.replace('T', ' ') : `hour ${c.hour}` : 'Not reached';
+        return `<h3>Hourly Stability Forecast</h3>
+        <p>Hour-by-hour FoS, I-D status and risk score over ${fc.hours} hours of Open-Meteo rainfall (past 2 days and 7-day forecast), with the water table carried forward from the current saturation.</p>
+        <table>
+            <tr><td>Total Rainfall / Peak Saturation</td><td>${fmt(fc.totalRainfall, 1)} mm / ${fmt(fc.peakSaturation, 1)}%</td></tr>
+            <tr><td>Minimum FoS</td><td><strong>${fmt(fc.minimumFoS, 3)}</strong> at ${at(fc.criticalHour)}</td></tr>
+            <tr><td>First FoS &lt; 1.0</td><td>${at(fc.firstCrossing.fos)}</td></tr>
+            <tr><td>First I-D Threshold Exceedance</td><td>${at(fc.firstCrossing.idThreshold)}</td></tr>
+            ${risk ? `<tr><td>Peak Risk Score</td><td>${fmt(risk.peak?.score, 1)} (${risk.peak?.level || 'N/A'}) at ${at(risk.peak)}</td></tr>
+            <tr><td>First HIGH Risk Hour</td><td>${at(risk.firstHighRisk)}</td></tr>` : ''}
+        </table>`;
+    }
+
+    function renderSeismicTable(sm) {
+        if (!sm) return '';
+        const ev = sm.governingEvent;
+        return `<h3>Seismic Response (Pseudo-Static / Newmark)</h3>
+        <p>Rigid-block sliding for ${sm.events} USGS events: PGA from magnitude and distance (Joyner &amp; Boore, 1981), synthetic records integrated at the site's critical acceleration; ${sm.integrated} events exceed it.</p>
+        <table>
+            <tr><td>Critical Acceleration (k<sub>y</sub>)</td><td>${sm.staticallyUnstable ? 'Statically unstable' : fmt(sm.ky, 3) + ' g'}</td></tr>
+            <tr><td>Peak Site PGA</td><td>${fmt(sm.maxPGA, 3)} g</td></tr>
+            <tr><td>Pseudo-Static FoS</td><td><strong>${fmt(sm.pseudoStaticFoS, 3)}</strong> at k<sub>h</sub> = ${fmt(sm.designKh, 3)} (0.5·PGA)</td></tr>
+            <tr><td>Maximum Newmark Displacement</td><td><strong>${fmt(sm.maxDisplacement, 2)} cm</strong> (${sm.hazardClass})</td></tr>
+            <tr><td>Governing Event</td><td>${ev ? `M${fmt(ev.magnitude, 1)}, ${fmt(ev.distance, 1)} km${ev.place ? ' — ' + ev.place : ''} (Jibson 2007: ${fmt(ev.regression, 2)} cm)` : 'None exceeds k<sub>y</sub>'}</td></tr>
+            <tr><td>Events ≥ 1 / 5 / 15 cm</td><td>${sm.exceedance.cm1} / ${sm.exceedance.cm5} / ${sm.exceedance.cm15}</td></tr>
+        </table>`;
+    }
+
     function renderSensitivityTable(sens) {
         if (!sens?.results) return '<p>Sensitivity analysis not performed.</p>';
         let html = '<table><tr><th>Parameter</th><th>Base Value</th><th>FoS (+10%)</th><th>FoS (-10%)</th><th>Swing</th><th>Sensitivity %</th></tr>';
         for (const key of sens.sortedKeys) {
             const r = sens.results[key];
-            html += `<tr><td>${r.label}</td><td>${r.baseValue}</td><td>${r.fos_high}</td><td>${r.fos_low}</td><td>${r.swing}</td><td>${r.sensitivity_pct}%</td></tr>`;
+            html += `<tr><td>${r.label}</td><td>${fmt(r.baseValue, 2)}</td><td>${fmt(r.fos_high, 4)}</td><td>${fmt(r.fos_low, 4)}</td><td>${fmt(r.swing, 4)}</td><td>${fmt(r.sensitivity_pct, 1)}%</td></tr>`;
+        }
+        html += '</table>';
+        return html;
+    }
+
+    function renderSobolTable(gsa) {
+        if (!gsa?.results) return '';
+        let html = `<p>Global variance-based indices — ${gsa.method}, ${gsa.evaluations} evaluations. Interaction share: ${(gsa.interactionShare * 100).toFixed(1)}% of variance.</p>`;
+        html += '<table><tr><th>Parameter</th><th>Base Value</th><th>First Order (S<sub>i</sub>)</th><th>Total Effect (S<sub>T</sub>)</th></tr>';
+        for (const key of gsa.sortedKeys) {
+            const r = gsa.results[key];
+            html += r.screened
+                ? `<tr><td>${r.label}</td><td>${fmt(r.baseValue, 2)}</td><td colspan="2">Screened out (Morris μ* = ${fmt(r.mu_star, 4)})</td></tr>`
+                : `<tr><td>${r.label}</td><td>${fmt(r.baseValue, 2)}</td><td>${fmt(r.first, 4)}</td><td>${fmt(r.total, 4)}</td></tr>`;
         }
         html += '</table>';
         return html;
@@ -107,6 +107,19 @@ const RiskClassifier = (function () {
         // Apply risk modifier from field observations (capped)
         const adjustedScore = Math.min(100, compositeScore + riskModifier * 100 * 0.15);
 
+        // ----------------------------------------------------------------
+        // HOURLY FORECAST — re-score the time-varying components
+        // ----------------------------------------------------------------
+        const forecast = analysisResults.forecast ? scoreForecast(analysisResults.forecast, {
+            weights: weights,
+            // Everything that does not change hour to hour
+            staticScore: compositeScore - fosScore * weights.geotechnical -
+                rainfallScore * weights.rainfall - terrainScore * weights.terrain,
+            // The I-D exceedance part of the modifier moves with the forecast
+            staticModifier: riskModifier - ((rainfallThreshold.level || 0) >= 2 ? 0.15 : 0),
+            slopeAngle: slopeAngle
+        }) : null;
+
         // ----------------------------------------------------------------
         // CLASSIFICATION
         // ----------------------------------------------------------------
@@ -207,6 +220,9 @@ const RiskClassifier = (function () {
                 }
             },
 
+            // Hourly timeline (null without live hourly weather)
+            forecast: forecast,
+
             // Audit trail
             weights: weights,
             riskModifier: riskModifier,
@@ -217,6 +233,53 @@ const RiskClassifier = (function () {
         };
     }
 
+    /**
+     * Composite risk score for every forecast hour
+     *
+     * Geotechnical, rainfall and terrain components are re-scored from the
+     * hourly composite FoS, I-D status and saturation; the other components
+     * keep their present values.
+     *
+     * @param {Object} forecast - analysisResults.forecast (GeotechnicalEngine.fosForecast())
+     * @param {Object} base - { weights, staticScore, staticModifier, slopeAngle }
+     * @returns {Object} { scores, codes, peak, firstHighRisk }
+     */
+    function scoreForecast(forecast, base) {
+        const n = forecast.hours;
+        const fos = forecast.compositeFoS || forecast.fos;
+        const scores = new Float64Array(n);
+        const codes = new Uint8Array(n);
+        const w = base.weights;
+        let peak = 0, firstHigh = null;
+
+        for (let t = 0; t < n; t++) {
+            const level = forecast.idLevel[t];
+            const modifier = base.staticModifier + (level >= 2 ? 0.15 : 0);
+            const score = Math.min(100, base.staticScore +
+                fosToRiskScore(fos[t]) * w.geotechnical +
+                rainfallToRiskScore({ level: level, exceedance_pct_regional: forecast.idExceedance[t] }) * w.rainfall +
+                terrainToRiskScore(base.slopeAngle, forecast.saturation[t]) * w.terrain +
+                modifier * 100 * 0.15);
+            scores[t] = score;
+            codes[t] = scoreToClassification(score).code;
+            if (score > scores[peak]) peak = t;
+            if (firstHigh === null && score >= 60) firstHigh = t;
+        }
+
+        const at = t => ({
+            hour: t,
+            time: forecast.time[t] || null,
+            score: parseFloat(scores[t].toFixed(1)),
+            level: scoreToClassification(scores[t]).level
+        });
+        return {
+            scores: scores,
+            codes: codes,
+            peak: n > 0 ? at(peak) : null,
+            firstHighRisk: firstHigh === null ? null : at(firstHigh)
+        };
+    }
+
     // ========================================================================
     // SEISMIC RISK SCORING (from USGS live data)
     // ========================================================================
@@ -534,6 +597,7 @@ const RiskClassifier = (function () {
     // ========================================================================
     return {
         classifyRisk,
+        scoreForecast,
         fosToRiskScore,
         rainfallToRiskScore,
         vegetationToRiskScore,
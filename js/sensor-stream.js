@@ -0,0 +1,567 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Sensor Stream Ingestion
+ * ============================================================================
+ * Incremental reader for field-sensor exports (the inclinometers,
+ * piezometers and rain gauges of MitigationEngine's monitoring plan).
+ * Files are consumed chunk by chunk from a File / Blob / ReadableStream,
+ * so multi-month, multi-million-row logs run in constant memory: nothing
+ * is kept per row, only per-channel state.
+ *
+ * Formats (auto-detected from the first line):
+ *   NDJSON     {"time": ..., "sensor": ..., "value": ..., "type": ...} per line
+ *   CSV long   header with time, sensor and value columns (type optional)
+ *   CSV wide   header with a time column and one column per sensor
+ * Times are ISO strings or epoch numbers (seconds below 1e11, else ms).
+ * Records must be time-ordered per channel; late records are counted and
+ * dropped.
+ *
+ * Per channel:
+ *   rain          raw depths per interval (mm) into rolling sums over the
+ *                 I-D durations — not smoothed, which would smear intensity
+ *   piezometer    KalmanFilter-smoothed reading, extremes and mean
+ *   displacement  KalmanFilter-smoothed reading into a rolling least-squares
+ *                 trend → velocity (mm/day)
+ * Rolling windows are ring buffers with running sums: O(1) amortised per
+ * record regardless of window length.
+ *
+ * Alarms (raised when a channel's level changes):
+ *   rainfall      mean intensity over each rolling duration against the
+ *                 Caine / Himalayan I-D thresholds (engine levels 0–3)
+ *   displacement  trend velocity against DISPLACEMENT_RATE_LEVELS
+ * ============================================================================
+ */
+
+const SensorStream = (function () {
+    'use strict';
+
+    const ID_DURATIONS = [1, 3, 6, 12, 24, 48];     // h — rolling I-D windows
+    const TREND_WINDOW = 24;                          // h — displacement velocity window
+    const MAX_ALARMS = 1000;                          // alarms kept in the summary
+    const HOUR = 3600 * 1000;
+    const DAY = 24 * HOUR;
+
+    // Velocity alarm levels (mm/day) — defaults, calibrate per site
+    const DISPLACEMENT_RATE_LEVELS = [
+        { level: 1, label: 'CAUTION', rate: 2 },
+        { level: 2, label: 'WARNING', rate: 10 },
+        { level: 3, label: 'CRITICAL', rate: 50 }
+    ];
+
+    // Kalman noise per sensor type (process Q, measurement R)
+    const FILTER_NOISE = {
+        piezometer: { Q: 0.05, R: 0.5 },
+        displacement: { Q: 0.01, R: 0.25 },
+        generic: { Q: 0.1, R: 1.0 }
+    };
+
+    const COLUMN_ALIASES = {
+        time: ['time', 'timestamp', 'datetime', 'date_time', 'date', 'ts'],
+        sensor: ['sensor', 'sensor_id', 'channel', 'id', 'station'],
+        value: ['value', 'reading', 'val', 'measurement'],
+        type: ['type', 'sensor_type', 'kind']
+    };
+
+    // ========================================================================
+    // ROLLING WINDOWS
+    // ========================================================================
+
+    // Double a ring buffer's capacity, unrolling it to start at index 0
+    function growRing(ring) {
+        const cap = ring.times.length;
+        const times = new Float64Array(cap * 2);
+        const values = new Float64Array(cap * 2);
+        for (let k = 0; k < ring.count; k++) {
+            times[k] = ring.times[(ring.head + k) % cap];
+            values[k] = ring.values[(ring.head + k) % cap];
+        }
+        ring.times = times;
+        ring.values = values;
+        ring.head = 0;
+    }
+
+    /**
+     * Time-based rolling sum over a ring buffer
+     */
+    class RollingSum {
+        /**
+         * @param {number} span - Window length (same unit as the push times)
+         */
+        constructor(span) {
+            this.span = span;
+            this.times = new Float64Array(64);
+            this.values = new Float64Array(64);
+            this.head = 0;
+            this.count = 0;
+            this.sum = 0;
+        }
+
+        push(time, value) {
+            this.evict(time);
+            if (this.count === this.times.length) growRing(this);
+            const i = (this.head + this.count) % this.times.length;
+            this.times[i] = time;
+            this.values[i] = value;
+            this.count++;
+            this.sum += value;
+            return this.sum;
+        }
+
+        // Drop entries at or before time − span
+        evict(time) {
+            const cap = this.times.length;
+            const cutoff = time - this.span;
+            while (this.count > 0 && this.times[this.head] <= cutoff) {
+                this.sum -= this.values[this.head];
+                this.head = (this.head + 1) % cap;
+                this.count--;
+            }
+            // Clear round-off left by the running subtraction
+            if (this.count === 0 || this.sum < 0) this.sum = 0;
+        }
+    }
+
+    /**
+     * Time-based rolling least-squares trend: running Σt, Σx, Σt², Σtx over
+     * a ring buffer, so slope() is O(1) after every push
+     */
+    class RollingTrend {
+        /**
+         * @param {number} span - Window length (ms)
+         */
+        constructor(span) {
+            this.span = span;
+            this.times = new Float64Array(64);
+            this.values = new Float64Array(64);
+            this.head = 0;
+            this.count = 0;
+            this.origin = 0;            // time origin for the sums (reset when empty)
+            this.st = 0; this.sx = 0; this.stt = 0; this.stx = 0;
+        }
+
+        push(time, value) {
+            this.evict(time);
+            if (this.count === 0) this.origin = time;
+            if (this.count === this.times.length) growRing(this);
+            const i = (this.head + this.count) % this.times.length;
+            this.times[i] = time;
+            this.values[i] = value;
+            this.count++;
+            const t = (time - this.origin) / DAY;
+            this.st += t; this.sx += value; this.stt += t * t; this.stx += t * value;
+        }
+
+        evict(time) {
+            const cap = this.times.length;
+            const cutoff = time - this.span;
+            while (this.count > 0 && this.times[this.head] <= cutoff) {
+                const t = (this.times[this.head] - this.origin) / DAY;
+                const x = this.values[this.head];
+                this.st -= t; this.sx -= x; this.stt -= t * t; this.stx -= t * x;
+                this.head = (this.head + 1) % cap;
+                this.count--;
+            }
+            if (this.count === 0) this.st = this.sx = this.stt = this.stx = 0;
+        }
+
+        /**
+         * Time spanned by the points in the window (ms)
+         */
+        coverage() {
+            if (this.count < 2) return 0;
+            const last = (this.head + this.count - 1) % this.times.length;
+            return this.times[last] - this.times[this.head];
+        }
+
+        /**
+         * Least-squares slope per day, or NaN with fewer than 3 points
+         */
+        slope() {
+            const n = this.count;
+            if (n < 3) return NaN;
+            const var_t = this.stt - this.st * this.st / n;
+            if (!(var_t > 0)) return NaN;
+            return (this.stx - this.st * this.sx / n) / var_t;
+        }
+    }
+
+    // ========================================================================
+    // PARSING
+    // ========================================================================
+
+    /**
+     * Sensor type from a channel name or a free-text type
+     * ('rain_gauge', 'inclinometer', 'PZ-3', 'INC1', ...)
+     *
+     * Piezometer and displacement patterns are tested first, so instrument
+     * names that merely contain 'gauge' ('crack_gauge_1', 'pore_pressure_gauge')
+     * never feed the rolling rain sums.
+     * @returns {string} 'rain' | 'piezometer' | 'displacement' | 'generic'
+     */
+    function inferSensorType(name) {
+        const s = String(name).toLowerCase();
+        if (/piezo|^pz\b|^pz[-_\d]|pore|pwp|water_?level/.test(s)) return 'piezometer';
+        if (/incl|^inc\b|^inc[-_\d]|tilt|disp|extenso|^ext\b|^ext[-_\d]|crack|gnss|gps|move/.test(s)) return 'displacement';
+        if (/(^|[^d])rain|precip|^rg\b|^rg[-_\d]/.test(s)) return 'rain';
+        return 'generic';
+    }
+
+    function parseTime(value) {
+        if (typeof value === 'number') return value < 1e11 ? value * 1000 : value;
+        const s = String(value).trim();
+        if (/^\d+(\.\d+)?$/.test(s)) return parseTime(parseFloat(s));
+        return Date.parse(s.indexOf('T') === -1 && s.indexOf(' ') > 0 ? s.replace(' ', 'T') : s);
+    }
+
+    // Quote-aware CSV split (quotes only where present — the common case is a plain split)
+    function splitCSV(line) {
+        if (line.indexOf('"') === -1) return line.split(',');
+        const out = [];
+        let field = '', quoted = false;
+        for (let i = 0; i < line.length; i++) {
+            const ch = line[i];
+            if (quoted) {
+                if (ch === '"') {
+                    if (line[i + 1] === '"') { field += '"'; i++; } else quoted = false;
+                } else field += ch;
+            } else if (ch === '"') quoted = true;
+            else if (ch === ',') { out.push(field); field = ''; }
+            else field += ch;
+        }
+        out.push(field);
+        return out;
+    }
+
+    function findColumn(header, key) {
+        const aliases = COLUMN_ALIASES[key];
+        for (let i = 0; i < header.length; i++) {
+            if (aliases.indexOf(header[i]) !== -1) return i;
+        }
+        return -1;
+    }
+
+    // ========================================================================
+    // INGESTOR
+    // ========================================================================
+
+    /**
+     * Incremental ingestor — feed text chunks with push(), then end()
+     *
+     * @param {Object} [options]
+     * @param {Object} [options.types] - { sensorId: type } overrides for inferSensorType()
+     * @param {number[]} [options.durations] - Rolling I-D durations (h)
+     * @param {number} [options.trendWindow] - Displacement velocity window (h)
+     * @param {Array} [options.rateLevels] - Velocity alarm levels (mm/day)
+     * @param {Object} [options.noise] - Kalman { Q, R } per sensor type
+     * @param {Function} [options.onAlarm] - Called with each alarm as it is raised
+     * @returns {Object} { push, end, record, getSummary }
+     */
+    function createIngestor(options = {}) {
+        const E = GeotechnicalEngine;
+        const {
+            types = {},
+            durations = ID_DURATIONS,
+            trendWindow = TREND_WINDOW,
+            rateLevels = DISPLACEMENT_RATE_LEVELS,
+            noise = {},
+            onAlarm = null,
+            maxAlarms = MAX_ALARMS
+        } = options;
+
+        // I-D thresholds are fixed per duration — evaluate once
+        const thresholds = durations.map(D => ({
+            hours: D,
+            caine: E.caineThreshold(D),
+            himalaya: E.himalayanThreshold(D)
+        }));
+
+        const channels = new Map();
+        const alarms = [];
+        const stats = { lines: 0, records: 0, skipped: 0, outOfOrder: 0, alarms: 0, chars: 0 };
+        let remainder = '';
+        let format = null;          // 'ndjson' | 'long' | 'wide'
+        let columns = null;         // { time, sensor, value, type } indices or wide names
+
+        function channel(id, type) {
+            let ch = channels.get(id);
+            if (ch) return ch;
+            const kind = inferSensorType(types[id] || type || id);
+            const n = Object.assign({}, FILTER_NOISE[kind] || FILTER_NOISE.generic, noise[kind]);
+            ch = {
+                id: id,
+                type: kind,
+                filter: kind === 'rain' ? null : new E.KalmanFilter(n.Q, n.R),
+                windows: kind === 'rain' ? thresholds.map(th => new RollingSum(th.hours * HOUR)) : null,
+                trend: kind === 'displacement' ? new RollingTrend(trendWindow * HOUR) : null,
+                count: 0, min: Infinity, max: -Infinity, sum: 0,
+                first: NaN, last: NaN, value: NaN, smoothed: NaN,
+                rate: NaN, maxRate: NaN, maxIntensity: 0, total: 0,
+                level: 0, maxLevel: 0
+            };
+            channels.set(id, ch);
+            return ch;
+        }
+
+        function raise(ch, time, level, detail) {
+            const previous = ch.level;
+            ch.level = level;
+            if (level > ch.maxLevel) ch.maxLevel = level;
+            const alarm = Object.assign({
+                time: new Date(time).toISOString(),
+                sensor: ch.id,
+                type: ch.type,
+                level: level,
+                previousLevel: previous,
+                rising: level > previous
+            }, detail);
+            stats.alarms++;
+            if (alarms.length < maxAlarms) alarms.push(alarm);
+            if (onAlarm) onAlarm(alarm);
+        }
+
+        /**
+         * Process one reading
+         * @param {number|string} time
+         * @param {string} sensor
+         * @param {number} value
+         * @param {string} [type]
+         */
+        function record(time, sensor, value, type) {
+            const t = parseTime(time);
+            if (!(t === t) || !(value === value)) { stats.skipped++; return; }
+            const ch = channel(sensor, type);
+            if (ch.last === ch.last && t < ch.last) { stats.outOfOrder++; return; }
+            stats.records++;
+
+            if (ch.count === 0) ch.first = t;
+            ch.count++;
+            ch.last = t;
+            ch.value = value;
+            if (value < ch.min) ch.min = value;
+            if (value > ch.max) ch.max = value;
+            ch.sum += value;
+
+            if (ch.type === 'rain') {
+                ch.total += value;
+                let level = 0, governing = 0, intensity = 0;
+                for (let k = 0; k < thresholds.length; k++) {
+                    const th = thresholds[k];
+                    const I = ch.windows[k].push(t, value) / th.hours;
+                    const l = E.idThresholdLevel(I, th.caine, th.himalaya);
+                    if (l > level || (l === level && I / th.himalaya > intensity / thresholds[governing].himalaya)) {
+                        level = l; governing = k; intensity = I;
+                    }
+                    if (I > ch.maxIntensity) ch.maxIntensity = I;
+                }
+                if (level !== ch.level) {
+                    const D = thresholds[governing].hours;
+                    const check = E.checkIDThreshold(intensity, D);
+                    raise(ch, t, level, {
+                        kind: 'rainfall',
+                        intensity: intensity,
+                        duration: D,
+                        status: check.status,
+                        exceedance_pct_regional: check.exceedance_pct_regional
+                    });
+                }
+                return;
+            }
+
+            ch.smoothed = ch.filter.update(value);
+            if (ch.type === 'displacement') {
+                ch.trend.push(t, ch.smoothed);
+                // Velocity once the window holds at least half its span of data
+                const rate = ch.trend.coverage() >= ch.trend.span / 2 ? ch.trend.slope() : NaN;
+                ch.rate = rate;
+                if (rate === rate) {
+                    const speed = Math.abs(rate);
+                    if (!(speed <= ch.maxRate)) ch.maxRate = speed;
+                    let level = 0, label = 'NORMAL';
+                    for (let k = 0; k < rateLevels.length; k++) {
+                        if (speed >= rateLevels[k].rate) { level = rateLevels[k].level; label = rateLevels[k].label; }
+                    }
+                    if (level !== ch.level) {
+                        raise(ch, t, level, { kind: 'displacement', rate: rate, status: label });
+                    }
+                }
+            }
+        }
+
+        function header(line) {
+            const trimmed = line.trim();
+            if (trimmed[0] === '{') {
+                format = 'ndjson';
+                return false;
+            }
+            const names = splitCSV(trimmed).map(h => h.trim().toLowerCase());
+            const time = findColumn(names, 'time');
+            if (time === -1) throw new Error('Sensor CSV has no time column');
+            const sensor = findColumn(names, 'sensor');
+            const value = findColumn(names, 'value');
+            if (sensor !== -1 && value !== -1) {
+                format = 'long';
+                columns = { time: time, sensor: sensor, value: value, type: findColumn(names, 'type') };
+            } else {
+                format = 'wide';
+                // Keep the header's own spelling for channel ids
+                const original = splitCSV(trimmed).map(h => h.trim());
+                columns = { time: time, names: original };
+            }
+            return true;
+        }
+
+        function line(text) {
+            if (text.length === 0 || (text.length === 1 && text === '\r')) return;
+            if (text[text.length - 1] === '\r') text = text.slice(0, -1);
+            stats.lines++;
+            if (format === null && header(text)) return;
+
+            if (format === 'ndjson') {
+                let obj;
+                try { obj = JSON.parse(text); } catch (e) { stats.skipped++; return; }
+                if (obj === null || typeof obj !== 'object') { stats.skipped++; return; }
+                const time = obj.time !== undefined ? obj.time : obj.timestamp;
+                const sensor = obj.sensor !== undefined ? obj.sensor : obj.sensor_id;
+                if (sensor === undefined || sensor === null) { stats.skipped++; return; }
+                record(time, String(sensor), +obj.value, obj.type);
+                return;
+            }
+            const f = splitCSV(text);
+            if (format === 'long') {
+                // Short or truncated rows are skipped, not fatal
+                const sensor = f[columns.sensor];
+                if (sensor === undefined || sensor.trim() === '') { stats.skipped++; return; }
+                const type = columns.type !== -1 && f[columns.type] !== undefined ? f[columns.type].trim() : '';
+                record(f[columns.time], sensor.trim(), parseFloat(f[columns.value]), type || undefined);
+                return;
+            }
+            const names = columns.names;
+            for (let i = 0; i < names.length; i++) {
+                if (i === columns.time || f[i] === undefined || f[i] === '') continue;
+                record(f[columns.time], names[i], parseFloat(f[i]));
+            }
+        }
+
+        /**
+         * Feed a text chunk (split anywhere — partial lines are carried over)
+         */
+        function push(text) {
+            stats.chars += text.length;
+            const buffer = remainder + text;
+            let start = 0, nl;
+            while ((nl = buffer.indexOf('\n', start)) !== -1) {
+                line(buffer.slice(start, nl));
+                start = nl + 1;
+            }
+            remainder = buffer.slice(start);
+        }
+
+        /**
+         * Flush the final partial line
+         * @returns {Object} getSummary()
+         */
+        function end() {
+            if (remainder.length > 0) line(remainder);
+            remainder = '';
+            return getSummary();
+        }
+
+        function getSummary() {
+            const list = [];
+            channels.forEach(ch => {
+                const out = {
+                    id: ch.id,
+                    type: ch.type,
+                    count: ch.count,
+                    from: ch.count ? new Date(ch.first).toISOString() : null,
+                    to: ch.count ? new Date(ch.last).toISOString() : null,
+                    min: ch.min,
+                    max: ch.max,
+                    mean: ch.count ? ch.sum / ch.count : NaN,
+                    last: ch.value,
+                    level: ch.level,
+                    maxLevel: ch.maxLevel
+                };
+                if (ch.type === 'rain') {
+                    out.total = ch.total;
+                    out.maxIntensity = ch.maxIntensity;
+                } else {
+                    out.smoothed = ch.smoothed;
+                }
+                if (ch.type === 'displacement') {
+                    out.rate = ch.rate;
+                    out.maxRate = ch.maxRate;
+                }
+                list.push(out);
+            });
+            return {
+                format: format,
+                lines: stats.lines,
+                records: stats.records,
+                skipped: stats.skipped,
+                outOfOrder: stats.outOfOrder,
+                characters: stats.chars,
+                channels: list,
+                alarmCount: stats.alarms,
+                alarms: alarms.slice(),
+                maxLevel: list.reduce((m, ch) => Math.max(m, ch.maxLevel), 0)
+            };
+        }
+
+        return { push, end, record, getSummary };
+    }
+
+    /**
+     * Stream a sensor export through an ingestor
+     *
+     * @param {File|Blob|ReadableStream|AsyncIterable|string} source
+     * @param {Object} [options] - createIngestor() options, plus onProgress(summary-so-far)
+     * @returns {Promise<Object>} Summary — channels, alarms, counts
+     */
+    async function ingest(source, options = {}) {
+        const ingestor = createIngestor(options);
+        const onProgress = options.onProgress || null;
+        const decoder = new TextDecoder();
+        const feed = chunk => {
+            ingestor.push(typeof chunk === 'string' ? chunk : decoder.decode(chunk, { stream: true }));
+            if (onProgress) onProgress(ingestor.getSummary());
+        };
+
+        if (typeof source === 'string') {
+            ingestor.push(source);
+        } else {
+            const stream = typeof source.stream === 'function' ? source.stream() : source;
+            if (typeof stream.getReader === 'function') {
+                const reader = stream.getReader();
+                for (;;) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    feed(value);
+                }
+            } else if (stream[Symbol.asyncIterator]) {
+                for await (const chunk of stream) feed(chunk);
+            } else {
+                throw new Error('Unsupported sensor source');
+            }
+            ingestor.push(decoder.decode());
+        }
+        return ingestor.end();
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        ingest,
+        createIngestor,
+        inferSensorType,
+        RollingSum,
+        RollingTrend,
+        ID_DURATIONS,
+        DISPLACEMENT_RATE_LEVELS
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = SensorStream;
+}
@@ -0,0 +1,341 @@
+/**
+ * ============================================================================
+ * DHARARAKSHAK — Worker Pool
+ * ============================================================================
+ * Reusable pool of engine workers (js/engine-worker.js), each holding its
+ * own copy of GeotechnicalEngine. Jobs are queued and handed to the next
+ * idle worker, so independent numeric work runs on all available cores.
+ *
+ * Parallel Monte Carlo:
+ *   - The sample budget is split into fixed-size chunks; chunk k draws from
+ *     xoshiro stream k (2^64 jumps apart), so chunks are independent.
+ *   - Each worker returns a raw accumulator (moments + fine histogram),
+ *     merged on the main thread in chunk order. Chunk layout depends only
+ *     on the iteration count, so results are identical for any pool size.
+ *     GeotechnicalEngine.monteCarloSharded() is the same layout run
+ *     sequentially, so pooled and inline analyses agree exactly.
+ *   - With pfTolerance set, merging stops at the first chunk prefix whose
+ *     95% Wilson interval on P(failure) is narrow enough; queued chunks
+ *     are cancelled.
+ *
+ * Terrain stability (DEM rasters):
+ *   - Catchment area is a whole-grid pass and runs as one job; the grid is
+ *     then cut into row bands (with one-row halos) that are evaluated in
+ *     parallel and written back by row offset. Buffers are transferred,
+ *     not copied, and the result is identical for any pool size.
+ *
+ * Where Web Workers are unavailable the pool runs jobs inline with the
+ * same chunking, so callers get the same results on every platform.
+ * ============================================================================
+ */
+
+const WorkerPool = (function () {
+    'use strict';
+
+    const DEFAULT_SCRIPT = 'js/engine-worker.js';
+    const MC_CHUNK_SIZE = GeotechnicalEngine.MC_CHUNK_SIZE;    // Samples per Monte Carlo shard
+    const MAX_WORKERS = 8;
+
+    let sharedPool = null;
+
+    function isSupported() {
+        return typeof Worker !== 'undefined';
+    }
+
+    function defaultSize() {
+        const cores = (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || 2;
+        // Leave one core for the UI thread
+        return Math.max(1, Math.min(MAX_WORKERS, cores - 1));
+    }
+
+    // ========================================================================
+    // INLINE EXECUTOR (no Worker support)
+    // ========================================================================
+    function runInline(task, payload) {
+        if (task === 'mcPartial') {
+            return GeotechnicalEngine.monteCarloPartial(payload.params, payload.iterations, payload.options);
+        }
+        if (task === 'call') {
+            const fn = GeotechnicalEngine[payload.fn];
+            if (typeof fn !== 'function') throw new Error('Unknown engine function: ' + payload.fn);
+            return fn.apply(null, payload.args || []);
+        }
+        if (task === 'rasterTile') {
+            return GeotechnicalEngine.rasterStabilityTile(payload.tile, payload.params);
+        }
+        throw new Error('Unknown task: ' + task);
+    }
+
+    // ========================================================================
+    // POOL
+    // ========================================================================
+
+    /**
+     * Create a worker pool
+     *
+     * @param {Object} [options] - { size, scriptUrl }
+     * @returns {Object} pool
+     */
+    function create(options = {}) {
+        const size = options.size || defaultSize();
+        const scriptUrl = options.scriptUrl || DEFAULT_SCRIPT;
+        const inline = !isSupported() || options.inline === true;
+
+        const workers = [];
+        const idle = [];
+        const queue = [];
+        let nextJobId = 1;
+        let terminated = false;
+
+        function spawn() {
+            const worker = new Worker(scriptUrl);
+            const slot = { worker: worker, job: null };
+            worker.onmessage = function (e) {
+                const job = slot.job;
+                slot.job = null;
+                if (job) {
+                    if (e.data.ok) job.resolve(e.data.result);
+                    else job.reject(new Error(e.data.error));
+                }
+                release(slot);
+            };
+            worker.onerror = function (e) {
+                e.preventDefault();
+                const job = slot.job;
+                slot.job = null;
+                if (job) job.reject(new Error(e.message || 'Worker error'));
+                // Replace the crashed worker
+                worker.terminate();
+                const i = workers.indexOf(slot);
+                if (i >= 0) workers.splice(i, 1);
+                if (!terminated) release(spawn());
+            };
+            workers.push(slot);
+            return slot;
+        }
+
+        function release(slot) {
+            if (terminated) return;
+            const job = queue.shift();
+            if (job) dispatch(slot, job);
+            else idle.push(slot);
+        }
+
+        function dispatch(slot, job) {
+            slot.job = job;
+            slot.worker.postMessage({ id: job.id, task: job.task, payload: job.payload }, job.transfer);
+        }
+
+        if (!inline) {
+            for (let i = 0; i < size; i++) idle.push(spawn());
+        }
+
+        /**
+         * Queue a task on the next idle worker
+         * @param {string} task - 'mcPartial' | 'rasterTile' | 'call'
+         * @param {Object} payload
+         * @param {Object} [opts] - { transfer, group }
+         * @returns {Promise}
+         */
+        function run(task, payload, opts = {}) {
+            if (terminated) return Promise.reject(new Error('Worker pool terminated'));
+            if (inline) {
+                return new Promise(function (resolve) {
+                    setTimeout(function () { resolve(); }, 0);
+                }).then(function () { return runInline(task, payload); });
+            }
+            return new Promise(function (resolve, reject) {
+                const job = {
+                    id: nextJobId++,
+                    task: task,
+                    payload: payload,
+                    transfer: opts.transfer || [],
+                    group: opts.group || null,
+                    resolve: resolve,
+                    reject: reject
+                };
+                const slot = idle.pop();
+                if (slot) dispatch(slot, job);
+                else queue.push(job);
+            });
+        }
+
+        /**
+         * Call an exported GeotechnicalEngine function on a worker
+         * e.g. pool.call('sensitivityAnalysis', params)
+         */
+        function call(fn, ...args) {
+            return run('call', { fn: fn, args: args });
+        }
+
+        /**
+         * Drop queued (not yet started) jobs belonging to a group
+         */
+        function cancel(group) {
+            for (let i = queue.length - 1; i >= 0; i--) {
+                if (queue[i].group === group) {
+                    const job = queue.splice(i, 1)[0];
+                    job.reject(new Error('cancelled'));
+                }
+            }
+        }
+
+        /**
+         * Parallel Monte Carlo — the same value as
+         * GeotechnicalEngine.monteCarloSharded() (the worker count is
+         * pool.size, not part of the result)
+         *
+         * @param {Object} params - Mean values
+         * @param {number} iterations - Total (maximum) samples
+         * @param {Object} [options] - { seed, sampler, pfTolerance, minIterations, chunkSize }
+         * @returns {Promise<Object>}
+         */
+        function monteCarlo(params, iterations, options = {}) {
+            const E = GeotechnicalEngine;
+            const {
+                seed = E.MC_DEFAULT_SEED,
+                sampler = 'random',
+                pfTolerance = null,
+                minIterations = 200,
+                chunkSize = MC_CHUNK_SIZE
+            } = options;
+
+            const total = Math.max(2, Math.floor(iterations || 2000));
+            const nChunks = Math.ceil(total / chunkSize);
+            const group = {};
+            const partials = new Array(nChunks);
+            const acc = E.createMCAccumulator();
+            let merged = 0;
+            let finished = false;
+
+            return new Promise(function (resolve, reject) {
+                function finish(stoppedEarly) {
+                    finished = true;
+                    cancel(group);
+                    const result = E.summarizeMonteCarlo(acc, {
+                        seed: seed,
+                        sampler: partials[0] ? partials[0].sampler : sampler,
+                        stoppedEarly: stoppedEarly
+                    });
+                    result.shards = merged;
+                    resolve(result);
+                }
+
+                function onChunk(k, partial) {
+                    if (finished) return;
+                    partials[k] = partial;
+                    // Merge in chunk order so the result is independent of timing
+                    while (merged < nChunks && partials[merged]) {
+                        E.mergeMCAccumulators(acc, partials[merged].accumulator);
+                        partials[merged].accumulator = null;
+                        merged++;
+                        if (pfTolerance !== null && acc.n >= minIterations && merged < nChunks) {
+                            const ci = E.wilsonInterval(acc.failures, acc.n);
+                            if (ci.halfWidth * 100 <= pfTolerance) {
+                                finish(true);
+                                return;
+                            }
+                        }
+                    }
+                    if (merged === nChunks) finish(false);
+                }
+
+                for (let k = 0; k < nChunks; k++) {
+                    const count = Math.min(chunkSize, total - k * chunkSize);
+                    run('mcPartial', {
+                        params: params,
+                        iterations: count,
+                        options: { seed: seed, stream: k, sampler: sampler }
+                    }, { group: group }).then(function (partial) {
+                        onChunk(k, partial);
+                    }, function (err) {
+                        if (finished || err.message === 'cancelled') return;
+                        finished = true;
+                        cancel(group);
+                        reject(err);
+                    });
+                }
+            });
+        }
+
+        /**
+         * Parallel terrain stability over a DEM — same result as
+         * GeotechnicalEngine.terrainStability()
+         *
+         * @param {Object} grid - { data, nrows, ncols, cellSize }
+         * @param {Object} soil - SOIL_DATABASE entry
+         * @param {Object} [options] - terrainStabilityParams() options, plus tileRows
+         * @returns {Promise<Object>}
+         */
+        function terrainStability(grid, soil, options = {}) {
+            const E = GeotechnicalEngine;
+            const params = E.terrainStabilityParams(soil, options);
+            const tileRows = options.tileRows || E.RASTER_TILE_ROWS;
+            const raster = E.createStabilityRaster(grid.nrows, grid.ncols);
+
+            return call('specificCatchmentArea', grid.data, grid.nrows, grid.ncols, grid.cellSize)
+                .then(function (sca) {
+                    const jobs = [];
+                    for (let r0 = 0; r0 < grid.nrows; r0 += tileRows) {
+                        const tile = E.createRasterTile(grid, sca, r0, Math.min(grid.nrows, r0 + tileRows));
+                        jobs.push(run('rasterTile', { tile: tile, params: params }, {
+                            transfer: [tile.dem.buffer, tile.sca.buffer]
+                        }).then(function (result) {
+                            E.writeRasterTile(raster, result, r0);
+                        }));
+                    }
+                    raster.sca = sca;
+                    return Promise.all(jobs);
+                })
+                .then(function () {
+                    raster.summary = E.summarizeStabilityClasses(raster);
+                    raster.workers = inline ? 0 : workers.length;
+                    return raster;
+                });
+        }
+
+        function terminate() {
+            terminated = true;
+            queue.splice(0).forEach(function (job) { job.reject(new Error('Worker pool terminated')); });
+            workers.forEach(function (slot) {
+                slot.worker.terminate();
+                if (slot.job) slot.job.reject(new Error('Worker pool terminated'));
+            });
+            workers.length = 0;
+            idle.length = 0;
+        }
+
+        return {
+            get size() { return inline ? 0 : workers.length; },
+            inline: inline,
+            run,
+            call,
+            cancel,
+            monteCarlo,
+            terrainStability,
+            terminate
+        };
+    }
+
+    /**
+     * Lazily created pool shared across the app
+     */
+    function getShared() {
+        if (!sharedPool) sharedPool = create();
+        return sharedPool;
+    }
+
+    // ========================================================================
+    // PUBLIC API
+    // ========================================================================
+    return {
+        create,
+        getShared,
+        isSupported,
+        MC_CHUNK_SIZE
+    };
+})();
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = WorkerPool;
+}
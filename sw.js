@@ -15,10 +15,19 @@ const STATIC_ASSETS = [
     './js/app.js',
     './js/api-service.js',
     './js/geotechnical-engine.js',
+    './js/worker-pool.js',
+    './js/fos-surrogate.js',
+    './js/idb-store.js',
+    './js/fos-tables.js',
+    './js/engine-worker.js',
     './js/risk-classifier.js',
     './js/charts.js',
     './js/map-module.js',
     './js/mitigation-engine.js',
+    './js/sensor-stream.js',
+    './js/analysis-cache.js',
+    './js/analysis-pipeline.js',
+    './js/analysis-worker.js',
     './js/voice-system.js',
     './js/report-generator.js',
     './manifest.json'